@@ -0,0 +1,9 @@
+"""
+Performance benchmarks for MANTA.
+
+    python -m benchmarks run --out results.json          # Parameterized suite (see suite.py), results as JSON
+    python -m benchmarks compare base.json results.json  # Exit 1 if any case got slower than the threshold
+
+The bench_* modules are standalone comparisons against the legacy implementations
+(`python -m benchmarks.<name>`); the suite reuses their workloads.
+"""
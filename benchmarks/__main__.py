@@ -0,0 +1,94 @@
+"""
+Benchmark suite CLI.
+
+    python -m benchmarks run [--quick] [--group meso] [--match monte_carlo] [--out results.json] [--baseline base.json]
+    python -m benchmarks compare base.json results.json [--threshold 0.10]
+    python -m benchmarks list [--quick]
+
+`compare` (and `run --baseline`) exit with status 1 when a case got slower than the threshold allows.
+"""
+import argparse
+import sys
+from typing import List, Optional
+
+from benchmarks.suite import GROUPS, Report, CaseResult, compare, iter_cases, run_suite
+
+
+def _format_time(seconds: Optional[float]) -> str:
+    if seconds is None:
+        return "-"
+    for unit, scale in (("s", 1.0), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.3f} {unit}"
+    return f"{seconds / 1e-9:.1f} ns"
+
+
+def _print_result(result: CaseResult) -> None:
+    print(f"{result.name:<60} | {_format_time(result.seconds):>12} | {result.ops_per_sec:>14,.0f} ops/s", flush=True)
+
+
+def _print_comparison(baseline: Report, current: Report, threshold: float) -> int:
+    rows = compare(baseline, current, threshold)
+    print(f"\nBaseline: {baseline.meta.get('commit')} ({baseline.meta.get('timestamp')})  "
+          f"Current: {current.meta.get('commit')} ({current.meta.get('timestamp')})  threshold: {threshold:.0%}")
+    for key in ("python", "numpy", "pydantic", "machine"):
+        if baseline.meta.get(key) != current.meta.get(key):
+            print(f"  note: {key} differs ({baseline.meta.get(key)} -> {current.meta.get(key)})")
+
+    print(f"{'case':<60} | {'baseline':>12} | {'current':>12} | {'change':>8} | status")
+    for row in rows:
+        change = f"{row.ratio - 1.0:+.1%}" if row.ratio is not None else "-"
+        print(f"{row.name:<60} | {_format_time(row.baseline):>12} | {_format_time(row.current):>12} | {change:>8} | {row.status}")
+
+    regressions = [row for row in rows if row.status == "regression"]
+    print(f"\n{len(regressions)} regression(s) out of {len(rows)} case(s).")
+    return 1 if regressions else 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="MANTA performance benchmarks.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="Run the suite and record the results as JSON.")
+    run.add_argument("--group", action="append", choices=list(GROUPS), help="Only run this group (repeatable).")
+    run.add_argument("--match", help="Only run cases whose name contains this string.")
+    run.add_argument("--quick", action="store_true", help="Smaller workloads (for CI).")
+    run.add_argument("--repeats", type=int, default=5)
+    run.add_argument("--min-time", type=float, default=0.1, help="Minimum seconds per timed repeat.")
+    run.add_argument("--out", help="Write the results to this JSON file.")
+    run.add_argument("--baseline", help="Compare against this JSON file afterwards.")
+    run.add_argument("--threshold", type=float, default=0.10, help="Allowed slowdown (0.10 = 10%%).")
+
+    cmp = commands.add_parser("compare", help="Compare two result files; exit 1 on regressions.")
+    cmp.add_argument("baseline")
+    cmp.add_argument("current")
+    cmp.add_argument("--threshold", type=float, default=0.10, help="Allowed slowdown (0.10 = 10%%).")
+
+    lst = commands.add_parser("list", help="List the benchmark cases.")
+    lst.add_argument("--quick", action="store_true")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "list":
+        for case, _ in iter_cases(quick=args.quick):
+            print(case.name)
+        return 0
+
+    if args.command == "compare":
+        return _print_comparison(Report.load(args.baseline), Report.load(args.current), args.threshold)
+
+    print(f"{'case':<60} | {'best/call':>12} | {'throughput':>20}")
+    report = run_suite(
+        groups=args.group, quick=args.quick, match=args.match,
+        repeats=args.repeats, min_time=args.min_time, progress=_print_result,
+    )
+    if args.out:
+        report.save(args.out)
+        print(f"\nResults written to {args.out}")
+    if args.baseline:
+        return _print_comparison(Report.load(args.baseline), report, args.threshold)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
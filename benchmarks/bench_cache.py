@@ -0,0 +1,86 @@
+import math
+import time
+from manta.core.outcomes import OutcomeSpace, Issue
+from manta.core.cache import CachedUtility
+from manta.core.meso import generate_meso
+
+SPACE = OutcomeSpace(issues=[
+    Issue(name="price", type="continuous", min_value=50, max_value=150),
+    Issue(name="service", type="discrete", values=["standard", "premium", "enterprise"]),
+    Issue(name="duration", type="discrete", values=["1_year", "3_years"]),
+])
+SERVICE = {"standard": 0.0, "premium": 0.5, "enterprise": 1.0}
+STEPS = 20
+
+
+# --- 1. AN EXPENSIVE UTILITY (a stand-in for a pricing model or a simulation) ---
+
+class PricingModel:
+    def __init__(self, work: int = 200):
+        self.work = work
+        self.calls = 0
+
+    def __call__(self, outcome) -> float:
+        self.calls += 1
+        years = 3 if outcome["duration"] == "3_years" else 1
+        # Discounted cash flow over the contract, month by month
+        npv = sum(outcome["price"] / (1.004 ** m) for m in range(12 * years))
+        for _ in range(self.work):
+            npv = math.sqrt(npv * npv + 1e-9)
+        margin = (npv / (12 * years) - 50) / 100
+        return 0.7 * (1 - margin) + 0.3 * SERVICE[outcome["service"]]
+
+
+def negotiate(utility) -> int:
+    """An agent's loop: a MESO per step at a falling aspiration, and the opponent's offers re-scored."""
+    found = 0
+    history = []
+    for step in range(STEPS):
+        target = 0.9 - 0.02 * step
+        offers = generate_meso(utility, SPACE, target, tolerance=0.02, method="monte_carlo", max_attempts=2048, rng=step)
+        found += len(offers)
+        history.append({"price": 150.0 - 2.5 * step, "service": "premium", "duration": "3_years"})
+        for offer in history: # Re-scored against each new aspiration
+            utility(offer)
+    return found
+
+
+# --- 2. THE BENCHMARK ---
+
+def bench_negotiation() -> None:
+    print(f"\n=== Monte Carlo MESO + re-scoring, {STEPS} steps, expensive utility ===")
+    print(f"{'utility':>28} | {'ms':>8} | {'evaluations':>11} | {'hit rate':>8} | {'offers':>6}")
+    for label, resolution in (("uncached", None), ("cached, resolution=0.01", 0.01), ("cached, resolution=0.5", 0.5)):
+        model = PricingModel()
+        utility = model if resolution is None else CachedUtility(model, resolution=resolution, outcome_space=SPACE)
+        t0 = time.perf_counter()
+        found = negotiate(utility)
+        elapsed = time.perf_counter() - t0
+        hit_rate = f"{utility.cache_info().hit_rate:.0%}" if resolution is not None else "-"
+        print(f"{label:>28} | {elapsed * 1e3:>8.1f} | {model.calls:>11,} | {hit_rate:>8} | {found:>6}")
+
+
+def bench_overhead() -> None:
+    model = PricingModel()
+    cached = CachedUtility(model, outcome_space=SPACE)
+    offer = {"price": 99.5, "service": "premium", "duration": "3_years"}
+    n = 2_000
+    t0 = time.perf_counter()
+    for _ in range(n):
+        model(offer)
+    miss = (time.perf_counter() - t0) / n
+    cached(offer)
+    t0 = time.perf_counter()
+    for _ in range(n * 10):
+        cached(offer)
+    hit = (time.perf_counter() - t0) / (n * 10)
+    print(f"\nPer call: {miss * 1e6:.1f} us evaluated, {hit * 1e6:.2f} us from the cache")
+
+
+def main():
+    bench_negotiation()
+    bench_overhead()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+import asyncio
+import os
+import tempfile
+import time
+from manta.core.agent import BaseAgent, AgentState, FastAgentResult
+from manta.core.outcomes import OutcomeSpace, Issue
+from manta.negotiation.journal import NegotiationJournal
+from manta.negotiation.runner import Runner, NegotiationConfig
+
+SPACE = OutcomeSpace(issues=[
+    Issue(name="price", type="continuous", min_value=50, max_value=150),
+    Issue(name="service", type="discrete", values=["standard", "premium", "enterprise"]),
+    Issue(name="duration", type="discrete", values=["1_year", "3_years"]),
+])
+STEPS = 5_000
+
+
+# --- 1. A CHEAP AGENT (so the journal is what gets measured) ---
+
+class Haggler(BaseAgent):
+    def propose(self, state: AgentState) -> FastAgentResult:
+        return FastAgentResult(response="offer", proposal={"price": 50.0 + state.step % 100, "service": "premium", "duration": "3_years"})
+
+    def respond(self, state: AgentState) -> FastAgentResult:
+        return FastAgentResult(response="reject")
+
+
+def runner(steps: int = STEPS) -> Runner:
+    return Runner(
+        config=NegotiationConfig(max_steps=steps, outcome_space=SPACE, turbo=True),
+        agents=[Haggler(name="buyer"), Haggler(name="seller")],
+    )
+
+
+class StateDump:
+    """Persists the full NegotiationState as JSON after every step."""
+    def __init__(self, path: str):
+        self.path = path
+        self.bytes_written = 0
+
+    def on_step(self, state, record) -> None:
+        with open(self.path, "w") as f:
+            self.bytes_written += f.write(state.model_dump_json())
+
+
+# --- 2. THE BENCHMARK ---
+
+def bench_overhead(directory: str) -> None:
+    print(f"\n=== Journal cost ({STEPS} steps, 3 issues) ===")
+    print(f"{'persistence':>34} | {'us/step':>8} | {'bytes/step':>10} | {'file (KB)':>9}")
+
+    t0 = time.perf_counter()
+    runner().run_sync()
+    base = (time.perf_counter() - t0) / STEPS
+    print(f"{'none':>34} | {base * 1e6:>8.2f} | {'-':>10} | {'-':>9}")
+
+    # The alternative: dump the whole state (history included) after every step
+    dump = StateDump(os.path.join(directory, "state.json"))
+    dump_runner = runner(500)
+    dump_runner.observers.append(dump)
+    t0 = time.perf_counter()
+    dump_runner.run_sync()
+    elapsed = (time.perf_counter() - t0) / 500
+    print(f"{'model_dump_json every step (500)':>34} | {(elapsed - base) * 1e6:>8.2f} | {dump.bytes_written / 500:>10,.0f} | {os.path.getsize(dump.path) / 1024:>9,.1f}")
+
+    for label, options in (
+        ("journal, sync=none", {"sync": "none", "compact_every": None}),
+        ("journal, sync=flush", {"sync": "flush", "compact_every": None}),
+        ("journal, flush, compact_every=1000", {"sync": "flush", "compact_every": 1_000, "keep": 100}),
+        ("journal, sync=fsync (500)", {"sync": "fsync", "compact_every": None}),
+    ):
+        steps = 500 if options["sync"] == "fsync" else STEPS
+        path = os.path.join(directory, f"{label}.journal")
+        journal_runner = runner(steps)
+        journal = NegotiationJournal(path, **options)
+        journal.attach(journal_runner)
+        t0 = time.perf_counter()
+        journal_runner.run_sync()
+        elapsed = (time.perf_counter() - t0) / steps
+        journal.close()
+        size = os.path.getsize(path)
+        print(f"{label:>34} | {(elapsed - base) * 1e6:>8.2f} | {journal.bytes_written / steps:>10,.1f} | {size / 1024:>9,.1f}")
+
+
+def bench_recovery(directory: str) -> None:
+    path = os.path.join(directory, "recover.journal")
+    journal_runner = runner()
+    journal = NegotiationJournal(path, compact_every=None)
+    journal.attach(journal_runner)
+    journal_runner.run_sync()
+    journal.close()
+
+    t0 = time.perf_counter()
+    recovered = NegotiationJournal.recover(path, [Haggler(name="buyer"), Haggler(name="seller")], compact_every=None)
+    elapsed = time.perf_counter() - t0
+    assert list(recovered.state.history) == list(journal_runner.state.history)
+    print(f"\nrecover(): {elapsed * 1e3:.1f} ms for {STEPS} steps ({elapsed / STEPS * 1e6:.2f} us/step)")
+    for observer in recovered.observers:
+        observer.close()
+
+
+def main():
+    with tempfile.TemporaryDirectory() as directory:
+        bench_overhead(directory)
+        bench_recovery(directory)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,225 @@
+import itertools
+import random
+import time
+import numpy as np
+from manta.core.outcomes import OutcomeSpace, Issue
+from manta.core.preferences import (
+    LinearAdditiveUtility, ExponentialValueFunction, SigmoidValueFunction, GaussianValueFunction,
+    PiecewiseLinearValueFunction
+)
+from manta.core.meso import generate_meso, get_iso_index, select_diverse, embed_offers
+
+
+def build_scenario(n_issues: int, n_values: int, seed: int = 0):
+    """A price issue plus n_issues discrete issues with n_values levels each (random scores)."""
+    rng = np.random.default_rng(seed)
+    issues = [Issue(name="price", type="continuous", min_value=50.0, max_value=200.0)]
+    weights = {"price": 0.5}
+    for i in range(n_issues):
+        issues.append(Issue(name=f"issue_{i}", type="discrete", values=[f"v{v}" for v in range(n_values)]))
+        weights[f"issue_{i}"] = 0.5 / n_issues
+
+    space = OutcomeSpace(issues=issues)
+    utility = LinearAdditiveUtility(weights=weights, outcome_space=space)
+    utility.add_curve("price", weight=0.5, invert=True)
+    for i in range(n_issues):
+        scores = rng.random(n_values)
+        utility.add_discrete(f"issue_{i}", weights[f"issue_{i}"], {f"v{v}": float(s) for v, s in enumerate(scores)})
+    return space, utility
+
+
+def legacy_analytical_solve(utility, space, target, tolerance, max_offers):
+    """The original per-query scan: itertools.product plus two calculate() calls per combo."""
+    discrete = [(i.name, i.values) for i in space.issues if i.name != "price"]
+    price = space.get_issue("price")
+    weight = utility.weights["price"]
+    found = []
+    for combo in itertools.product(*(vals for _, vals in discrete)):
+        if len(found) >= max_offers:
+            break
+        partial = {name: combo[i] for i, (name, _) in enumerate(discrete)}
+        u_fixed = utility.calculate({**partial, "price": price.min_value}) - weight
+        v_required = (target - u_fixed) / weight
+        if v_required < 0 or v_required > 1:
+            continue
+        offer = {**partial, "price": price.min_value + (1.0 - v_required) * (price.max_value - price.min_value)}
+        if abs(utility.calculate(offer) - target) <= tolerance:
+            found.append(offer)
+    return found
+
+
+def legacy_monte_carlo(utility, space, target, tolerance, max_offers, max_attempts):
+    """The original sampler: one dict per sample, global random, list-scan dedupe."""
+    samplers = {}
+    for issue in space.issues:
+        if issue.type == "discrete":
+            samplers[issue.name] = lambda i=issue: random.choice(i.values)
+        else:
+            samplers[issue.name] = lambda i=issue: random.uniform(i.min_value, i.max_value)
+    found = []
+    for _ in range(max_attempts):
+        if len(found) >= max_offers:
+            break
+        candidate = {name: sampler() for name, sampler in samplers.items()}
+        if abs(utility(candidate) - target) <= tolerance and candidate not in found:
+            found.append(candidate)
+    return found
+
+
+def bench_monte_carlo():
+    print("\n=== Monte Carlo MESO: legacy loop vs batched sampler (5000 attempts, tight tolerance) ===")
+    print(f"{'combos':>9} | {'legacy (ms)':>11} | {'batched (ms)':>12} | {'speedup':>8}")
+    for n_issues, n_values in ((2, 5), (4, 10)):
+        space, utility = build_scenario(n_issues, n_values)
+        # A tolerance tight enough that the whole attempt budget is used
+        args = (utility, space, 0.7, 1e-6, 3)
+
+        random.seed(0)
+        t0 = time.perf_counter()
+        legacy_monte_carlo(*args, 5000)
+        t_legacy = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        generate_meso(*args, max_attempts=5000, method="monte_carlo", rng=0)
+        t_batched = time.perf_counter() - t0
+
+        print(f"{n_values ** n_issues:>9} | {t_legacy * 1e3:>11.2f} | {t_batched * 1e3:>12.2f} | {t_legacy / t_batched:>7.0f}x")
+
+
+def bench_continuous_issues():
+    """Spaces with several continuous issues: the old solver only handled 'price' (sampling was the way out)."""
+    print("\n=== Several continuous issues: Monte Carlo (tolerance 0.005) vs iso-hyperplane solver ===")
+    print(f"{'continuous':>10} | {'method':>12} | {'ms/query':>8} | {'offers':>6} | {'max |U - target|':>16}")
+    for n_continuous in (2, 4, 8):
+        space, utility = build_scenario(3, 5)
+        for i in range(1, n_continuous):
+            space.issues.append(Issue(name=f"x{i}", type="continuous", min_value=0.0, max_value=100.0))
+            utility.weights[f"x{i}"] = 0.2 / (n_continuous - 1)
+            utility.add_curve(f"x{i}", weight=0.2 / (n_continuous - 1), invert=i % 2 == 0)
+        utility.weights["price"] = 0.3
+        utility.add_curve("price", weight=0.3, invert=True)
+        targets = np.linspace(0.3, 0.8, 20)
+        for method, options in (("monte_carlo", {"max_attempts": 5000, "rng": 0}), ("analytical", {"rng": 0})):
+            kind = "monte_carlo" if method == "monte_carlo" else "analytical_solve"
+            generate_meso(utility, space, 0.5, tolerance=0.005, method=kind, **options) # Warm-up (index build)
+            found, error = 0, 0.0
+            t0 = time.perf_counter()
+            for target in targets:
+                offers = generate_meso(utility, space, float(target), tolerance=0.005, max_offers=3, method=kind, **options)
+                found += len(offers)
+                error = max([error] + [abs(utility(o) - target) for o in offers])
+            elapsed = (time.perf_counter() - t0) / len(targets)
+            print(f"{n_continuous:>10} | {method:>12} | {elapsed * 1e3:>8.3f} | {found:>6} | {error:>16.2e}")
+
+
+def min_spacing(offers, space) -> float:
+    points = embed_offers(offers, space)
+    gaps = np.sqrt(((points[:, None, :] - points[None, :, :]) ** 2).sum(axis=2))
+    return float(gaps[np.triu_indices(len(offers), k=1)].min())
+
+
+def bench_diversity():
+    print("\n=== MESO selection: first hits vs diverse (k=5, target 0.6) ===")
+    print(f"{'combos':>9} | {'selection':>16} | {'ms/query':>8} | {'min spacing':>11} | {'issues varied':>13}")
+    for n_issues, n_values in ((3, 5), (5, 10)):
+        space, utility = build_scenario(n_issues, n_values)
+        for label, options in (("first", {}), ("diverse, pool 64", {"selection": "diverse", "pool_size": 64}),
+                               ("diverse, pool 1k", {"selection": "diverse", "pool_size": 1024})):
+            generate_meso(utility, space, 0.6, max_offers=5, **options) # Warm-up (index build)
+            t0 = time.perf_counter()
+            for _ in range(20):
+                offers = generate_meso(utility, space, 0.6, tolerance=1e-6, max_offers=5, **options)
+            elapsed = (time.perf_counter() - t0) / 20
+            varied = sum(len({str(o[i.name]) for o in offers}) > 1 for i in space.issues)
+            print(f"{n_values ** n_issues:>9} | {label:>16} | {elapsed * 1e3:>8.3f} | {min_spacing(offers, space):>11.3f} | {varied:>13}")
+
+    print(f"\n{'candidates':>10} | {'select_diverse k=5 (ms)':>23} | {'k=20 (ms)':>9}")
+    space, utility = build_scenario(5, 10)
+    for n in (1_000, 10_000, 100_000):
+        offers = generate_meso(utility, space, 0.6, tolerance=1e-6, max_offers=n, selection="diverse", pool_size=n)
+        times = []
+        for k in (5, 20):
+            t0 = time.perf_counter()
+            select_diverse(offers, space, k)
+            times.append(time.perf_counter() - t0)
+        print(f"{len(offers):>10} | {times[0] * 1e3:>23.1f} | {times[1] * 1e3:>9.1f}")
+
+
+def bench_value_functions():
+    """Non-linear curves: scored in one vectorized pass and back-solved through their inverses."""
+    space, utility = build_scenario(3, 5)
+    curves = (ExponentialValueFunction(0, 100, rate=-2.0, invert=True), SigmoidValueFunction(50, -0.1),
+              GaussianValueFunction(30, 15), PiecewiseLinearValueFunction([(0, 0.0), (40, 0.8), (100, 1.0)]))
+    for i, curve in enumerate(curves):
+        space.issues.append(Issue(name=f"x{i}", type="continuous", min_value=0.0, max_value=100.0))
+        utility.weights[f"x{i}"] = 0.1
+        utility.add_value_function(f"x{i}", 0.1, curve)
+    utility.weights["price"] = 0.1
+    utility.add_curve("price", weight=0.1, invert=True)
+
+    rng = np.random.default_rng(0)
+    columns = [rng.uniform(50, 200, 20_000)] + [rng.integers(0, 5, 20_000) for _ in range(3)]
+    encoded = np.column_stack(columns + [rng.uniform(0, 100, 20_000) for _ in curves]).astype(np.float64)
+    outcomes = space.compile().decode_batch(encoded)
+    t0 = time.perf_counter()
+    for outcome in outcomes:
+        utility(outcome)
+    t_loop = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    utility.calculate_batch(encoded)
+    t_batch = time.perf_counter() - t0
+    print("\n=== Non-linear value functions (exponential, sigmoid, Gaussian, piecewise) ===")
+    print(f"Scoring 20,000 outcomes: {t_loop * 1e3:.1f} ms one by one, {t_batch * 1e3:.2f} ms batched "
+          f"({t_loop / t_batch:.0f}x)")
+
+    print(f"{'method':>12} | {'ms/query':>8} | {'offers':>6} | {'max |U - target|':>16}")
+    targets = np.linspace(0.3, 0.7, 20)
+    for method, options in (("monte_carlo", {"max_attempts": 5000, "rng": 0}), ("analytical", {"rng": 0})):
+        kind = "monte_carlo" if method == "monte_carlo" else "analytical_solve"
+        generate_meso(utility, space, 0.5, tolerance=0.005, method=kind, **options) # Warm-up (index build)
+        found, error = 0, 0.0
+        t0 = time.perf_counter()
+        for target in targets:
+            offers = generate_meso(utility, space, float(target), tolerance=0.005, max_offers=3, method=kind, **options)
+            found += len(offers)
+            error = max([error] + [abs(utility(o) - target) for o in offers])
+        elapsed = (time.perf_counter() - t0) / len(targets)
+        print(f"{method:>12} | {elapsed * 1e3:>8.3f} | {found:>6} | {error:>16.2e}")
+
+
+def main():
+    targets = np.linspace(0.3, 0.95, 20)
+    print("\n=== Analytical MESO: per-query product scan vs IsoUtilityIndex ===")
+    print(f"{'combos':>9} | {'build (ms)':>10} | {'scan/offer (ms)':>15} | {'index/offer (ms)':>16} | {'speedup':>8}")
+
+    for n_issues, n_values in ((2, 5), (3, 10), (4, 10), (5, 10), (6, 10)):
+        space, utility = build_scenario(n_issues, n_values)
+
+        t0 = time.perf_counter()
+        index = get_iso_index(utility, space)
+        t_build = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        for target in targets:
+            generate_meso(utility, space, float(target), tolerance=0.01, max_offers=3)
+        t_index = (time.perf_counter() - t0) / len(targets)
+
+        if len(index) <= 100_000:
+            t0 = time.perf_counter()
+            for target in targets:
+                legacy_analytical_solve(utility, space, float(target), 0.01, 3)
+            t_scan = (time.perf_counter() - t0) / len(targets)
+            scan_col, speedup_col = f"{t_scan * 1e3:.3f}", f"{t_scan / t_index:.0f}x"
+        else:
+            scan_col, speedup_col = "-", "-"
+
+        print(f"{len(index):>9} | {t_build * 1e3:>10.2f} | {scan_col:>15} | {t_index * 1e3:>16.3f} | {speedup_col:>8}")
+
+    bench_monte_carlo()
+    bench_continuous_issues()
+    bench_diversity()
+    bench_value_functions()
+
+
+if __name__ == "__main__":
+    main()
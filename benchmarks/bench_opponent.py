@@ -0,0 +1,77 @@
+import asyncio
+import statistics
+import time
+from manta.core.outcomes import OutcomeSpace, Issue
+from manta.core.opponent import FrequencyOpponentModel
+from manta.agents.standard import StandardAgent
+from manta.negotiation.runner import Runner, NegotiationConfig
+
+# --- 1. THE DEMO SCENARIOS (demo_manta.py's world and agents, plus the tournament grid) ---
+
+SPACE = OutcomeSpace(issues=[
+    Issue(name="price", type="continuous", min_value=50, max_value=150),
+    Issue(name="service", type="discrete", values=["standard", "premium", "enterprise"]),
+    Issue(name="duration", type="discrete", values=["1_year", "3_years"])
+])
+BUYER_WEIGHTS = {"price": 0.6, "service": 0.3, "duration": 0.1}
+SELLER_WEIGHTS = {"price": 0.7, "service": 0.2, "duration": 0.1}
+MAX_STEPS = 10
+
+DEMO = (
+    {"name": "Acme Corp Bot", "personality": "linear", "reservation_val": 0.5},
+    {"name": "SaaS Vendor Bot", "personality": "conceder", "reservation_val": 0.5},
+)
+GRID = [
+    {"personality": p, "aspiration_start": a, "reservation_val": r}
+    for p in ("boulware", "linear", "conceder")
+    for a in (0.85, 0.95)
+    for r in (0.3, 0.5, 0.7)
+]
+
+
+def negotiate(buyer: dict, seller: dict, opponent_model: bool):
+    agents = [
+        StandardAgent(role="buyer", weights=BUYER_WEIGHTS, outcome_space=SPACE, opponent_model=opponent_model, **{"name": "buyer", **buyer}),
+        StandardAgent(role="seller", weights=SELLER_WEIGHTS, outcome_space=SPACE, opponent_model=opponent_model, **{"name": "seller", **seller}),
+    ]
+    runner = Runner(config=NegotiationConfig(max_steps=MAX_STEPS, outcome_space=SPACE, turbo=True), agents=agents)
+    return asyncio.run(runner.run())
+
+
+def scenario_stats(pairs, opponent_model: bool):
+    """Steps to agreement, with timed-out negotiations counted as max_steps."""
+    states = [negotiate(b, s, opponent_model) for b, s in pairs]
+    steps = [st.step if st.status == "success" else MAX_STEPS for st in states]
+    agreements = sum(st.status == "success" for st in states)
+    return statistics.mean(steps), agreements / len(states)
+
+
+# --- 2. THE BENCHMARK ---
+
+def bench_update_cost():
+    model = FrequencyOpponentModel(SPACE)
+    offers = [{"price": 50.0 + i % 100, "service": "premium", "duration": "3_years"} for i in range(10_000)]
+    t0 = time.perf_counter()
+    for offer in offers:
+        model.update(offer)
+    print(f"\nFrequencyOpponentModel.update: {(time.perf_counter() - t0) / len(offers) * 1e6:.2f} us per offer ({len(SPACE.issues)} issues)")
+
+
+def main():
+    scenarios = [
+        ("demo_manta.py pair", [DEMO]),
+        (f"tournament grid ({len(GRID)}x{len(GRID)})", [(b, s) for b in GRID for s in GRID]),
+    ]
+    print("\n=== Steps to agreement: StandardAgent with vs without the opponent model ===")
+    print(f"{'scenario':>24} | {'steps (off)':>11} | {'steps (on)':>10} | {'reduction':>9} | {'agree (off)':>11} | {'agree (on)':>10}")
+    for label, pairs in scenarios:
+        steps_off, agree_off = scenario_stats(pairs, opponent_model=False)
+        steps_on, agree_on = scenario_stats(pairs, opponent_model=True)
+        reduction = 1.0 - steps_on / steps_off if steps_off else 0.0
+        print(f"{label:>24} | {steps_off:>11.2f} | {steps_on:>10.2f} | {reduction:>8.0%} | {agree_off:>10.0%} | {agree_on:>9.0%}")
+
+    bench_update_cost()
+
+
+if __name__ == "__main__":
+    main()
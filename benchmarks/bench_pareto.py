@@ -0,0 +1,138 @@
+import time
+import tracemalloc
+import numpy as np
+from manta.core.outcomes import OutcomeSpace, Issue
+from manta.core.preferences import LinearAdditiveUtility
+from manta.core.pareto import (
+    find_pareto_frontier, is_dominated, pareto_mask, space_pareto_frontier, nash_point, kalai_smorodinsky_point
+)
+
+# The legacy greedy filter is O(n * |frontier|) in pure Python, so only run it up to this size
+REFERENCE_MAX_N = 20_000
+
+
+def reference_frontier(utilities):
+    """The original implementation: descending social welfare, then is_dominated() against the kept points."""
+    ranked = sorted(enumerate(utilities), key=lambda x: sum(x[1]), reverse=True)
+    frontier_indices, frontier_utils = [], []
+    for idx, utils in ranked:
+        if not is_dominated(utils, frontier_utils):
+            frontier_indices.append(idx)
+            frontier_utils.append(utils)
+    return sorted(frontier_indices)
+
+
+def workload(n: int, k: int, kind: str, seed: int = 0) -> np.ndarray:
+    """'independent' = uniform utilities; 'conflict' = agents pull in opposite directions (large frontiers)."""
+    rng = np.random.default_rng(seed)
+    utils = rng.random((n, k))
+    if kind == "conflict":
+        # Push points towards the simplex sum(u) = 1, like zero-sum price splits
+        utils = utils / utils.sum(axis=1, keepdims=True) + rng.normal(0.0, 0.01, size=(n, 1))
+    return utils
+
+
+def main():
+    print("\n=== Pareto frontier: legacy greedy filter vs frontier engine ===")
+    print(f"{'k':>2} | {'n':>9} | {'workload':>11} | {'|F|':>7} | {'legacy (s)':>11} | {'engine (s)':>11} | {'speedup':>8}")
+
+    for k in (2, 3, 4):
+        for n in (1_000, 10_000, 100_000, 1_000_000):
+            for kind in ("independent", "conflict"):
+                if kind == "conflict" and k > 2 and n > 100_000:
+                    continue # Frontier is a large fraction of n; too slow for a quick run
+                utils = workload(n, k, kind)
+
+                t0 = time.perf_counter()
+                frontier = find_pareto_frontier(None, utils)
+                t_engine = time.perf_counter() - t0
+
+                legacy_col, speedup_col = "-", "-"
+                if n <= REFERENCE_MAX_N:
+                    as_tuples = [tuple(row) for row in utils.tolist()]
+                    t0 = time.perf_counter()
+                    expected = reference_frontier(as_tuples)
+                    t_legacy = time.perf_counter() - t0
+                    assert expected == frontier, "Frontier engine diverged from the reference"
+                    legacy_col, speedup_col = f"{t_legacy:.4f}", f"{t_legacy / t_engine:.1f}x"
+
+                print(f"{k:>2} | {n:>9} | {kind:>11} | {len(frontier):>7} | {legacy_col:>11} | {t_engine:>11.4f} | {speedup_col:>8}")
+
+    bench_space_frontier()
+    bench_bargaining()
+
+
+
+def space_utilities(space):
+    buyer = LinearAdditiveUtility(weights={"price": 0.5, "service": 0.2, "duration": 0.1, "support": 0.2}, outcome_space=space)
+    buyer.add_curve("price", 0.5, invert=True)
+    buyer.add_discrete("service", 0.2, {"standard": 0.0, "premium": 0.6, "enterprise": 1.0})
+    buyer.add_discrete("duration", 0.1, {"1_year": 1.0, "3_years": 0.0})
+    buyer.add_discrete("support", 0.2, {f"tier{i}": i / 4 for i in range(5)})
+    seller = LinearAdditiveUtility(weights={"price": 0.7, "service": 0.1, "duration": 0.1, "support": 0.1}, outcome_space=space)
+    seller.add_curve("price", 0.7)
+    seller.add_discrete("service", 0.1, {"standard": 1.0, "premium": 0.5, "enterprise": 0.0})
+    seller.add_discrete("duration", 0.1, {"1_year": 0.0, "3_years": 1.0})
+    seller.add_discrete("support", 0.1, {f"tier{i}": 1 - i / 4 for i in range(5)})
+    return [buyer, seller]
+
+
+SPACE = OutcomeSpace(issues=[
+    Issue(name="price", type="continuous", min_value=50, max_value=150),
+    Issue(name="service", type="discrete", values=["standard", "premium", "enterprise"]),
+    Issue(name="duration", type="discrete", values=["1_year", "3_years"]),
+    Issue(name="support", type="discrete", values=[f"tier{i}" for i in range(5)]),
+])
+
+
+def bench_space_frontier():
+    """Frontier of a whole space: materialize every outcome vs stream it in chunks."""
+    space = SPACE
+    utilities = space_utilities(space)
+    print("\n=== Frontier of a whole outcome space (price discretized) ===")
+    print(f"{'resolution':>10} | {'outcomes':>10} | {'method':>18} | {'|F|':>7} | {'time (s)':>8} | {'peak MB':>8}")
+    for resolution in (0.01, 0.001):
+        n = space.cardinality(resolution)
+        for method in ("materialized", "streamed (65536)"):
+            tracemalloc.start()
+            t0 = time.perf_counter()
+            if method == "materialized":
+                rows = np.vstack(list(space.enumerate(resolution)))
+                utils = np.column_stack([u.calculate_batch(rows) for u in utilities])
+                frontier = rows[pareto_mask(utils)]
+            else:
+                frontier, _ = space_pareto_frontier(space, utilities, resolution)
+            elapsed = time.perf_counter() - t0
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            print(f"{resolution:>10} | {n:>10,} | {method:>18} | {len(frontier):>7} | {elapsed:>8.2f} | {peak / 2**20:>8.1f}")
+
+
+
+def bench_bargaining():
+    """Nash point: score the discretized space + find_pareto_frontier, vs the analytic solver."""
+    utilities = space_utilities(SPACE)
+    print("\n=== Nash / Kalai-Smorodinsky points (2 linear additive agents) ===")
+    print(f"{'method':>32} | {'ms':>9} | {'Nash product':>12} | price")
+    for resolution in (0.1, 0.01):
+        t0 = time.perf_counter()
+        rows = np.vstack(list(SPACE.enumerate(resolution)))
+        utils = np.column_stack([u.calculate_batch(rows) for u in utilities])
+        frontier = find_pareto_frontier(None, utils)
+        best = frontier[int(np.argmax(utils[frontier].prod(axis=1)))]
+        elapsed = time.perf_counter() - t0
+        label = f"brute force, resolution={resolution}"
+        print(f"{label:>32} | {elapsed * 1e3:>9.1f} | {utils[best].prod():>12.6f} | {rows[best, 0]:.2f}")
+
+    for label, solve in (("nash_point (analytic)", nash_point), ("kalai_smorodinsky_point", kalai_smorodinsky_point)):
+        solve(utilities, SPACE) # Warm-up
+        t0 = time.perf_counter()
+        for _ in range(100):
+            point = solve(utilities, SPACE)
+        elapsed = (time.perf_counter() - t0) / 100
+        product = point.utilities[0] * point.utilities[1]
+        print(f"{label:>32} | {elapsed * 1e3:>9.2f} | {product:>12.6f} | {point.outcome['price']:.2f}")
+
+
+if __name__ == "__main__":
+    main()
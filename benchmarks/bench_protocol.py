@@ -0,0 +1,65 @@
+import asyncio
+import time
+from manta.core.agent import BaseAgent, AgentState, AgentResult
+from manta.core.outcomes import OutcomeSpace, Issue
+from manta.core.protocol import MultilateralProtocol, broadcast
+from manta.negotiation.runner import Runner, NegotiationConfig
+
+SPACE = OutcomeSpace(issues=[Issue(name="price", type="continuous", min_value=0, max_value=200)])
+LATENCY = 0.005 # Seconds per respond() (e.g. a remote agent or an LLM call)
+
+
+# --- 1. AN I/O-BOUND AGENT ---
+
+class SlowRejecter(BaseAgent):
+    async def propose(self, state: AgentState) -> AgentResult:
+        return AgentResult(response="offer", proposal={"price": 100.0})
+
+    async def respond(self, state: AgentState) -> AgentResult:
+        await asyncio.sleep(LATENCY)
+        return AgentResult(response="reject")
+
+
+async def sequential(responders, states):
+    """The same fan-out awaited one responder at a time (what a plain loop would do)."""
+    return [await agent.respond(state) for agent, state in zip(responders, states)]
+
+
+# --- 2. THE BENCHMARK ---
+
+def round_latency(n_agents: int, fan_out, rounds: int = 20) -> float:
+    responders = [SlowRejecter(name=f"agent_{i}") for i in range(n_agents - 1)]
+    states = [AgentState(step=0, time=0.0, relative_time=0.0, current_offer={"price": 100.0})] * len(responders)
+
+    async def play():
+        for _ in range(rounds):
+            await fan_out(responders, states)
+
+    t0 = time.perf_counter()
+    asyncio.run(play())
+    return (time.perf_counter() - t0) / rounds
+
+
+def runner_rounds_per_second(n_agents: int, rounds: int = 50) -> float:
+    runner = Runner(
+        config=NegotiationConfig(max_steps=rounds, outcome_space=SPACE, turbo=True, protocol=MultilateralProtocol()),
+        agents=[SlowRejecter(name=f"agent_{i}") for i in range(n_agents)],
+    )
+    t0 = time.perf_counter()
+    state = asyncio.run(runner.run())
+    assert state.step == rounds
+    return rounds / (time.perf_counter() - t0)
+
+
+def main():
+    print(f"\n=== Multilateral round latency (every respond() takes {LATENCY * 1e3:.0f} ms) ===")
+    print(f"{'agents':>7} | {'sequential':>12} | {'gather':>12} | {'speedup':>8} | {'runner rounds/s':>16}")
+    for n_agents in (3, 5, 9, 17):
+        seq = round_latency(n_agents, sequential)
+        par = round_latency(n_agents, broadcast)
+        rate = runner_rounds_per_second(n_agents)
+        print(f"{n_agents:>7} | {seq * 1e3:>9.2f} ms | {par * 1e3:>9.2f} ms | {seq / par:>7.1f}x | {rate:>16,.0f}")
+
+
+if __name__ == "__main__":
+    main()
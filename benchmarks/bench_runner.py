@@ -0,0 +1,199 @@
+import asyncio
+import time
+import tracemalloc
+from typing import Any, List, Optional
+from pydantic import BaseModel, Field
+from manta.core.agent import BaseAgent, AgentState, AgentResult, FastAgentState, FastAgentResult
+from manta.negotiation.history import NegotiationHistory
+from manta.core.outcomes import OutcomeSpace, Issue
+from manta.negotiation.runner import Runner, NegotiationConfig
+
+SPACE = OutcomeSpace(issues=[Issue(name="price", type="continuous", min_value=0, max_value=200)])
+
+
+# --- 1. MINIMAL AGENTS (so the runner itself is what gets measured) ---
+
+class AsyncRejecter(BaseAgent):
+    async def propose(self, state: AgentState) -> AgentResult:
+        return AgentResult(response="offer", proposal={"price": 100.0})
+
+    async def respond(self, state: AgentState) -> AgentResult:
+        return AgentResult(response="reject")
+
+
+class SyncRejecter(BaseAgent):
+    def propose(self, state: AgentState) -> AgentResult:
+        return AgentResult(response="offer", proposal={"price": 100.0})
+
+    def respond(self, state: AgentState) -> AgentResult:
+        return AgentResult(response="reject")
+
+
+def steps_per_second(agent_cls, steps: int, **config) -> float:
+    runner = Runner(
+        config=NegotiationConfig(max_steps=steps, outcome_space=SPACE, **config),
+        agents=[agent_cls(name="A"), agent_cls(name="B")],
+    )
+    t0 = time.perf_counter()
+    state = asyncio.run(runner.run())
+    elapsed = time.perf_counter() - t0
+    assert state.step == steps
+    return steps / elapsed
+
+
+# --- 2. HISTORY COST (per-step state build and memory vs history length) ---
+
+class LegacyAgentState(BaseModel):
+    """AgentState as it was: history validated (and copied) as a List on every construction."""
+    step: int
+    time: float
+    relative_time: float
+    current_offer: Optional[Any] = None
+    history: List[Any] = Field(default_factory=list)
+
+
+def _record(step: int) -> dict:
+    return {"step": step, "proposer": "A", "proposal": [{"price": 100.0 + step}], "responder": "B", "response": "reject"}
+
+
+def _state_build_us(make_state, repeat: int = 200) -> float:
+    t0 = time.perf_counter()
+    for _ in range(repeat):
+        make_state()
+    return (time.perf_counter() - t0) / repeat * 1e6
+
+
+def _memory_kb(build) -> float:
+    tracemalloc.start()
+    kept = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del kept
+    return size / 1024
+
+
+def bench_history():
+    print("\n=== History: AgentState build cost and memory vs negotiation length ===")
+    print(f"{'records':>8} | {'list copy (us)':>14} | {'view (us)':>9} | {'list (KB)':>9} | {'columnar (KB)':>13} | {'ring 256 (KB)':>13}")
+    for n in (100, 1_000, 10_000):
+        records = [_record(i) for i in range(n)]
+        history = NegotiationHistory(outcome_space=SPACE)
+        for r in records:
+            history.append(r)
+
+        t_list = _state_build_us(lambda: LegacyAgentState(step=n, time=0.0, relative_time=0.0, history=records))
+        t_view = _state_build_us(lambda: AgentState(step=n, time=0.0, relative_time=0.0, history=history.view()))
+
+        def fill(capacity=None):
+            log = NegotiationHistory(capacity=capacity, outcome_space=SPACE)
+            for i in range(n):
+                log.append(_record(i))
+            return log
+
+        mem_list = _memory_kb(lambda: [_record(i) for i in range(n)])
+        mem_columnar = _memory_kb(fill)
+        mem_ring = _memory_kb(lambda: fill(256))
+        print(f"{n:>8} | {t_list:>14.1f} | {t_view:>9.1f} | {mem_list:>9.0f} | {mem_columnar:>13.0f} | {mem_ring:>13.0f}")
+
+
+# --- 3. PER-STEP ALLOCATION COST (validated models vs model_construct vs __slots__ stand-ins) ---
+
+class FastSyncRejecter(BaseAgent):
+    def propose(self, state: AgentState) -> AgentResult:
+        return FastAgentResult(response="offer", proposal={"price": 100.0})
+
+    def respond(self, state: AgentState) -> AgentResult:
+        return FastAgentResult(response="reject")
+
+
+def _alloc_us(build, number: int = 20_000, repeat: int = 5) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        for _ in range(number):
+            build()
+        best = min(best, time.perf_counter() - t0)
+    return best / number * 1e6
+
+
+def bench_allocation():
+    print("\n=== Per-step allocation cost (us per object, best of 5) ===")
+    view = NegotiationHistory(outcome_space=SPACE).view()
+    offer = [{"price": 100.0}]
+    rows = [
+        ("AgentState",
+         lambda: AgentState(step=1, time=0.0, relative_time=0.5, current_offer=offer, history=view),
+         lambda: AgentState.model_construct(step=1, time=0.0, relative_time=0.5, current_offer=offer, history=view),
+         lambda: FastAgentState(step=1, time=0.0, relative_time=0.5, current_offer=offer, history=view)),
+        ("AgentResult",
+         lambda: AgentResult(response="offer", proposal=offer),
+         lambda: AgentResult.model_construct(response="offer", proposal=offer),
+         lambda: FastAgentResult(response="offer", proposal=offer)),
+    ]
+    print(f"{'model':>12} | {'validated':>9} | {'model_construct':>15} | {'__slots__':>9}")
+    for label, validated, construct, fast in rows:
+        print(f"{label:>12} | {_alloc_us(validated):>9.2f} | {_alloc_us(construct):>15.2f} | {_alloc_us(fast):>9.2f}")
+
+    # Whole loop (turbo, sync agents): strict validates both results of every step
+    print(f"\n{'turbo sync loop':>30} | {'steps/s':>12}")
+    for label, agent_cls, strict in (
+        ("AgentResult, strict", SyncRejecter, True),
+        ("AgentResult", SyncRejecter, False),
+        ("FastAgentResult", FastSyncRejecter, False),
+    ):
+        rate = steps_per_second(agent_cls, 20_000, turbo=True, strict=strict)
+        print(f"{label:>30} | {rate:>12,.0f}")
+
+
+# --- 4. THE BENCHMARK ---
+
+class StallingRejecter(AsyncRejecter):
+    """Answers in ~1 ms, but every 10th respond() stalls for 200 ms (a hung backend call)."""
+    async def respond(self, state: AgentState) -> AgentResult:
+        await asyncio.sleep(0.2 if state.step % 10 == 9 else 0.001)
+        return AgentResult(response="reject")
+
+
+def bench_tail_latency(steps: int = 60):
+    print("\n=== Step latency with a stalling responder (every 10th respond() takes 200 ms) ===")
+    print(f"{'config':>32} | {'p50':>9} | {'p99':>9} | {'max':>9} | {'wall':>8}")
+    for label, config in (
+        ("no deadline", {}),
+        ("call_timeout=20ms, skip", {"call_timeout": 0.02, "timeout_policy": "skip"}),
+        ("call_timeout=20ms, default", {"call_timeout": 0.02, "timeout_policy": "default"}),
+    ):
+        runner = Runner(
+            config=NegotiationConfig(max_steps=steps, outcome_space=SPACE, turbo=True, metrics=True, **config),
+            agents=[StallingRejecter(name="A"), StallingRejecter(name="B")],
+        )
+        t0 = time.perf_counter()
+        state = asyncio.run(runner.run())
+        wall = time.perf_counter() - t0
+        # Timed-out steps never reach the step histogram: measure them from the wall time instead
+        step = state.metrics["histograms"]["step"]
+        worst = max(step["max"], (wall - step["total"]) / max(steps - step["count"], 1))
+        print(f"{label:>32} | {step['p50'] * 1e3:>6.1f} ms | {step['p99'] * 1e3:>6.1f} ms | {worst * 1e3:>6.1f} ms | {wall:>6.2f} s")
+
+
+def main():
+    print("\n=== Runner throughput (steps/sec, both agents always reject) ===")
+    modes = [
+        ("default loop (sleep 0.01)", AsyncRejecter, 200, {}),
+        ("turbo, async agents", AsyncRejecter, 20_000, {"turbo": True}),
+        ("turbo, async, yield_every=1", AsyncRejecter, 20_000, {"turbo": True, "yield_every": 1}),
+        ("turbo, async, call_timeout", AsyncRejecter, 20_000, {"turbo": True, "call_timeout": 1.0}),
+        ("turbo, sync agents", SyncRejecter, 20_000, {"turbo": True}),
+    ]
+    baseline = None
+    for label, agent_cls, steps, config in modes:
+        rate = steps_per_second(agent_cls, steps, **config)
+        baseline = baseline or rate
+        print(f"{label:>30} | {rate:>12,.0f} steps/s | {rate / baseline:>8.1f}x")
+
+    bench_history()
+    bench_allocation()
+    bench_tail_latency()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+Load test for manta.api.server: sessions per second and turn latency under concurrency.
+
+    python -m benchmarks.bench_server [--clients 200] [--sessions 5] [--local 2000]
+"""
+import argparse
+import asyncio
+import time
+from manta.api.server import NegotiationServer, SessionConfig
+from manta.api.client import NegotiationClient
+from manta.utils.logging import LatencyHistogram
+
+# --- 1. THE WORKLOAD (demo_manta.py's world: a remote buyer against a StandardAgent seller) ---
+
+SPACE = {"issues": [
+    {"name": "price", "type": "continuous", "min_value": 50, "max_value": 150},
+    {"name": "service", "type": "discrete", "values": ["standard", "premium", "enterprise"]},
+    {"name": "duration", "type": "discrete", "values": ["1_year", "3_years"]},
+]}
+SELLER = {"name": "seller", "params": {
+    "role": "seller", "personality": "boulware", "reservation_val": 0.3,
+    "weights": {"price": 0.7, "service": 0.2, "duration": 0.1},
+}}
+BUYER = {"name": "buyer", "params": {
+    "role": "buyer", "personality": "conceder", "reservation_val": 0.3,
+    "weights": {"price": 0.6, "service": 0.3, "duration": 0.1},
+}}
+REMOTE_SESSION = {"outcome_space": SPACE, "max_steps": 10, "agents": [{"name": "me", "type": "remote"}, SELLER]}
+LOCAL_SESSION = {"outcome_space": SPACE, "max_steps": 10, "agents": [BUYER, SELLER]}
+
+
+async def play(client: NegotiationClient, latency: LatencyHistogram) -> str:
+    """Plays one session as the remote buyer (raising its price offer each turn)."""
+    session = await client.create_session(REMOTE_SESSION)
+    turn = await client.turn(session["id"], wait=5.0)
+    while turn is not None:
+        if turn["phase"] == "propose":
+            await client.act(session["id"], "offer", {"price": 60 + 10 * turn["step"], "service": "standard", "duration": "1_year"})
+        else:
+            await client.act(session["id"], "accept" if turn["step"] >= 4 else "reject")
+        t0 = time.perf_counter()
+        turn = await client.turn(session["id"], wait=5.0)
+        if turn is not None:
+            latency.record(time.perf_counter() - t0) # act -> next turn (server + seller's move)
+    return (await client.session(session["id"]))["negotiation"]
+
+
+# --- 2. THE BENCHMARKS ---
+
+async def bench_local(n_sessions: int) -> None:
+    """Server-side agents only: how fast the server creates and runs sessions."""
+    server = NegotiationServer(max_sessions=n_sessions)
+    config = SessionConfig.model_validate(LOCAL_SESSION)
+    t0 = time.perf_counter()
+    sessions = [server.create_session(config) for _ in range(n_sessions)]
+    await asyncio.gather(*(s.task for s in sessions))
+    elapsed = time.perf_counter() - t0
+    statuses = [s.runner.state.status for s in sessions]
+    print(f"{'in-process (2 StandardAgents)':>32} | {n_sessions:>8} | {n_sessions / elapsed:>10,.0f} | "
+          f"{statuses.count('success') / n_sessions:>7.0%} | {'-':>9} | {'-':>9}")
+    await server.close()
+
+
+async def bench_http(n_clients: int, sessions_per_client: int) -> None:
+    """Remote players over HTTP: each client plays its sessions one after the other."""
+    server = NegotiationServer()
+    await server.serve(port=0)
+    latency = LatencyHistogram()
+
+    async def client_loop():
+        async with NegotiationClient(port=server.port) as client:
+            return [await play(client, latency) for _ in range(sessions_per_client)]
+
+    t0 = time.perf_counter()
+    results = [status for statuses in await asyncio.gather(*(client_loop() for _ in range(n_clients))) for status in statuses]
+    elapsed = time.perf_counter() - t0
+    stats = latency.snapshot()
+    print(f"{f'HTTP, {n_clients} concurrent clients':>32} | {len(results):>8} | {len(results) / elapsed:>10,.0f} | "
+          f"{results.count('success') / len(results):>7.0%} | {stats['p50'] * 1e3:>6.2f} ms | {stats['p99'] * 1e3:>6.2f} ms")
+    await server.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--clients", type=int, default=200, help="Concurrent HTTP clients.")
+    parser.add_argument("--sessions", type=int, default=5, help="Sessions played by each client.")
+    parser.add_argument("--local", type=int, default=2000, help="In-process sessions.")
+    args = parser.parse_args()
+
+    print("\n=== Negotiation server load test ===")
+    print(f"{'mode':>32} | {'sessions':>8} | {'sessions/s':>10} | {'success':>7} | {'p50 turn':>9} | {'p99 turn':>9}")
+    asyncio.run(bench_local(args.local))
+    for clients in sorted({max(1, args.clients // 10), args.clients}):
+        asyncio.run(bench_http(clients, args.sessions))
+
+
+if __name__ == "__main__":
+    main()
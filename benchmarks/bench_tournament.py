@@ -0,0 +1,49 @@
+import os
+import time
+from manta.core.outcomes import OutcomeSpace, Issue
+from manta.negotiation.tournament import Tournament
+
+SPACE = OutcomeSpace(issues=[
+    Issue(name="price", type="continuous", min_value=50, max_value=150),
+    Issue(name="service", type="discrete", values=["standard", "premium", "enterprise"]),
+    Issue(name="duration", type="discrete", values=["1_year", "3_years"])
+])
+
+
+def config_grid(role: str, weights: dict):
+    """Every personality x aspiration x reservation combination (like demo_manta.py's configs)."""
+    return [
+        {"weights": weights, "personality": p, "aspiration_start": a, "reservation_val": r}
+        for p in ("boulware", "linear", "conceder")
+        for a in (0.85, 0.95)
+        for r in (0.3, 0.5, 0.7)
+    ]
+
+
+def main():
+    buyers = config_grid("buyer", {"price": 0.6, "service": 0.3, "duration": 0.1})
+    sellers = config_grid("seller", {"price": 0.7, "service": 0.2, "duration": 0.1})
+    repetitions = 4
+    n_matches = len(buyers) * len(sellers) * repetitions
+
+    cores = os.cpu_count() or 1
+    print(f"\n=== Tournament: {len(buyers)} buyers x {len(sellers)} sellers x {repetitions} reps = {n_matches} matches ({cores} cores) ===")
+    print(f"{'workers':>8} | {'matches/s':>10} | {'speedup':>8} | {'efficiency':>10} | {'agreements':>10}")
+
+    baseline = None
+    for workers in sorted({1, 2, 4, cores}):
+        tournament = Tournament(
+            buyer_configs=buyers, seller_configs=sellers, outcome_space=SPACE,
+            repetitions=repetitions, workers=workers if workers > 1 else 0,
+        )
+        t0 = time.perf_counter()
+        summary = tournament.run()
+        rate = n_matches / (time.perf_counter() - t0)
+
+        baseline = baseline or rate
+        speedup = rate / baseline
+        print(f"{workers:>8} | {rate:>10,.0f} | {speedup:>7.2f}x | {speedup / workers:>9.0%} | {summary.agreement_rate:>10.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,296 @@
+import contextlib
+import io
+import json
+import asyncio
+import platform
+import statistics
+import subprocess
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+import pydantic
+from pydantic import BaseModel, Field
+
+from manta.core.outcomes import OutcomeSpace, Issue
+from manta.core.meso import generate_meso
+from manta.core.pareto import find_pareto_frontier
+from manta.core.strategy import ConcessionStrategy, STYLE_BETAS, concession_targets, strategy_params
+from manta.agents.standard import StandardAgent
+from manta.negotiation.runner import Runner, NegotiationConfig
+from benchmarks.bench_utility import SPACE as UTILITY_SPACE, UTILITY, random_outcomes
+from benchmarks.bench_pareto import workload as pareto_workload
+from benchmarks.bench_meso import build_scenario
+from benchmarks.bench_runner import SPACE as RUNNER_SPACE, AsyncRejecter, SyncRejecter
+
+# (setup) -> the callable that is timed, and how many operations one call performs
+Workload = Callable[[], Tuple[Callable[[], Any], int]]
+
+
+# --- 1. RESULT OBJECTS ---
+
+class Case(BaseModel):
+    """One parameterized workload, e.g. meso[method=monte_carlo,issues=4,values=10]."""
+    group: str
+    params: Dict[str, Any] = Field(default_factory=dict)
+
+    @property
+    def name(self) -> str:
+        args = ",".join(f"{k}={v}" for k, v in self.params.items())
+        return f"{self.group}[{args}]"
+
+class CaseResult(BaseModel):
+    name: str
+    group: str
+    params: Dict[str, Any]
+    ops: int # Operations per call (outcomes scored, points filtered, steps played, ...)
+    calls: int # Calls per timed repeat
+    seconds: float # Best time of one call (the number compared against baselines)
+    median: float # Median time of one call across repeats
+    repeats: int
+
+    @property
+    def ops_per_sec(self) -> float:
+        return self.ops / self.seconds if self.seconds > 0 else float("inf")
+
+class Report(BaseModel):
+    meta: Dict[str, Any] = Field(default_factory=dict)
+    results: List[CaseResult] = Field(default_factory=list)
+
+    def save(self, path: str) -> None:
+        with open(path, "w") as f:
+            json.dump(self.model_dump(), f, indent=2)
+
+    @classmethod
+    def load(cls, path: str) -> "Report":
+        with open(path) as f:
+            return cls.model_validate(json.load(f))
+
+    def by_name(self) -> Dict[str, CaseResult]:
+        return {r.name: r for r in self.results}
+
+
+# --- 2. WORKLOADS (one generator per group, yielding cases and their setup) ---
+
+def utility_cases(quick: bool) -> Iterator[Tuple[Case, Workload]]:
+    for n in ((1_000, 10_000) if quick else (1_000, 100_000)):
+        def setup(n=n):
+            encoded = UTILITY_SPACE.compile().encode_batch(random_outcomes(n))
+            return (lambda: UTILITY.calculate_batch(encoded)), n
+        yield Case(group="utility.batch", params={"n": n}), setup
+
+    def setup_loop(n=1_000):
+        outcomes = random_outcomes(n)
+        return (lambda: [UTILITY.calculate(o) for o in outcomes]), n
+    yield Case(group="utility.calculate", params={"n": 1_000}), setup_loop
+
+def meso_cases(quick: bool) -> Iterator[Tuple[Case, Workload]]:
+    spaces = ((2, 5), (4, 10)) if quick else ((2, 5), (4, 10), (6, 10))
+    targets = np.linspace(0.3, 0.95, 20).tolist()
+    for method in ("analytical_solve", "monte_carlo"):
+        for n_issues, n_values in spaces:
+            def setup(method=method, n_issues=n_issues, n_values=n_values):
+                space, utility = build_scenario(n_issues, n_values)
+                def run():
+                    for i, target in enumerate(targets):
+                        generate_meso(utility, space, target, tolerance=0.01, max_offers=3, method=method, rng=i)
+                return run, len(targets)
+            yield Case(group="meso", params={"method": method, "issues": n_issues, "values": n_values}), setup
+
+def pareto_cases(quick: bool) -> Iterator[Tuple[Case, Workload]]:
+    for agents in (2, 3, 4):
+        for n in ((1_000, 10_000) if quick else (1_000, 100_000)):
+            def setup(agents=agents, n=n):
+                utils = pareto_workload(n, agents, "independent")
+                return (lambda: find_pareto_frontier(None, utils)), n
+            yield Case(group="pareto", params={"agents": agents, "n": n}), setup
+
+def strategy_cases(quick: bool) -> Iterator[Tuple[Case, Workload]]:
+    """One lockstep step of a population: every agent's target at its own progress."""
+    styles = list(STYLE_BETAS)
+    for n in ((1_000, 10_000) if quick else (1_000, 100_000)):
+        def population(n=n):
+            rng = np.random.default_rng(0)
+            strategies = [
+                ConcessionStrategy(style=styles[i % 3], start_utility=0.9 + 0.1 * rng.random(), reservation_value=0.5 * rng.random())
+                for i in range(n)
+            ]
+            return strategies, rng.random(n)
+
+        def setup_scalar(population=population, n=n):
+            strategies, progress = population()
+            pairs = list(zip(strategies, progress.tolist()))
+            return (lambda: [s.get_target(p) for s, p in pairs]), n
+        yield Case(group="strategy.scalar", params={"agents": n}), setup_scalar
+
+        def setup_vector(population=population, n=n):
+            strategies, progress = population()
+            params = strategy_params(strategies)
+            return (lambda: concession_targets(progress, *params)), n
+        yield Case(group="strategy.vector", params={"agents": n}), setup_vector
+
+def runner_cases(quick: bool) -> Iterator[Tuple[Case, Workload]]:
+    for mode, agent_cls in (("sync", SyncRejecter), ("async", AsyncRejecter)):
+        for agents in (2, 4):
+            for steps in ((1_000,) if quick else (1_000, 10_000)):
+                def setup(agent_cls=agent_cls, agents=agents, steps=steps):
+                    def run():
+                        runner = Runner(
+                            config=NegotiationConfig(max_steps=steps, outcome_space=RUNNER_SPACE, turbo=True),
+                            agents=[agent_cls(name=f"agent_{i}") for i in range(agents)],
+                        )
+                        asyncio.run(runner.run())
+                    return run, steps
+                yield Case(group="runner.turbo", params={"mode": mode, "agents": agents, "steps": steps}), setup
+
+    # Same loop with NegotiationConfig.metrics on (the cost of the instrumentation itself)
+    def setup_metrics(steps=1_000):
+        def run():
+            runner = Runner(
+                config=NegotiationConfig(max_steps=steps, outcome_space=RUNNER_SPACE, turbo=True, metrics=True),
+                agents=[SyncRejecter(name="agent_0"), SyncRejecter(name="agent_1")],
+            )
+            runner.run_sync()
+        return run, steps
+    yield Case(group="runner.metrics", params={"mode": "sync", "agents": 2, "steps": 1_000}), setup_metrics
+
+def negotiation_cases(quick: bool) -> Iterator[Tuple[Case, Workload]]:
+    """End to end: two StandardAgents (utility + strategy + MESO) over the demo space."""
+    space = OutcomeSpace(issues=[
+        Issue(name="price", type="continuous", min_value=50, max_value=150),
+        Issue(name="service", type="discrete", values=["standard", "premium", "enterprise"]),
+        Issue(name="duration", type="discrete", values=["1_year", "3_years"]),
+    ])
+    for steps in ((10,) if quick else (10, 50)):
+        def setup(steps=steps):
+            def run():
+                buyer = StandardAgent(name="buyer", role="buyer", outcome_space=space, reservation_val=0.99,
+                                      weights={"price": 0.6, "service": 0.3, "duration": 0.1})
+                seller = StandardAgent(name="seller", role="seller", outcome_space=space, reservation_val=0.99,
+                                       weights={"price": 0.7, "service": 0.2, "duration": 0.1})
+                runner = Runner(config=NegotiationConfig(max_steps=steps, outcome_space=space, turbo=True), agents=[buyer, seller])
+                asyncio.run(runner.run())
+            return run, 1
+        yield Case(group="negotiation.standard", params={"steps": steps}), setup
+
+GROUPS: Dict[str, Callable[[bool], Iterator[Tuple[Case, Workload]]]] = {
+    "utility": utility_cases,
+    "meso": meso_cases,
+    "pareto": pareto_cases,
+    "strategy": strategy_cases,
+    "runner": runner_cases,
+    "negotiation": negotiation_cases,
+}
+
+
+# --- 3. MEASUREMENT ---
+
+def measure(fn: Callable[[], Any], repeats: int = 5, min_time: float = 0.1) -> Tuple[int, List[float]]:
+    """
+    Times `fn` like timeit: one warm-up call (caches, indexes), then `calls` is doubled until a
+    repeat lasts `min_time`. Returns (calls, seconds per call for each repeat).
+    """
+    fn()
+    calls = 1
+    while True:
+        t0 = time.perf_counter()
+        for _ in range(calls):
+            fn()
+        elapsed = time.perf_counter() - t0
+        if elapsed >= min_time:
+            break
+        calls *= 2
+
+    timings = [elapsed / calls]
+    for _ in range(repeats - 1):
+        t0 = time.perf_counter()
+        for _ in range(calls):
+            fn()
+        timings.append((time.perf_counter() - t0) / calls)
+    return calls, timings
+
+def environment() -> Dict[str, Any]:
+    meta = {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "pydantic": pydantic.VERSION,
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+    }
+    try:
+        meta["commit"] = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, timeout=5
+        ).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        meta["commit"] = None
+    return meta
+
+def iter_cases(groups: Optional[List[str]] = None, quick: bool = False, match: Optional[str] = None) -> Iterator[Tuple[Case, Workload]]:
+    for group in groups or list(GROUPS):
+        if group not in GROUPS:
+            raise KeyError(f"Unknown benchmark group '{group}'. Available: {list(GROUPS)}")
+        for case, setup in GROUPS[group](quick):
+            if match is None or match in case.name:
+                yield case, setup
+
+def run_suite(
+    groups: Optional[List[str]] = None,
+    quick: bool = False,
+    match: Optional[str] = None,
+    repeats: int = 5,
+    min_time: float = 0.1,
+    progress: Optional[Callable[[CaseResult], None]] = None
+) -> Report:
+    report = Report(meta={**environment(), "quick": quick, "repeats": repeats, "min_time": min_time})
+    for case, setup in iter_cases(groups, quick, match):
+        with contextlib.redirect_stdout(io.StringIO()): # Keep stray agent prints out of the report
+            fn, ops = setup()
+            calls, timings = measure(fn, repeats=repeats, min_time=min_time)
+        result = CaseResult(
+            name=case.name, group=case.group, params=case.params, ops=ops, calls=calls,
+            seconds=min(timings), median=statistics.median(timings), repeats=len(timings),
+        )
+        report.results.append(result)
+        if progress is not None:
+            progress(result)
+    return report
+
+
+# --- 4. BASELINE COMPARISON ---
+
+class Comparison(BaseModel):
+    name: str
+    status: str # 'regression', 'improvement', 'ok', 'new' (no baseline) or 'missing' (not re-run)
+    baseline: Optional[float] = None
+    current: Optional[float] = None
+
+    @property
+    def ratio(self) -> Optional[float]:
+        """current / baseline time: > 1 is slower."""
+        if self.baseline is None or self.current is None or self.baseline <= 0:
+            return None
+        return self.current / self.baseline
+
+def compare(baseline: Report, current: Report, threshold: float = 0.10) -> List[Comparison]:
+    """
+    Flags every case that got more than `threshold` slower than the baseline (by best time
+    per call), or faster by the same margin. Cases only present on one side are reported too.
+    """
+    old, new = baseline.by_name(), current.by_name()
+    rows = []
+    for name, result in new.items():
+        if name not in old:
+            rows.append(Comparison(name=name, status="new", current=result.seconds))
+            continue
+        row = Comparison(name=name, status="ok", baseline=old[name].seconds, current=result.seconds)
+        if row.ratio is not None and row.ratio > 1.0 + threshold:
+            row.status = "regression"
+        elif row.ratio is not None and row.ratio < 1.0 / (1.0 + threshold):
+            row.status = "improvement"
+        rows.append(row)
+    for name, result in old.items():
+        if name not in new:
+            rows.append(Comparison(name=name, status="missing", baseline=result.seconds))
+    return rows
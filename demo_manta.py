@@ -3,6 +3,7 @@ from manta.core.outcomes import OutcomeSpace, Issue
 from manta.negotiation.runner import Runner, NegotiationConfig
 # Import the Universal Agent
 from manta.agents.standard import StandardAgent
+from manta.utils.logging import configure_logging
 
 # 1. DEFINE THE WORLD (Once)
 space = OutcomeSpace(issues=[
@@ -44,4 +45,5 @@ async def main():
     await runner.run()
 
 if __name__ == "__main__":
+    configure_logging(level="DEBUG") # Show every agent decision
     asyncio.run(main())
\ No newline at end of file
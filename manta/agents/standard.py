@@ -1,12 +1,16 @@
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Union
 from pydantic import Field, model_validator
 
 # Manta Imports
-from manta.core.agent import BaseAgent, AgentState, AgentResult
+from manta.core.agent import BaseAgent, AgentState, AgentResult, FastAgentResult
 from manta.core.outcomes import OutcomeSpace
 from manta.core.preferences import LinearAdditiveUtility
 from manta.core.strategy import ConcessionStrategy
 from manta.core.meso import generate_meso
+from manta.core.opponent import FrequencyOpponentModel
+from manta.utils.logging import get_logger
+
+logger = get_logger(__name__)
 
 class StandardAgent(BaseAgent):
     """
@@ -22,10 +26,17 @@ class StandardAgent(BaseAgent):
     personality: str = "linear" # boulware, linear, conceder
     aspiration_start: float = 0.95
     reservation_val: float = 0.50
+    max_steps: int = 10 # Negotiation length the concession schedule is spread over
+
+    # Opponent modeling: learn the opponent's preferences from its offers, generate
+    # `meso_candidates` equivalent offers and send the 3 it most likely accepts (best first)
+    opponent_model: bool = False
+    meso_candidates: int = 12
     
     # 3. Internal State (The "Brain")
     _utility: Optional[LinearAdditiveUtility] = None
     _strategy: Optional[ConcessionStrategy] = None
+    _opponent: Optional[FrequencyOpponentModel] = None
 
     def on_negotiation_start(self, state: AgentState):
         # A. Build the Utility Function
@@ -53,26 +64,36 @@ class StandardAgent(BaseAgent):
             start_utility=self.aspiration_start,
             reservation_value=self.reservation_val
         )
-        print(f"[{self.name}] Initialized as {self.role.upper()} ({self.personality})")
+        self._strategy.precompute(self.max_steps) # O(1) target per step
 
-    async def propose(self, state: AgentState) -> AgentResult:
+        # D. Opponent Model (fresh for every negotiation)
+        self._opponent = FrequencyOpponentModel(self.outcome_space) if self.opponent_model else None
+        logger.info("agent.start", agent=self.name, role=self.role, personality=self.personality)
+
+    async def propose(self, state: AgentState) -> Union[AgentResult, FastAgentResult]:
         # 1. Calculate Target
-        max_steps = 10 # Ideally passed in config
-        progress = state.step / max_steps
-        target = self._strategy.get_target(progress)
+        target = self._strategy.target_at(state.step)
         
-        print(f"[{self.name}] Target U: {target:.2f}")
+        logger.debug("agent.target", agent=self.name, step=state.step, target=target)
         
-        # 2. Generate Offer
-        offers = generate_meso(self._utility, self.outcome_space, target, tolerance=0.06, max_offers=3)
+        # 2. Generate Offer (with a model: more candidates, best guess for the opponent first)
+        opponent = self._opponent
+        if opponent is not None and opponent.observed:
+            offers = generate_meso(self._utility, self.outcome_space, target, tolerance=0.06, max_offers=self.meso_candidates)
+            offers = opponent.rank(offers)[:3]
+        else:
+            offers = generate_meso(self._utility, self.outcome_space, target, tolerance=0.06, max_offers=3)
         
         if not offers:
             # Panic Fallback (Should be configurable)
-            return AgentResult(response="end")
+            return FastAgentResult(response="end")
             
-        return AgentResult(response="offer", proposal=offers)
+        return FastAgentResult(response="offer", proposal=offers)
+
+    async def respond(self, state: AgentState) -> Union[AgentResult, FastAgentResult]:
+        if self._opponent is not None:
+            self._opponent.update_proposal(state.current_offer)
 
-    async def respond(self, state: AgentState) -> AgentResult:
         offer = state.current_offer
         if isinstance(offer, list): offer = offer[0] # Simplification
 
@@ -84,9 +105,9 @@ class StandardAgent(BaseAgent):
             if offer['service'] == 'premium': score += 0.1
             if offer['service'] == 'enterprise': score += 0.2
             
-        print(f"[{self.name}] Assessing offer: Score {score:.2f}")
+        logger.debug("agent.assess", agent=self.name, step=state.step, score=score)
         
         if score >= self._strategy.reservation_value:
-            return AgentResult(response="accept")
+            return FastAgentResult(response="accept")
         
-        return AgentResult(response="reject")
\ No newline at end of file
+        return FastAgentResult(response="reject")
\ No newline at end of file
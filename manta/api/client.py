@@ -0,0 +1,90 @@
+import asyncio
+import json
+from typing import Any, Dict, Optional, Tuple
+
+class ClientError(Exception):
+    """Non-2xx answer from the negotiation server."""
+    def __init__(self, status: int, payload: Any):
+        super().__init__(f"{status}: {payload}")
+        self.status = status
+        self.payload = payload
+
+class NegotiationClient:
+    """
+    Minimal asyncio client for manta.api.server: one keep-alive HTTP/1.1 connection,
+    requests sent one at a time.
+
+        async with NegotiationClient("127.0.0.1", 8080) as client:
+            session = await client.create_session(config)
+            turn = await client.turn(session["id"], wait=5.0)
+            await client.act(session["id"], "accept")
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 8080):
+        self.host = host
+        self.port = port
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._lock = asyncio.Lock()
+
+    async def __aenter__(self) -> "NegotiationClient":
+        return self
+
+    async def __aexit__(self, *exc: Any) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+    async def request(self, method: str, path: str, payload: Any = None) -> Tuple[int, Any]:
+        """(status, decoded JSON body) of one request."""
+        body = json.dumps(payload).encode() if payload is not None else b""
+        head = f"{method} {path} HTTP/1.1\r\nHost: {self.host}\r\nContent-Type: application/json\r\nContent-Length: {len(body)}\r\n\r\n"
+        async with self._lock:
+            if self._writer is None:
+                self._reader, self._writer = await asyncio.open_connection(self.host, self.port)
+            self._writer.write(head.encode("latin-1") + body)
+            await self._writer.drain()
+
+            lines = (await self._reader.readuntil(b"\r\n\r\n")).decode("latin-1").split("\r\n")
+            status = int(lines[0].split(" ", 2)[1])
+            headers = {}
+            for line in lines[1:]:
+                if ":" in line:
+                    key, value = line.split(":", 1)
+                    headers[key.strip().lower()] = value.strip()
+            data = await self._reader.readexactly(int(headers.get("content-length", 0)))
+            if headers.get("connection", "").lower() == "close":
+                await self.close()
+        return status, json.loads(data) if data else None
+
+    async def _call(self, method: str, path: str, payload: Any = None) -> Any:
+        status, data = await self.request(method, path, payload)
+        if not 200 <= status < 300:
+            raise ClientError(status, data)
+        return data
+
+    async def create_session(self, config: Dict[str, Any]) -> Dict[str, Any]:
+        return await self._call("POST", "/sessions", config)
+
+    async def session(self, session_id: str) -> Dict[str, Any]:
+        return await self._call("GET", f"/sessions/{session_id}")
+
+    async def turn(self, session_id: str, wait: float = 0.0, agent: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """The remote agent's pending turn ({'phase', 'step', 'current_offer', ...}), or None."""
+        query = f"?wait={wait}" + (f"&agent={agent}" if agent is not None else "")
+        return (await self._call("GET", f"/sessions/{session_id}/turn{query}"))["turn"]
+
+    async def act(self, session_id: str, response: str, proposal: Any = None, agent: Optional[str] = None) -> None:
+        payload: Dict[str, Any] = {"response": response, "proposal": proposal}
+        if agent is not None:
+            payload["agent"] = agent
+        await self._call("POST", f"/sessions/{session_id}/act", payload)
+
+    async def cancel(self, session_id: str) -> Dict[str, Any]:
+        return await self._call("DELETE", f"/sessions/{session_id}")
+
+    async def stats(self) -> Dict[str, Any]:
+        return await self._call("GET", "/stats")
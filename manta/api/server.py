@@ -0,0 +1,444 @@
+"""
+Asyncio negotiation server: hosts many concurrent Runner sessions in one event loop.
+
+Sessions are created from a SessionConfig (outcome space + agent specs). StandardAgents are
+played by the server; 'remote' agents are played turn by turn by an external party:
+
+    POST   /sessions                 SessionConfig JSON            -> 201 {"id", "status"}
+    GET    /sessions/{id}            status, step, current offer, last record, result
+    GET    /sessions/{id}/turn?wait=5  long poll for the remote agent's turn (of `agent`, if
+                                     several remote agents): {"turn": {...}} or {"turn": null}
+    POST   /sessions/{id}/act        {"agent", "response", "proposal"} -> 202
+    DELETE /sessions/{id}            cancels the negotiation
+    GET    /stats                    server counters
+
+Limits and backpressure:
+- at most `max_sessions` live sessions (creation answers 503 with Retry-After beyond that),
+- at most `max_running` negotiations run at once; the others wait in the queue, in order,
+- one pending action per remote agent (a bounded queue: acting out of turn answers 409/429),
+- per session memory: history ring buffer of `max_history` records, request bodies up to
+  `max_body` bytes, finished sessions dropped after `session_ttl` seconds,
+- remote agents that stop playing hit the session's call_timeout (see NegotiationConfig).
+
+The HTTP layer is a small HTTP/1.1 (keep-alive, JSON) implementation on asyncio streams, so the
+server needs no dependency beyond the standard library. See manta.api.client for a client.
+"""
+import asyncio
+import itertools
+import json
+import time
+import uuid
+from http import HTTPStatus
+from typing import Any, Dict, List, Literal, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+from pydantic import BaseModel, Field, PrivateAttr, ValidationError
+
+from manta.core.agent import BaseAgent, AgentState, AgentResult
+from manta.core.outcomes import OutcomeSpace
+from manta.core.protocol import MultilateralProtocol
+from manta.agents.standard import StandardAgent
+from manta.negotiation.runner import Runner, NegotiationConfig, TimeoutPolicy
+from manta.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+# --- 1. SESSION CONFIGURATION ---
+
+class AgentSpec(BaseModel):
+    """One negotiator of a session: a StandardAgent (configured by `params`) or a remote player."""
+    name: str
+    type: Literal["standard", "remote"] = "standard"
+    params: Dict[str, Any] = Field(default_factory=dict) # StandardAgent fields (role, weights, personality, ...)
+
+class SessionConfig(BaseModel):
+    outcome_space: OutcomeSpace
+    agents: List[AgentSpec] = Field(min_length=2)
+    max_steps: Optional[int] = 100
+    time_limit: Optional[float] = None
+    call_timeout: Optional[float] = 30.0 # How long a remote agent may take to act
+    timeout_policy: TimeoutPolicy = "end"
+    protocol: Optional[MultilateralProtocol] = None
+
+class ApiError(Exception):
+    """An error with the HTTP status it maps to."""
+    def __init__(self, status: int, message: str, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.status = status
+        self.retry_after = retry_after
+
+
+# --- 2. REMOTE AGENT (played turn by turn by an external party) ---
+
+class RemoteAgent(BaseAgent):
+    """
+    Agent whose moves come from outside: each propose()/respond() publishes a turn and waits
+    for the matching act(). At most one action can be queued, so a client cannot run ahead.
+    """
+    _turn: Optional[Dict[str, Any]] = PrivateAttr(default=None)
+    _turn_ready: Optional[asyncio.Event] = PrivateAttr(default=None)
+    _actions: Optional[asyncio.Queue] = PrivateAttr(default=None)
+
+    def model_post_init(self, __context: Any) -> None:
+        self._turn_ready = asyncio.Event()
+        self._actions = asyncio.Queue(maxsize=1)
+
+    @property
+    def turn(self) -> Optional[Dict[str, Any]]:
+        """The turn waiting for an action, or None."""
+        return self._turn
+
+    async def wait_turn(self, timeout: float) -> Optional[Dict[str, Any]]:
+        """Long poll: the pending turn, or None if none comes within `timeout` seconds."""
+        if self._turn is None and timeout > 0:
+            try:
+                await asyncio.wait_for(self._turn_ready.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+        return self._turn
+
+    def act(self, result: AgentResult) -> None:
+        if self._turn is None:
+            raise ApiError(HTTPStatus.CONFLICT, f"It is not {self.name}'s turn.")
+        try:
+            self._actions.put_nowait(result)
+        except asyncio.QueueFull:
+            raise ApiError(HTTPStatus.TOO_MANY_REQUESTS, f"An action of {self.name} is already queued.")
+        # The turn is played: pollers wait for the next one
+        self._turn = None
+        self._turn_ready.clear()
+
+    def release(self) -> None:
+        """Wakes up pending wait_turn() calls for good (the negotiation is over)."""
+        self._turn_ready.set()
+
+    async def _play(self, phase: str, state: AgentState) -> AgentResult:
+        self._turn = {
+            "phase": phase,
+            "step": state.step,
+            "relative_time": state.relative_time,
+            "current_offer": state.current_offer,
+        }
+        self._turn_ready.set()
+        try:
+            return await self._actions.get()
+        finally:
+            self._turn = None
+            self._turn_ready.clear()
+
+    async def propose(self, state: AgentState) -> AgentResult:
+        return await self._play("propose", state)
+
+    async def respond(self, state: AgentState) -> AgentResult:
+        return await self._play("respond", state)
+
+
+# --- 3. SESSIONS AND THE SERVER ---
+
+class Session:
+    __slots__ = ("id", "config", "runner", "remote", "status", "created", "started", "finished", "task")
+
+    def __init__(self, session_id: str, config: SessionConfig, runner: Runner, remote: Dict[str, RemoteAgent]):
+        self.id = session_id
+        self.config = config
+        self.runner = runner
+        self.remote = remote # Remote agents by name
+        self.status: Literal["queued", "running", "finished", "cancelled"] = "queued"
+        self.created = time.time()
+        self.started: Optional[float] = None
+        self.finished: Optional[float] = None
+        self.task: Optional[asyncio.Task] = None
+
+    def remote_agent(self, name: Optional[str]) -> RemoteAgent:
+        if name is None:
+            if len(self.remote) != 1:
+                raise ApiError(HTTPStatus.BAD_REQUEST, f"Session {self.id} has {len(self.remote)} remote agents: pass 'agent'.")
+            return next(iter(self.remote.values()))
+        if name not in self.remote:
+            raise ApiError(HTTPStatus.NOT_FOUND, f"No remote agent '{name}' in session {self.id}.")
+        return self.remote[name]
+
+    def snapshot(self) -> Dict[str, Any]:
+        state = self.runner.state
+        history = state.history
+        return {
+            "id": self.id,
+            "status": self.status,
+            "negotiation": state.status,
+            "step": state.step,
+            "current_proposer": state.current_proposer_id,
+            "current_offer": state.current_offer,
+            "records": history.total,
+            "last_record": history[-1] if len(history) else None,
+            "turns": {name: agent.turn for name, agent in self.remote.items() if agent.turn is not None},
+        }
+
+class NegotiationServer:
+    """
+    Runs negotiation sessions concurrently in the current event loop (see the module docstring).
+    The session methods can be used in-process; serve() exposes them over HTTP.
+    """
+
+    def __init__(
+        self,
+        max_sessions: int = 10_000,
+        max_running: int = 1_000,
+        max_history: int = 1_000,
+        max_body: int = 64 * 1024,
+        session_ttl: float = 60.0,
+        max_poll: float = 30.0
+    ):
+        self.max_sessions = max_sessions
+        self.max_history = max_history
+        self.max_body = max_body
+        self.session_ttl = session_ttl
+        self.max_poll = max_poll
+        self.sessions: Dict[str, Session] = {}
+        self._slots = asyncio.Semaphore(max_running)
+        self._ids = itertools.count()
+        self._prefix = uuid.uuid4().hex[:8]
+        self._server: Optional[asyncio.AbstractServer] = None
+        self.stats = {"created": 0, "rejected": 0, "finished": 0, "cancelled": 0, "requests": 0}
+
+    # --- Session API ---
+
+    def create_session(self, config: SessionConfig) -> Session:
+        if len(self.sessions) >= self.max_sessions:
+            self.stats["rejected"] += 1
+            raise ApiError(HTTPStatus.SERVICE_UNAVAILABLE, "Too many sessions, retry later.", retry_after=1.0)
+
+        agents: List[BaseAgent] = []
+        remote: Dict[str, RemoteAgent] = {}
+        for spec in config.agents:
+            if spec.type == "remote":
+                agent = remote[spec.name] = RemoteAgent(name=spec.name)
+            else:
+                try:
+                    agent = StandardAgent(name=spec.name, outcome_space=config.outcome_space, **spec.params)
+                except (ValidationError, TypeError) as e:
+                    raise ApiError(HTTPStatus.UNPROCESSABLE_ENTITY, f"Agent '{spec.name}': {e}")
+            agents.append(agent)
+        if len({agent.name for agent in agents}) != len(agents):
+            raise ApiError(HTTPStatus.UNPROCESSABLE_ENTITY, "Agent names must be unique.")
+
+        negotiation = NegotiationConfig(
+            outcome_space=config.outcome_space,
+            max_steps=config.max_steps,
+            time_limit=config.time_limit,
+            call_timeout=config.call_timeout,
+            timeout_policy=config.timeout_policy,
+            protocol=config.protocol,
+            history_limit=self.max_history,
+            turbo=True,
+            yield_every=1, # Sessions share the loop
+        )
+        session = Session(f"{self._prefix}-{next(self._ids)}", config, Runner(config=negotiation, agents=agents), remote)
+        self.sessions[session.id] = session
+        session.task = asyncio.get_running_loop().create_task(self._run(session))
+        self.stats["created"] += 1
+        return session
+
+    def get_session(self, session_id: str) -> Session:
+        session = self.sessions.get(session_id)
+        if session is None:
+            raise ApiError(HTTPStatus.NOT_FOUND, f"No session '{session_id}'.")
+        return session
+
+    async def wait_turn(self, session_id: str, agent: Optional[str] = None, wait: float = 0.0) -> Optional[Dict[str, Any]]:
+        session = self.get_session(session_id)
+        remote = session.remote_agent(agent)
+        if session.status in ("finished", "cancelled"):
+            return None
+        return await remote.wait_turn(min(wait, self.max_poll))
+
+    def act(self, session_id: str, result: AgentResult, agent: Optional[str] = None) -> None:
+        self.get_session(session_id).remote_agent(agent).act(result)
+
+    def cancel(self, session_id: str) -> Session:
+        session = self.get_session(session_id)
+        if session.task is not None and not session.task.done():
+            session.task.cancel()
+        return session
+
+    async def _run(self, session: Session) -> None:
+        try:
+            async with self._slots:
+                session.status = "running"
+                session.started = time.time()
+                await session.runner.run()
+            session.status = "finished"
+            self.stats["finished"] += 1
+        except asyncio.CancelledError:
+            session.status = "cancelled"
+            session.runner.state.status = "broken"
+            self.stats["cancelled"] += 1
+        except Exception as e:
+            session.status = "finished"
+            session.runner.state.status = "broken"
+            logger.error("session.failed", session=session.id, error=str(e))
+        finally:
+            session.finished = time.time()
+            # Wake up pollers, then forget the session after its TTL
+            for agent in session.remote.values():
+                agent.release()
+            asyncio.get_running_loop().call_later(self.session_ttl, self.sessions.pop, session.id, None)
+
+    def counters(self) -> Dict[str, Any]:
+        by_status: Dict[str, int] = {}
+        for session in self.sessions.values():
+            by_status[session.status] = by_status.get(session.status, 0) + 1
+        return {**self.stats, "sessions": len(self.sessions), "by_status": by_status}
+
+    # --- HTTP ---
+
+    async def serve(self, host: str = "127.0.0.1", port: int = 8080) -> asyncio.AbstractServer:
+        """Starts listening (port 0 picks a free port: see `port`). Stop with close()."""
+        self._server = await asyncio.start_server(self._handle_connection, host, port, limit=self.max_body)
+        logger.info("server.started", host=host, port=self.port)
+        return self._server
+
+    @property
+    def port(self) -> Optional[int]:
+        return self._server.sockets[0].getsockname()[1] if self._server is not None else None
+
+    async def close(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        for session in list(self.sessions.values()):
+            if session.task is not None:
+                session.task.cancel()
+        await asyncio.gather(*(s.task for s in self.sessions.values() if s.task is not None), return_exceptions=True)
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                try:
+                    request = await self._read_request(reader)
+                except ApiError as e:
+                    await self._write(writer, e.status, {"error": str(e)}, keep_alive=False)
+                    break
+                if request is None:
+                    break
+                method, target, body, keep_alive = request
+                self.stats["requests"] += 1
+                retry_after = None
+                try:
+                    status, payload = await self._route(method, target, body)
+                except ApiError as e:
+                    status, payload, retry_after = e.status, {"error": str(e)}, e.retry_after
+                except Exception as e:
+                    logger.error("request.failed", method=method, target=target, error=str(e))
+                    status, payload = HTTPStatus.INTERNAL_SERVER_ERROR, {"error": "Internal server error."}
+                await self._write(writer, status, payload, keep_alive, retry_after)
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def _read_request(self, reader: asyncio.StreamReader) -> Optional[Tuple[str, str, Any, bool]]:
+        try:
+            head = await reader.readuntil(b"\r\n\r\n")
+        except asyncio.IncompleteReadError:
+            return None # Client closed the connection
+        except asyncio.LimitOverrunError:
+            raise ApiError(HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE, "Headers too large.")
+
+        lines = head.decode("latin-1").split("\r\n")
+        try:
+            method, target, version = lines[0].split(" ", 2)
+        except ValueError:
+            raise ApiError(HTTPStatus.BAD_REQUEST, "Malformed request line.")
+        headers = {}
+        for line in lines[1:]:
+            if ":" in line:
+                key, value = line.split(":", 1)
+                headers[key.strip().lower()] = value.strip()
+
+        try:
+            length = int(headers.get("content-length", 0) or 0)
+        except ValueError:
+            length = -1
+        if length < 0:
+            raise ApiError(HTTPStatus.BAD_REQUEST, "Invalid Content-Length.")
+        if length > self.max_body:
+            raise ApiError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, f"Body larger than {self.max_body} bytes.")
+        body = None
+        if length:
+            try:
+                body = json.loads(await reader.readexactly(length))
+            except ValueError:
+                raise ApiError(HTTPStatus.BAD_REQUEST, "Body is not valid JSON.")
+
+        connection = headers.get("connection", "").lower()
+        keep_alive = connection != "close" if version == "HTTP/1.1" else connection == "keep-alive"
+        return method.upper(), target, body, keep_alive
+
+    async def _route(self, method: str, target: str, body: Any) -> Tuple[int, Any]:
+        url = urlsplit(target)
+        query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        parts = [part for part in url.path.split("/") if part]
+
+        if parts == ["stats"] and method == "GET":
+            return HTTPStatus.OK, self.counters()
+        if parts == ["sessions"] and method == "POST":
+            try:
+                config = SessionConfig.model_validate(body)
+            except ValidationError as e:
+                raise ApiError(HTTPStatus.UNPROCESSABLE_ENTITY, str(e))
+            session = self.create_session(config)
+            return HTTPStatus.CREATED, {"id": session.id, "status": session.status}
+        if len(parts) == 2 and parts[0] == "sessions":
+            if method == "GET":
+                return HTTPStatus.OK, self.get_session(parts[1]).snapshot()
+            if method == "DELETE":
+                return HTTPStatus.OK, {"id": parts[1], "status": self.cancel(parts[1]).status}
+        if len(parts) == 3 and parts[0] == "sessions":
+            if parts[2] == "turn" and method == "GET":
+                try:
+                    wait = float(query.get("wait", 0.0))
+                except ValueError:
+                    raise ApiError(HTTPStatus.BAD_REQUEST, "'wait' must be a number of seconds.")
+                return HTTPStatus.OK, {"turn": await self.wait_turn(parts[1], query.get("agent"), wait)}
+            if parts[2] == "act" and method == "POST":
+                body = body if isinstance(body, dict) else {}
+                try:
+                    result = AgentResult.model_validate({k: v for k, v in body.items() if k != "agent"})
+                except ValidationError as e:
+                    raise ApiError(HTTPStatus.UNPROCESSABLE_ENTITY, str(e))
+                self.act(parts[1], result, body.get("agent"))
+                return HTTPStatus.ACCEPTED, {"accepted": True}
+        raise ApiError(HTTPStatus.NOT_FOUND, f"No route for {method} {url.path}.")
+
+    @staticmethod
+    async def _write(writer: asyncio.StreamWriter, status: int, payload: Any, keep_alive: bool, retry_after: Optional[float] = None) -> None:
+        body = json.dumps(payload, default=str).encode()
+        status = HTTPStatus(status)
+        head = [
+            f"HTTP/1.1 {status.value} {status.phrase}",
+            "Content-Type: application/json",
+            f"Content-Length: {len(body)}",
+            f"Connection: {'keep-alive' if keep_alive else 'close'}",
+        ]
+        if retry_after is not None:
+            head.append(f"Retry-After: {max(1, round(retry_after))}")
+        writer.write(("\r\n".join(head) + "\r\n\r\n").encode("latin-1") + body)
+        # Backpressure: wait while the client is not reading its responses
+        await writer.drain()
+
+
+async def main(host: str = "127.0.0.1", port: int = 8080) -> None:
+    server = NegotiationServer()
+    await server.serve(host, port)
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await server.close()
+
+
+if __name__ == "__main__":
+    from manta.utils.logging import configure_logging
+    configure_logging()
+    asyncio.run(main())
@@ -1,5 +1,9 @@
-from typing import List, Optional, Any, Literal, Union, Dict
-from pydantic import BaseModel, Field, ConfigDict
+from typing import List, Optional, Any, Literal, Union, Dict, Sequence
+from pydantic import BaseModel, Field, ConfigDict, SkipValidation
+from contextlib import nullcontext
+from manta.utils.logging import current_metrics
+
+_NO_TIMER = nullcontext()
 
 # 1. The State Object
 class AgentState(BaseModel):
@@ -11,7 +15,46 @@ class AgentState(BaseModel):
     time: float
     relative_time: float
     current_offer: Optional[Any] = None
-    history: List[Any] = Field(default_factory=list)
+    # Read-only view of the negotiation history (see manta.negotiation.history.HistoryView).
+    # Not validated, so it is passed by reference instead of being copied every step.
+    history: SkipValidation[Sequence[Any]] = Field(default_factory=list)
+
+class _FastModel:
+    """
+    Unvalidated, __slots__-based stand-in for a Pydantic model, built in the negotiation loop.
+    Same attributes as the model it mirrors (`_model`), a fraction of the construction cost.
+    validate() turns it into the real model when validation is wanted (e.g. strict mode).
+    """
+    __slots__ = ()
+    _model: Any = None
+
+    def model_dump(self) -> Dict[str, Any]:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def validate(self):
+        return self._model.model_validate(self.model_dump())
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, (_FastModel, BaseModel)):
+            return self.model_dump() == (other.model_dump() if isinstance(other, _FastModel) else dict(other))
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        fields = " ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"{type(self).__name__}({fields})"
+
+class FastAgentState(_FastModel):
+    """The AgentState handed to agents by the runner (unless NegotiationConfig.strict is set)."""
+    __slots__ = ("step", "time", "relative_time", "current_offer", "history")
+    _model = AgentState
+
+    def __init__(self, step: int, time: float, relative_time: float, current_offer: Optional[Any] = None,
+                 history: Optional[Sequence[Any]] = None):
+        self.step = step
+        self.time = time
+        self.relative_time = relative_time
+        self.current_offer = current_offer
+        self.history = history if history is not None else []
 
 # 2. The Result Object
 class AgentResult(BaseModel):
@@ -23,6 +66,25 @@ class AgentResult(BaseModel):
     proposal: Optional[Union[Any, List[Any]]] = None # Supports Single Offer or MESO List
     data: Dict[str, Any] = Field(default_factory=dict) # For metadata or debug logs
 
+class FastAgentResult(_FastModel):
+    """
+    Unvalidated AgentResult for agents on the hot path (see StandardAgent).
+    The runner only reads `response` and `proposal`, and validates results in strict mode.
+    """
+    __slots__ = ("response", "proposal", "data")
+    _model = AgentResult
+
+    def __init__(self, response: str, proposal: Optional[Any] = None, data: Optional[Dict[str, Any]] = None):
+        self.response = response
+        self.proposal = proposal
+        self.data = data if data is not None else {}
+
+def validate_result(result: Any) -> AgentResult:
+    """Fully validates what an agent returned: an AgentResult, a FastAgentResult or any object with the same attributes."""
+    if isinstance(result, BaseModel):
+        result = dict(result)
+    return AgentResult.model_validate(result, from_attributes=True)
+
 # 3. The Base Agent
 class BaseAgent(BaseModel):
     """
@@ -60,6 +122,19 @@ class BaseAgent(BaseModel):
         """
         pass
 
+    def timer(self, label: str):
+        """
+        Context manager timing a block of this agent's work into the negotiation metrics
+        (histogram '<name>.<label>'). Does nothing unless NegotiationConfig.metrics is on.
+
+            with self.timer("opponent_model"):
+                self._model.update(state.current_offer)
+        """
+        metrics = current_metrics()
+        if metrics is None:
+            return _NO_TIMER
+        return metrics.timer(f"{self.name}.{label}")
+
     def on_error(self, error_details: str) -> None:
         """
         Called when an error occurs in the Runner to allow the agent to clean up.
@@ -0,0 +1,273 @@
+import asyncio
+import math
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List, NamedTuple, Optional, Sequence, Tuple, Union
+import numpy as np
+
+from manta.core.outcomes import OutcomeSpace, Outcome
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    uncacheable: int # Calls whose outcome could not be hashed (passed straight through)
+    size: int
+    maxsize: int
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+class CachedUtility:
+    """
+    Memoizing wrapper for an expensive utility function, usable anywhere a utility is accepted
+    (generate_meso, agents, tournaments...): it is callable, and has calculate() and
+    calculate_batch() like LinearAdditiveUtility.
+
+    - Canonical hashing: issue order does not matter, and continuous values are quantized to
+      `resolution` (a float, or per-issue {name: resolution}). Scores are those of the outcome
+      snapped to that grid, so a cached value does not depend on which caller came first.
+    - Bounded: least recently used entries are evicted beyond `maxsize`.
+    - Stats: cache_info() (hits, misses, evictions, hit_rate...), cache_clear().
+    - Thread-safe: the table is guarded by a lock, held only for lookups and inserts, never
+      while the wrapped utility runs (two threads missing the same key may both compute it).
+    - Async: `await acalculate(outcome)` runs misses in a worker thread, without blocking the
+      event loop, and concurrent coroutines missing the same outcome share one computation.
+
+    With an outcome space (given, or the wrapped utility's), continuous issues are known and
+    calculate_batch() scores encoded rows, computing only the misses (in one batch call when the
+    wrapped utility has calculate_batch). Without one, every float value is quantized.
+    """
+
+    def __init__(
+        self,
+        utility: Callable[[Outcome], float],
+        maxsize: int = 65_536,
+        resolution: Union[float, Dict[str, float]] = 1e-6,
+        outcome_space: Optional[OutcomeSpace] = None
+    ):
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1.")
+        self.utility = utility
+        self.maxsize = maxsize
+        self.resolution = resolution
+        self.outcome_space = outcome_space if outcome_space is not None else getattr(utility, 'outcome_space', None)
+
+        self._score = getattr(utility, 'calculate', utility)
+        self._table: "OrderedDict[Hashable, float]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+        self.hits = self.misses = self.evictions = self.uncacheable = 0
+
+        # Column layout and grid of the outcome space (None without one: every float is quantized)
+        self._compiled = self.outcome_space.compile() if self.outcome_space is not None else None
+        self._grid: Optional[np.ndarray] = None # Per-column resolution (NaN = discrete)
+        if self._compiled is not None:
+            self._grid = np.array([
+                np.nan if discrete else self._resolution(name)
+                for name, discrete in zip(self._compiled.names, self._compiled.discrete_mask.tolist())
+            ])
+            # Plain-Python form for key(): (column, name, value -> code map, resolution)
+            self._plan = [
+                (j, name, self._compiled.value_codes[j], step)
+                for j, (name, step) in enumerate(zip(self._compiled.names, self._grid.tolist()))
+            ]
+
+    def _resolution(self, name: str) -> float:
+        if isinstance(self.resolution, dict):
+            return self.resolution.get(name, 1e-6)
+        return self.resolution
+
+    def __getattr__(self, name: str) -> Any:
+        # Everything else (weights, add_curve, ...) is the wrapped utility's
+        if name == 'utility':
+            raise AttributeError(name)
+        return getattr(self.utility, name)
+
+    # --- 1. CANONICAL KEYS ---
+
+    def key(self, outcome: Outcome) -> Tuple[Optional[Hashable], Outcome]:
+        """
+        (hashable key, snapped outcome). With an outcome space the key follows its columns
+        (discrete codes, grid indices of continuous values), like the rows calculate_batch() sees;
+        without one, issues are sorted by name. The key is None if a value is unhashable.
+        """
+        snapped = dict(outcome)
+        compiled = self._compiled
+        if compiled is None:
+            items = []
+            for name in sorted(outcome):
+                value = outcome[name]
+                if isinstance(value, float) and math.isfinite(value):
+                    value = round(value / self._resolution(name))
+                    snapped[name] = value * self._resolution(name)
+                items.append((name, value))
+            key: Tuple = tuple(items)
+        else:
+            parts = []
+            matched = 0
+            for j, name, codes, step in self._plan:
+                if name not in outcome:
+                    parts.append(None)
+                    continue
+                matched += 1
+                value = outcome[name]
+                if step != step: # Discrete (NaN resolution)
+                    try:
+                        code = codes.get(value, -1) if codes is not None else compiled.code(j, value)
+                    except TypeError:
+                        code = -1
+                    parts.append(code if code >= 0 else ('invalid', value))
+                elif isinstance(value, (int, float)) and math.isfinite(value):
+                    index = round(value / step)
+                    parts.append(index)
+                    snapped[name] = index * step
+                else:
+                    parts.append(('invalid', value))
+            if matched < len(outcome):
+                parts.append(tuple(sorted((name, outcome[name]) for name in outcome if name not in compiled.index)))
+            key = tuple(parts)
+        try:
+            hash(key)
+        except TypeError:
+            return None, outcome
+        return key, snapped
+
+    # --- 2. TABLE ---
+
+    def _get(self, key: Hashable) -> Optional[float]:
+        with self._lock:
+            value = self._table.get(key)
+            if value is not None:
+                self._table.move_to_end(key)
+                self.hits += 1
+            else:
+                self.misses += 1
+            return value
+
+    def _put(self, key: Hashable, value: float) -> None:
+        with self._lock:
+            self._table[key] = value
+            self._table.move_to_end(key)
+            while len(self._table) > self.maxsize:
+                self._table.popitem(last=False)
+                self.evictions += 1
+
+    def cache_info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.evictions, self.uncacheable, len(self._table), self.maxsize)
+
+    def cache_clear(self) -> None:
+        with self._lock:
+            self._table.clear()
+            self.hits = self.misses = self.evictions = self.uncacheable = 0
+
+    # --- 3. SCORING ---
+
+    def calculate(self, outcome: Outcome) -> float:
+        key, snapped = self.key(outcome)
+        if key is None:
+            with self._lock:
+                self.uncacheable += 1
+            return self._score(outcome)
+        value = self._get(key)
+        if value is None:
+            value = float(self._score(snapped))
+            self._put(key, value)
+        return value
+
+    __call__ = calculate
+
+    async def acalculate(self, outcome: Outcome) -> float:
+        """calculate() for coroutines: misses run in a thread, concurrent misses of one outcome share it."""
+        key, snapped = self.key(outcome)
+        if key is None:
+            with self._lock:
+                self.uncacheable += 1
+            return await asyncio.to_thread(self._score, outcome)
+        value = self._get(key)
+        if value is not None:
+            return value
+
+        pending = self._inflight.get(key)
+        if pending is not None:
+            return await asyncio.shield(pending)
+        future = self._inflight[key] = asyncio.get_running_loop().create_future()
+        try:
+            value = float(await asyncio.to_thread(self._score, snapped))
+            self._put(key, value)
+            future.set_result(value)
+            return value
+        except BaseException as e:
+            future.set_exception(e)
+            future.exception() # Retrieved: waiters get it, no "never retrieved" warning
+            raise
+        finally:
+            del self._inflight[key]
+
+    def calculate_batch(self, outcomes: Union[np.ndarray, Sequence[Outcome]]) -> np.ndarray:
+        """
+        Scores encoded rows (see CompiledOutcomeSpace) or outcomes; only the misses are
+        computed, in one batch call when the wrapped utility has calculate_batch().
+        Rows with missing issues (NaN columns) are scored without being cached.
+        """
+        if self._compiled is None:
+            raise ValueError("calculate_batch requires an outcome_space to define the column layout.")
+        compiled = self._compiled
+        encoded = np.asarray(outcomes, dtype=np.float64) if isinstance(outcomes, np.ndarray) else compiled.encode_batch(outcomes)
+
+        # Grid indices of continuous columns (codes of discrete ones): the same keys as key()
+        continuous = ~np.isnan(self._grid)
+        indices = encoded.copy()
+        indices[:, continuous] = np.round(encoded[:, continuous] / self._grid[continuous])
+        snapped = encoded.copy()
+        snapped[:, continuous] = indices[:, continuous] * self._grid[continuous]
+        complete = ~np.isnan(encoded).any(axis=1)
+
+        scores = np.empty(encoded.shape[0], dtype=np.float64)
+        missing: Dict[Hashable, List[int]] = {}
+        uncached: List[int] = []
+        keys = np.where(complete[:, None], indices, 0).astype(np.int64).tolist()
+        with self._lock:
+            table = self._table
+            for i, ok in enumerate(complete.tolist()):
+                if not ok:
+                    uncached.append(i)
+                    continue
+                key = tuple(keys[i])
+                value = table.get(key)
+                if value is not None:
+                    table.move_to_end(key)
+                    scores[i] = value
+                    self.hits += 1
+                elif key in missing:
+                    missing[key].append(i) # Duplicate row within the batch: computed once
+                    self.hits += 1
+                else:
+                    missing[key] = [i]
+                    self.misses += 1
+            self.uncacheable += len(uncached)
+
+        if missing or uncached:
+            first = [idx[0] for idx in missing.values()]
+            values = self._compute(snapped[first + uncached])
+            for (key, idx), value in zip(missing.items(), values[:len(first)].tolist()):
+                scores[idx] = value
+                if value == value: # Failed rows (NaN) are not cached
+                    self._put(key, value)
+            scores[uncached] = values[len(first):]
+        return scores
+
+    def _compute(self, rows: np.ndarray) -> np.ndarray:
+        batch = getattr(self.utility, 'calculate_batch', None)
+        if batch is not None:
+            return np.asarray(batch(rows), dtype=np.float64)
+        values = np.full(rows.shape[0], np.nan, dtype=np.float64)
+        for i, candidate in enumerate(self._compiled.decode_batch(rows)):
+            try:
+                values[i] = self._score(candidate)
+            except Exception:
+                continue # Scored NaN, like generate_meso does
+        return values
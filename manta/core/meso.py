@@ -1,8 +1,13 @@
-import itertools
-import random
-from typing import List, Callable, Dict, Any, Union, Optional, Literal
+import heapq
+from time import perf_counter
+import numpy as np
+from typing import List, Callable, Dict, Any, Union, Optional, Literal, Iterator, Tuple
 from manta.core.outcomes import OutcomeSpace, Outcome
 from manta.core.preferences import LinearAdditiveUtility
+from manta.core.cache import CachedUtility
+from manta.utils.logging import current_metrics, get_logger
+
+logger = get_logger(__name__)
 
 # Define the utility function type for clean referencing
 UtilityFuncType = Callable[[Outcome], float]
@@ -17,7 +22,10 @@ def generate_meso(
     max_offers: int = 3,
     max_attempts: int = 5000,
     # The default method is the highly accurate analytical solver
-    method: Literal['analytical_solve', 'monte_carlo'] = 'analytical_solve' 
+    method: Literal['analytical_solve', 'monte_carlo'] = 'analytical_solve',
+    rng: Optional[Union[int, np.random.Generator]] = None,
+    selection: Literal['first', 'diverse'] = 'first',
+    pool_size: int = 128
 ) -> List[Outcome]:
     """
     Generates Multiple Equivalent Simultaneous Offers (MESO) using the specified method.
@@ -25,105 +33,303 @@ def generate_meso(
     Args:
         target_utility: The desired utility score to hit.
         method: 'analytical_solve' (precise/fast) or 'monte_carlo' (flexible/random).
+        rng: Seed or np.random.Generator for the Monte Carlo sampler (reproducible offers). The analytical
+             solver uses it to spread offers over the iso-utility hyperplane when several continuous
+             issues can absorb the concession; without it, every issue concedes the same fraction.
+        selection: 'first' returns the first hits (product order for the analytical solver); 'diverse'
+                   gathers up to pool_size hits spread over the iso-utility set, then keeps the
+                   max_offers most mutually distant ones (see select_diverse).
     """
+    metrics = current_metrics()
+    if metrics is not None:
+        start = perf_counter()
+
+    diverse = selection == 'diverse'
+    wanted = max(pool_size, max_offers) if diverse else max_offers
     if method == 'analytical_solve':
-        return _analytical_solve(
-            utility_function, outcome_space, target_utility, tolerance, max_offers
+        offers = _analytical_solve(
+            utility_function, outcome_space, target_utility, tolerance, wanted, rng, spread=diverse
         )
     else:
-        return _monte_carlo_sampling(
-            utility_function, outcome_space, target_utility, tolerance, max_offers, max_attempts
+        offers = _monte_carlo_sampling(
+            utility_function, outcome_space, target_utility, tolerance, wanted, max_attempts, rng
         )
+    if diverse:
+        offers = select_diverse(offers, outcome_space, max_offers)
+
+    if metrics is not None:
+        metrics.record('meso', perf_counter() - start)
+    return offers
 
 
 # ----------------------------------------------------------------------
 # --- 2. THE ANALYTICAL SOLVER (The "Real MESO" / Production Method) ---
 # ----------------------------------------------------------------------
 
+class IsoUtilityIndex:
+    """
+    Build-once index over the discrete combinations of an outcome space, for one LinearAdditiveUtility.
+
+    The utility of an offer is U = U_fixed(combo) + sum_j f_j(x_j), where every continuous issue j
+    contributes a clipped linear curve f_j, ranging over [f_min_j, f_max_j] within the issue bounds.
+    U_fixed never changes for a given combo, so it is computed for every combo once and sorted.
+    A query for a target utility only needs the combos with U_fixed in
+    [target - sum f_max, target - sum f_min] (found by binary search). Each of them is completed by
+    a point of the iso-utility hyperplane sum_j f_j(x_j) = target - U_fixed inside the box of the
+    curves, mapped back to issue values along each curve's direction: it hits the target exactly.
+
+    A min-segment-tree over the combo ids (in sorted order) hands out the solvable combos in
+    itertools.product order, so the offers match the old scan at O(log n) per offer.
+    """
+
+    def __init__(self, utility_function: LinearAdditiveUtility, outcome_space: OutcomeSpace):
+        self.compiled = outcome_space.compile()
+        self.weights = dict(utility_function.weights)
+        self.supported = False
+        self.reason = ""
+
+        # Continuous issues: (name, issue min, issue max, f_min, f_max, contribution -> value)
+        discrete_issues = []
+        self.continuous: List[tuple] = []
+        for issue in outcome_space.issues:
+            if issue.type == 'discrete':
+                discrete_issues.append(issue)
+                continue
+            lo, hi = issue.min_value, issue.max_value
+            curve = utility_function._curves.get(issue.name)
+            weight = utility_function.weights.get(issue.name, 0.0)
+            if curve is None:
+                # No curve: the issue scores 0 whatever its value
+                self.continuous.append((issue.name, lo, hi, 0.0, 0.0, None))
+            elif curve.get('type') == 'function':
+                function = curve['function']
+                if not function.continuous:
+                    self.reason = f"The '{issue.name}' value function cannot be back-solved on a continuous issue."
+                    return
+                ends = tuple(weight * v for v in function.bounds(lo, hi))
+                self.continuous.append((issue.name, lo, hi, min(ends), max(ends), self._function_inverse(weight, function, lo, hi)))
+            elif curve.get('type') == 'linear' and curve.get('max') is not None and curve.get('min') is not None:
+                ends = (
+                    utility_function._contribution(issue.name, lo),
+                    utility_function._contribution(issue.name, hi)
+                ) if issue.name in utility_function.weights else (0.0, 0.0)
+                self.continuous.append((
+                    issue.name, lo, hi, min(ends), max(ends),
+                    self._linear_inverse(weight, curve['min'], curve['max'] - curve['min'], curve['invert'])
+                ))
+            else:
+                self.reason = f"Normalization bounds missing from the '{issue.name}' curve."
+                return
+
+        self.f_min = sum(c[3] for c in self.continuous)
+        self.f_max = sum(c[4] for c in self.continuous)
+        self.names = [issue.name for issue in discrete_issues]
+        self.values = [issue.values for issue in discrete_issues]
+
+        # 1. All combos in itertools.product order (last issue varies fastest)
+        shape = tuple(len(vals) for vals in self.values)
+        if shape:
+            self.combo_codes = np.indices(shape).reshape(len(shape), -1).T
+        else:
+            self.combo_codes = np.zeros((1, 0), dtype=np.intp) # Continuous only: a single empty combo
+
+        # 2. Fixed (discrete) contribution of every combo, summed in issue order like calculate()
+        self.fixed = np.full(self.combo_codes.shape[0], utility_function.bias, dtype=np.float64)
+        for j, issue in enumerate(discrete_issues):
+            if issue.name not in utility_function._curves and issue.name not in utility_function.weights:
+                continue
+            table = np.array([utility_function._contribution(issue.name, v) for v in issue.values], dtype=np.float64)
+            self.fixed += table[self.combo_codes[:, j]]
+
+        # 3. Sort once; queries binary-search this
+        self.order = np.argsort(self.fixed, kind='stable')
+        self.sorted_fixed = self.fixed[self.order]
+
+        # 4. Segment tree of the smallest combo id per range of sorted positions
+        n = self.order.shape[0]
+        self._leaves = 1 << max(0, (n - 1).bit_length())
+        self._tree = np.full(2 * self._leaves, n, dtype=np.int64) # n = empty slot
+        self._tree[self._leaves:self._leaves + n] = self.order
+        width = self._leaves
+        while width > 1:
+            self._tree[width // 2:width] = np.minimum(self._tree[width:2 * width:2], self._tree[width + 1:2 * width:2])
+            width //= 2
+        self.supported = True
+
+    @staticmethod
+    def _linear_inverse(weight: float, curve_min: float, curve_range: float, invert: bool):
+        def inverse(share: float) -> float:
+            # Back along the curve direction (buyers: lower is better)
+            v_required = share / weight
+            norm = 1.0 - v_required if invert else v_required
+            return float(curve_min + norm * curve_range)
+        return inverse
+
+    @staticmethod
+    def _function_inverse(weight: float, function: Any, lo: float, hi: float):
+        v_lo, v_hi = function.bounds(lo, hi)
+        def inverse(share: float) -> Optional[float]:
+            # Rounding can push the share a hair past the score range
+            return function.inverse(min(v_hi, max(v_lo, share / weight)), lo, hi)
+        return inverse
+
+    def __len__(self) -> int:
+        return self.combo_codes.shape[0] if self.supported else 0
+
+    def is_current(self, utility_function: LinearAdditiveUtility, outcome_space: OutcomeSpace) -> bool:
+        return self.compiled is outcome_space.compile() and self.weights == utility_function.weights
+
+    def window(self, target_utility: float) -> Tuple[int, int]:
+        """[lo, hi) sorted positions of the combos that can be completed to hit target_utility."""
+        if not self.supported or self.f_max - self.f_min == 0.0:
+            return 0, 0
+        slack = 1e-12 * max(1.0, abs(target_utility))
+        lo = int(np.searchsorted(self.sorted_fixed, target_utility - self.f_max - slack, side='left'))
+        hi = int(np.searchsorted(self.sorted_fixed, target_utility - self.f_min + slack, side='right'))
+        return lo, hi
+
+    def spread(self, target_utility: float, n: int, rng: Optional[np.random.Generator] = None) -> List[int]:
+        """
+        Up to n solvable combo ids spread over the whole window (evenly over its U_fixed order, or at
+        random with rng), in product order. Unlike candidates(), it does not favour the first issues.
+        """
+        lo, hi = self.window(target_utility)
+        if hi - lo <= n:
+            positions = np.arange(lo, hi)
+        elif rng is None:
+            positions = lo + (np.arange(n) * (hi - lo)) // n
+        else:
+            positions = lo + rng.choice(hi - lo, size=n, replace=False)
+        return np.sort(self.order[positions]).tolist()
+
+    def candidates(self, target_utility: float) -> Iterator[int]:
+        """Yields the ids of the combos that can be completed to hit target_utility, in product order."""
+        lo, hi = self.window(target_utility)
+        if lo >= hi:
+            return
+
+        # Cover [lo, hi) with O(log n) tree nodes, then expand them smallest id first
+        tree, leaves, empty = self._tree, self._leaves, self.order.shape[0]
+        heap = []
+        left, right = lo + leaves, hi + leaves
+        while left < right:
+            if left & 1:
+                heap.append((int(tree[left]), left))
+                left += 1
+            if right & 1:
+                right -= 1
+                heap.append((int(tree[right]), right))
+            left >>= 1
+            right >>= 1
+        heapq.heapify(heap)
+
+        while heap:
+            combo_id, node = heapq.heappop(heap)
+            if node >= leaves:
+                yield combo_id
+                continue
+            for child in (2 * node, 2 * node + 1):
+                child_min = int(tree[child])
+                if child_min != empty:
+                    heapq.heappush(heap, (child_min, child))
+
+    def solve(self, combo_id: int, target_utility: float, rng: Optional[np.random.Generator] = None) -> Optional[Outcome]:
+        """
+        Completes this combo with continuous values on the iso-utility hyperplane (None if out of reach).
+        Without rng every issue makes the same relative concession; with one the point is random.
+        """
+        # 1. Required continuous contribution, split over the issues within their [f_min, f_max]
+        required = target_utility - self.fixed[combo_id]
+        if not (self.f_min - 1e-12 <= required <= self.f_max + 1e-12):
+            return None
+        active = [j for j, c in enumerate(self.continuous) if c[4] > c[3]]
+        shares = [c[3] for c in self.continuous] # Flat curves sit at their only value
+        if rng is not None:
+            active = [active[k] for k in rng.permutation(len(active)).tolist()]
+        if active:
+            lam = (required - self.f_min) / (self.f_max - self.f_min)
+            low = sum(self.continuous[j][3] for j in active)
+            high = sum(self.continuous[j][4] for j in active)
+            remaining = required - (self.f_min - low)
+            for k, j in enumerate(active[:-1]):
+                f_lo, f_hi = self.continuous[j][3], self.continuous[j][4]
+                low -= f_lo
+                high -= f_hi
+                if rng is None:
+                    share = f_lo + lam * (f_hi - f_lo)
+                else: # Anywhere that leaves the other issues a solvable remainder
+                    share = rng.uniform(max(f_lo, remaining - high), min(f_hi, remaining - low))
+                shares[j] = share
+                remaining -= share
+            shares[active[-1]] = remaining # The last issue absorbs the rest: the sum is exact
+
+        # 2. Back along each curve and into the issue bounds
+        codes = self.combo_codes[combo_id].tolist()
+        offer: Outcome = {name: vals[code] for name, vals, code in zip(self.names, self.values, codes)}
+        for j, (name, lo, hi, f_lo, f_hi, inverse) in enumerate(self.continuous):
+            if f_hi == f_lo:
+                offer[name] = float(rng.uniform(lo, hi)) if rng is not None else (lo + hi) / 2
+                continue
+            value = inverse(shares[j])
+            if value is None:
+                return None
+            offer[name] = min(hi, max(lo, value))
+        return offer
+
+
+def get_iso_index(utility_function: LinearAdditiveUtility, outcome_space: OutcomeSpace) -> IsoUtilityIndex:
+    """Returns the IsoUtilityIndex cached on the utility, rebuilding it if the utility or space changed."""
+    index = utility_function._iso_index
+    if index is None or not index.is_current(utility_function, outcome_space):
+        index = IsoUtilityIndex(utility_function, outcome_space)
+        utility_function._iso_index = index
+    return index
+
+
 def _analytical_solve(
     utility_function: UtilityFuncType,
     outcome_space: OutcomeSpace,
     target_utility: float,
     tolerance: float = 0.005,
     max_offers: int = 3,
+    rng: Optional[Union[int, np.random.Generator]] = None,
+    spread: bool = False
 ) -> List[Outcome]:
     """
-    Solves the utility equation algebraically for the price variable for every 
-    discrete combination. This is highly precise and deterministic.
+    Solves the utility equation algebraically over the continuous issues for every
+    discrete combination. Every offer lies on the iso-utility hyperplane (no rejected samples).
+    The combos are looked up in a cached IsoUtilityIndex, so a query costs a binary search
+    plus one back-solve per returned offer instead of a pass over the whole product.
+    With spread=True, the combos are taken across the whole solvable set (IsoUtilityIndex.spread).
     """
     found_offers: List[Outcome] = []
     
-    if not isinstance(utility_function, LinearAdditiveUtility):
+    # A cached linear utility is solved on its structure (the final check still goes through the cache)
+    structure = utility_function.utility if isinstance(utility_function, CachedUtility) else utility_function
+    if not isinstance(structure, LinearAdditiveUtility):
         # We need the LinearAdditiveUtility structure to access weights and bounds for solving
-        print("Falling back to Monte Carlo: Analytical solution requires LinearAdditiveUtility.")
-        return _monte_carlo_sampling(utility_function, outcome_space, target_utility)
-
-    # Setup for Price Back-Calculation
-    price_issue: Optional[Issue] = None
-    discrete_issues = []
-    
-    for issue in outcome_space.issues:
-        if issue.name == 'price' and issue.type == 'continuous':
-            price_issue = issue
-        else:
-            discrete_issues.append((issue.name, issue.values))
+        logger.info("meso.fallback", method="monte_carlo", reason="Analytical solution requires LinearAdditiveUtility.")
+        return _monte_carlo_sampling(utility_function, outcome_space, target_utility, tolerance, max_offers, rng=rng)
 
-    if not price_issue or not price_issue.max_value or not price_issue.min_value:
+    index = get_iso_index(structure, outcome_space)
+    if not index.supported:
+        logger.warning("meso.unsupported", method="analytical_solve", reason=index.reason)
         return []
 
-    price_min = price_issue.min_value
-    price_max = price_issue.max_value
-    price_range = price_max - price_min
-    price_weight = utility_function.weights.get('price', 0.0)
-    
-    # Check if price normalization bounds are set in the utility curve
-    price_curve = utility_function._curves.get('price')
-    if not price_curve or not price_curve.get('max'):
-        print("Analytical solve failed: Price normalization bounds missing from Utility curve.")
-        return []
-
-    # Max score contributed by price alone (assuming invert=True for buyer)
-    U_price_max_contrib = price_weight * 1.0 
-    
-    # Iterate Over All Discrete Combinations
-    discrete_combinations = itertools.product(*(vals for _, vals in discrete_issues))
-
-    for combo in discrete_combinations:
+    generator = np.random.default_rng(rng) if rng is not None else None
+    combos = index.spread(target_utility, max_offers, generator) if spread else index.candidates(target_utility)
+    for combo_id in combos:
         if len(found_offers) >= max_offers:
             break
-        
-        # 1. Calculate Utility Contribution from the FIXED (Non-Price) Issues
-        partial_outcome: Outcome = {}
-        for i, (issue_name, _) in enumerate(discrete_issues):
-            partial_outcome[issue_name] = combo[i]
-
-        # Get the maximum possible score for this combo (at P_min)
-        temp_outcome = {**partial_outcome, 'price': price_min}
-        U_max_score = utility_function.calculate(temp_outcome)
-        
-        # Contribution from fixed issues (U_fixed) = Total Score at P_min - Price's Max Contribution
-        U_fixed = U_max_score - U_price_max_contrib
-
-        # 2. Determine Required Price Utility (V_P(P))
-        if price_weight == 0.0: continue
-            
-        V_P_required = (target_utility - U_fixed) / price_weight
-        
-        # 3. Reverse-Engineer the Price (P)
-        if V_P_required < 0 or V_P_required > 1:
+
+        final_offer = index.solve(combo_id, target_utility, generator)
+        if final_offer is None:
             continue
-        
-        # P = P_min + (1.0 - V_P_required) * (P_max - P_min) (Standard linear formula for inverted buyer curve)
-        required_price = price_min + (1.0 - V_P_required) * price_range
-        
-        # 4. Validation and Finalization
-        if price_min <= required_price <= price_max:
-            final_offer = {**partial_outcome, 'price': required_price}
-            score_check = utility_function.calculate(final_offer)
-            
-            # Use tight tolerance for final check
-            if abs(score_check - target_utility) <= tolerance:
-                found_offers.append(final_offer)
+
+        # Use tight tolerance for final check
+        score_check = utility_function.calculate(final_offer)
+        if abs(score_check - target_utility) <= tolerance:
+            found_offers.append(final_offer)
                 
     return found_offers
 
@@ -132,43 +338,121 @@ def _analytical_solve(
 # --- 3. THE MONTE CARLO SAMPLER (The Flexible / Testing Method) ---
 # --------------------------------------------------------------------
 
+def score_batch(utility_function: UtilityFuncType, outcome_space: OutcomeSpace, encoded: np.ndarray) -> np.ndarray:
+    """
+    Scores encoded outcome rows (see CompiledOutcomeSpace).
+    Utilities exposing calculate_batch() over the same space are scored in one vectorized call;
+    anything else is called once per decoded outcome. Rows that raise score NaN.
+    """
+    batch = getattr(utility_function, 'calculate_batch', None)
+    if batch is not None:
+        own_space = getattr(utility_function, 'outcome_space', outcome_space)
+        if own_space is not None and own_space.compile().names == outcome_space.compile().names:
+            return np.asarray(batch(encoded), dtype=np.float64)
+
+    scores = np.full(encoded.shape[0], np.nan, dtype=np.float64)
+    for i, candidate in enumerate(outcome_space.compile().decode_batch(encoded)):
+        try:
+            scores[i] = utility_function(candidate)
+        except Exception:
+            continue
+    return scores
+
+
 def _monte_carlo_sampling(
     utility_function: UtilityFuncType,
     outcome_space: OutcomeSpace,
     target_utility: float,
     tolerance: float = 0.05,
     max_offers: int = 3,
-    max_attempts: int = 5000
+    max_attempts: int = 5000,
+    rng: Optional[Union[int, np.random.Generator]] = None,
+    batch_size: int = 1024
 ) -> List[Outcome]:
     """
     Randomized search for MESO. Useful for non-linear utility problems or quick testing.
+    Candidates are drawn in blocks of encoded rows, scored in one batch and filtered with a mask.
+    Pass an int seed or a np.random.Generator as `rng` for reproducible offers.
     """
     found_offers: List[Outcome] = []
-    
-    # Analyze the Space to create samplers
-    samplers = {}
-    for issue in outcome_space.issues:
+    seen = set()
+    generator = np.random.default_rng(rng)
+    compiled = outcome_space.compile()
+
+    # Analyze the Space: discrete issues sample value codes, continuous issues sample values
+    lows = np.array([0.0 if issue.type == 'discrete' else issue.min_value for issue in compiled.issues])
+    highs = np.array([0.0 if issue.type == 'discrete' else issue.max_value for issue in compiled.issues])
+    discrete_cols = np.flatnonzero(compiled.discrete_mask)
+    cardinalities = compiled.cardinalities[discrete_cols]
+
+    # Random Search Loop (one block per iteration)
+    attempts = 0
+    while attempts < max_attempts and len(found_offers) < max_offers:
+        n = min(batch_size, max_attempts - attempts)
+        attempts += n
+
+        block = generator.uniform(lows, highs, size=(n, compiled.width))
+        if discrete_cols.size:
+            block[:, discrete_cols] = generator.integers(0, cardinalities, size=(n, discrete_cols.size))
+
+        scores = score_batch(utility_function, outcome_space, block)
+        hits = np.flatnonzero(np.abs(scores - target_utility) <= tolerance)
+
+        for i in hits.tolist():
+            key = block[i].tobytes()
+            if key in seen:
+                continue
+            seen.add(key)
+            found_offers.append(compiled.decode(block[i]))
+            if len(found_offers) >= max_offers:
+                break
+                
+    return found_offers
+
+
+# --------------------------------------------------------------------
+# --- 4. DIVERSE SELECTION (Offers that tell the opponent something) ---
+# --------------------------------------------------------------------
+
+def embed_offers(offers: List[Outcome], outcome_space: OutcomeSpace) -> np.ndarray:
+    """
+    Offers as points where Euclidean distance is meaningful: continuous issues scaled to [0, 1] by
+    their bounds, discrete issues one-hot scaled by 1/sqrt(2) (two different values are 1 apart).
+    Missing values sit at 0 (continuous) or on no value (discrete).
+    """
+    compiled = outcome_space.compile()
+    encoded = compiled.encode_batch(offers)
+    columns = []
+    for j, issue in enumerate(compiled.issues):
+        col = encoded[:, j]
         if issue.type == 'discrete':
-            samplers[issue.name] = lambda i=issue: random.choice(i.values)
+            one_hot = np.zeros((col.shape[0], len(issue.values)))
+            rows = np.flatnonzero(col >= 0) # NaN and unknown (-1) codes stay all-zero
+            one_hot[rows, col[rows].astype(np.intp)] = np.sqrt(0.5)
+            columns.append(one_hot)
         else:
-            samplers[issue.name] = lambda i=issue: random.uniform(i.min_value, i.max_value)
-            
-    issue_names = list(samplers.keys())
-    
-    # Random Search Loop
-    for _ in range(max_attempts):
-        if len(found_offers) >= max_offers:
+            span = issue.max_value - issue.min_value
+            scaled = (col - issue.min_value) / span if span > 0 else np.zeros_like(col)
+            columns.append(np.nan_to_num(scaled, nan=0.0)[:, None])
+    return np.hstack(columns) if columns else np.zeros((len(offers), 0))
+
+
+def select_diverse(offers: List[Outcome], outcome_space: OutcomeSpace, k: int) -> List[Outcome]:
+    """
+    The k most mutually distant offers (see embed_offers), by greedy farthest-point selection:
+    start from the first offer, then repeatedly add the offer farthest from everything picked so far.
+    O(n * k) distance updates, and within a factor 2 of the best possible minimum spacing.
+    Duplicates are never picked twice: fewer than k offers come back if fewer are distinct.
+    """
+    if k <= 0 or not offers:
+        return []
+    points = embed_offers(offers, outcome_space)
+    picked = [0]
+    nearest = ((points - points[0]) ** 2).sum(axis=1) # Squared distance to the closest picked offer
+    for _ in range(min(k, len(offers)) - 1):
+        i = int(np.argmax(nearest))
+        if nearest[i] == 0: # Everything left duplicates a picked offer
             break
-            
-        candidate: Outcome = {name: samplers[name]() for name in issue_names}
-        
-        try:
-            score = utility_function(candidate)
-        except Exception:
-            continue
-            
-        if abs(score - target_utility) <= tolerance:
-            if candidate not in found_offers:
-                found_offers.append(candidate)
-                
-    return found_offers
\ No newline at end of file
+        picked.append(i)
+        np.minimum(nearest, ((points - points[i]) ** 2).sum(axis=1), out=nearest)
+    return [offers[i] for i in picked]
@@ -0,0 +1,117 @@
+from typing import List, Optional, Sequence, Union
+import numpy as np
+
+from manta.core.outcomes import OutcomeSpace, Outcome
+
+class FrequencyOpponentModel:
+    """
+    Frequency-based estimate of the opponent's preferences, learned from the offers it makes.
+
+    - Issue weights: an issue whose value the opponent keeps between consecutive offers matters
+      to it (it refuses to concede there), so its weight grows by `learning_rate` each time.
+      Continuous values count as kept when they move less than `tolerance` of the issue's range.
+    - Discrete values: scored by how often the opponent offered them (Laplace smoothed,
+      normalized so its favourite value scores 1.0).
+    - Continuous values: scored by closeness to the opponent's first (most ambitious) offer.
+
+    update()/update_round() are O(issues) per received offer; predict() scores a batch of candidates in one
+    vectorized pass over their CompiledOutcomeSpace encoding.
+    """
+
+    def __init__(self, outcome_space: OutcomeSpace, learning_rate: float = 0.2, tolerance: float = 0.02):
+        self.compiled = outcome_space.compile()
+        self.learning_rate = learning_rate
+        self.tolerance = tolerance
+        issues = self.compiled.issues
+        # Plain lists: update() touches single elements, which is cheaper than NumPy scalar access
+        self.discrete: List[bool] = self.compiled.discrete_mask.tolist()
+        self.ranges: List[float] = [
+            0.0 if issue.type == 'discrete' else float(issue.max_value - issue.min_value) for issue in issues
+        ]
+        self.counts: List[Optional[List[float]]] = [
+            [1.0] * len(issue.values) if issue.type == 'discrete' else None for issue in issues
+        ]
+        self.weights: List[float] = [1.0] * len(issues)
+        self.anchor: Optional[List[float]] = None # First offer received (encoded)
+        self.last: Optional[List[float]] = None # Previous offer received (encoded)
+        self.observed = 0
+
+    def update(self, offer: Outcome) -> None:
+        """Learns from one offer made by the opponent."""
+        self.update_round([offer])
+
+    def update_round(self, options: Sequence[Outcome]) -> None:
+        """
+        Learns from one round of the opponent: a single offer or the options of a MESO proposal.
+        Every option is counted in the value frequencies (each a 1/len(options) share, so a round
+        weighs as much as a single offer). Weights compare the round with the previous one once,
+        through the option closest to the previous round's offer.
+        """
+        rows = [self.compiled.encode(offer).tolist() for offer in options]
+        if not rows:
+            return
+        share = 1.0 / len(rows)
+        for row in rows:
+            for j, value in enumerate(row):
+                if self.discrete[j] and value >= 0: # NaN (missing) compares False
+                    self.counts[j][int(value)] += share
+
+        last = self.last
+        row = rows[0] if last is None or len(rows) == 1 else min(rows, key=lambda r: self._gap(last, r))
+        if last is not None:
+            for j, value in enumerate(row):
+                if value != value: # Issue missing from the offer
+                    continue
+                if self.discrete[j]:
+                    kept = last[j] == value
+                else:
+                    kept = abs(last[j] - value) <= self.tolerance * self.ranges[j]
+                if kept:
+                    self.weights[j] += self.learning_rate
+
+        if self.anchor is None:
+            self.anchor = row
+        self.last = row
+        self.observed += 1
+
+    def _gap(self, a: List[float], b: List[float]) -> float:
+        """Distance between two encoded offers: 1 per differing discrete value, range-normalized moves."""
+        gap = 0.0
+        for j, (x, y) in enumerate(zip(a, b)):
+            if x != x or y != y:
+                continue
+            if self.discrete[j]:
+                gap += x != y
+            elif self.ranges[j] > 0:
+                gap += abs(x - y) / self.ranges[j]
+        return gap
+
+    def update_proposal(self, proposal: Union[Outcome, List[Outcome], None]) -> None:
+        """update_round() for a single offer or a MESO list of offers (one round either way)."""
+        if proposal is None:
+            return
+        self.update_round(proposal if isinstance(proposal, list) else [proposal])
+
+    def predict(self, offers: Union[np.ndarray, Sequence[Outcome]]) -> np.ndarray:
+        """Estimated opponent utility (0..1) of each offer."""
+        encoded = offers if isinstance(offers, np.ndarray) else self.compiled.encode_batch(offers)
+        scores = np.zeros(encoded.shape, dtype=np.float64)
+        for j in range(encoded.shape[1]):
+            col = encoded[:, j]
+            missing = np.isnan(col)
+            if self.discrete[j]:
+                counts = np.array(self.counts[j])
+                table = np.append(counts / counts.max(), 0.0) # Code -1 (unknown value) scores 0
+                scores[:, j] = table[np.where(missing, -1, col).astype(np.intp)]
+            elif self.anchor is not None and self.ranges[j] > 0:
+                closeness = 1.0 - np.abs(col - self.anchor[j]) / self.ranges[j]
+                scores[:, j] = np.where(missing, 0.0, np.clip(closeness, 0.0, 1.0))
+        weights = np.array(self.weights)
+        return scores @ (weights / weights.sum())
+
+    def rank(self, offers: List[Outcome]) -> List[Outcome]:
+        """Offers sorted by estimated opponent utility, most likely to be accepted first (stable)."""
+        if not offers or self.observed == 0:
+            return list(offers)
+        order = np.argsort(-self.predict(offers), kind='stable')
+        return [offers[i] for i in order.tolist()]
@@ -1,6 +1,8 @@
 
-from typing import List, Any, Dict, Optional, Literal, Union
-from pydantic import BaseModel, Field, model_validator
+import math
+from typing import List, Any, Dict, Optional, Literal, Union, Sequence, Iterator, Tuple
+import numpy as np
+from pydantic import BaseModel, Field, PrivateAttr, model_validator
 
 # 1. Type Definitions
 # An Outcome is just a dictionary: {"price": 100, "delivery": "NextDay"}
@@ -30,23 +32,233 @@ class Issue(BaseModel):
 class OutcomeSpace(BaseModel):
     issues: List[Issue]
 
+    _compiled: Optional['CompiledOutcomeSpace'] = PrivateAttr(default=None)
+
+    def compile(self) -> 'CompiledOutcomeSpace':
+        """
+        Returns the indexed/encoded form of this space (built once, then cached).
+        The cache is rebuilt if the issues change: the list, an issue replaced in place, or an
+        issue's name, type, bounds or values list (replaced or resized).
+        """
+        compiled = self._compiled
+        if compiled is None or compiled.fingerprint != CompiledOutcomeSpace.fingerprint_of(self.issues):
+            compiled = CompiledOutcomeSpace(self)
+            self._compiled = compiled
+        return compiled
+
+    def get_issue(self, name: str) -> Optional[Issue]:
+        return self.compile().get_issue(name)
+
+    def is_valid(self, outcome: Outcome) -> bool:
+        """Checks if a bid is valid within the rules."""
+        return self.compile().is_valid(outcome)
+
+    def enumerate(self, resolution: Optional[Union[float, Dict[str, float]]] = None, chunk_size: int = 65_536) -> 'OutcomeEnumeration':
+        """
+        Lazy enumeration of the space, in encoded chunks (see OutcomeEnumeration).
+        Continuous issues are discretized with a step of at most `resolution` (required if there are any).
+        """
+        return OutcomeEnumeration(self.compile(), resolution, chunk_size)
+
+    def cardinality(self, resolution: Optional[Union[float, Dict[str, float]]] = None) -> int:
+        """Exact number of outcomes (continuous issues discretized at `resolution`)."""
+        return self.enumerate(resolution).cardinality
+
+# 4. The Compiled Space (Fast lookups and the array format used by the engines)
+class CompiledOutcomeSpace:
+    """
+    Indexed, integer-encoded view of an OutcomeSpace.
+
+    Every outcome maps to a fixed-width float row with one column per issue (in `issues` order):
+    - discrete issues store the value code (index into `Issue.values`, -1 if unknown),
+    - continuous issues store the value itself,
+    - issues missing from the outcome are NaN.
+    """
+    __slots__ = ('fingerprint', 'issues', 'names', 'index', 'value_codes', 'discrete_mask', 'cardinalities')
+
+    def __init__(self, space: OutcomeSpace):
+        self.fingerprint = self.fingerprint_of(space.issues)
+        self.issues = tuple(space.issues)
+        self.names = tuple(issue.name for issue in self.issues)
+
+        # Name -> column (first occurrence wins, like the old linear scan)
+        self.index: Dict[str, int] = {}
+        for j, name in enumerate(self.names):
+            self.index.setdefault(name, j)
+
+        # Per-issue value -> code maps (None for continuous or unhashable values)
+        self.value_codes: List[Optional[Dict[Any, int]]] = []
+        for issue in self.issues:
+            codes = None
+            if issue.type == 'discrete':
+                try:
+                    codes = {}
+                    for c, v in enumerate(issue.values):
+                        codes.setdefault(v, c)
+                except TypeError:
+                    codes = None
+            self.value_codes.append(codes)
+
+        self.discrete_mask = np.array([issue.type == 'discrete' for issue in self.issues], dtype=bool)
+        self.cardinalities = np.array(
+            [len(issue.values) if issue.type == 'discrete' else 0 for issue in self.issues], dtype=np.int64
+        )
+
+    @staticmethod
+    def fingerprint_of(issues: Sequence[Issue]) -> Tuple[Any, ...]:
+        """Cheap identity of a list of issues (see OutcomeSpace.compile)."""
+        return (id(issues),) + tuple(
+            (id(issue), issue.name, issue.type, id(issue.values), len(issue.values or ()), issue.min_value, issue.max_value)
+            for issue in issues
+        )
+
+    @property
+    def width(self) -> int:
+        return len(self.issues)
+
     def get_issue(self, name: str) -> Optional[Issue]:
-        for i in self.issues:
-            if i.name == name:
-                return i
-        return None
+        j = self.index.get(name)
+        return None if j is None else self.issues[j]
+
+    def code(self, j: int, value: Any) -> int:
+        """Code of a discrete value for the issue in column j (-1 if it is not a valid value)."""
+        codes = self.value_codes[j]
+        if codes is not None:
+            try:
+                return codes.get(value, -1)
+            except TypeError:
+                pass # Unhashable value, fall back to the scan below
+        values = self.issues[j].values
+        return values.index(value) if value in values else -1
 
     def is_valid(self, outcome: Outcome) -> bool:
         """Checks if a bid is valid within the rules."""
         for key, val in outcome.items():
-            issue = self.get_issue(key)
-            if not issue:
+            j = self.index.get(key)
+            if j is None:
                 return False # Unknown issue name
-            
+
+            issue = self.issues[j]
             if issue.type == 'discrete':
-                if val not in issue.values:
+                if self.code(j, val) < 0:
                     return False
             elif issue.type == 'continuous':
                 if not (issue.min_value <= val <= issue.max_value):
                     return False
-        return True
\ No newline at end of file
+        return True
+
+    # --- ENCODING ---
+
+    def encode(self, outcome: Outcome) -> np.ndarray:
+        """Encodes one outcome as a row of length `width`."""
+        row = np.full(self.width, np.nan, dtype=np.float64)
+        for key, val in outcome.items():
+            j = self.index.get(key)
+            if j is None:
+                continue
+            row[j] = self.code(j, val) if self.discrete_mask[j] else float(val)
+        return row
+
+    def encode_batch(self, outcomes: Sequence[Outcome]) -> np.ndarray:
+        """Encodes a list of outcomes as a (len(outcomes), width) array."""
+        encoded = np.full((len(outcomes), self.width), np.nan, dtype=np.float64)
+        for j, name in enumerate(self.names):
+            if self.discrete_mask[j]:
+                encoded[:, j] = [self.code(j, o[name]) if name in o else np.nan for o in outcomes]
+            else:
+                encoded[:, j] = [float(o[name]) if name in o else np.nan for o in outcomes]
+        return encoded
+
+    def decode(self, row: Sequence[float]) -> Outcome:
+        """Inverse of encode(). NaN columns and unknown codes are left out of the outcome."""
+        outcome: Outcome = {}
+        for j, issue in enumerate(self.issues):
+            val = row[j]
+            if val != val: # NaN
+                continue
+            if self.discrete_mask[j]:
+                code = int(val)
+                if 0 <= code < len(issue.values):
+                    outcome[issue.name] = issue.values[code]
+            else:
+                outcome[issue.name] = float(val)
+        return outcome
+
+    def decode_batch(self, rows: np.ndarray) -> List[Outcome]:
+        return [self.decode(row) for row in np.asarray(rows).tolist()]
+
+# 5. Enumeration (Streaming over the whole space)
+class OutcomeEnumeration:
+    """
+    The outcomes of a space as fixed-size chunks of encoded rows (CompiledOutcomeSpace layout),
+    in itertools.product order (last issue varies fastest). Nothing is materialized up front:
+    a chunk is decoded from its flat indices (mixed radix), so memory is bounded by chunk_size.
+
+    Continuous issues become a grid from min_value to max_value (both included) with a step of at
+    most `resolution`: a float, or {issue name: step}.
+
+    Usage:
+        outcomes = space.enumerate(resolution=0.5)
+        outcomes.cardinality # exact, before anything is generated
+        for block in outcomes: # (<= chunk_size, width) float arrays
+            scores = utility.calculate_batch(block)
+    """
+
+    def __init__(self, compiled: CompiledOutcomeSpace, resolution: Optional[Union[float, Dict[str, float]]] = None, chunk_size: int = 65_536):
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1.")
+        self.compiled = compiled
+        self.chunk_size = chunk_size
+
+        # Encoded values of every column: discrete codes, or the continuous grid
+        self.grids: List[np.ndarray] = []
+        for issue in compiled.issues:
+            if issue.type == 'discrete':
+                self.grids.append(np.arange(len(issue.values), dtype=np.float64))
+                continue
+            step = resolution.get(issue.name) if isinstance(resolution, dict) else resolution
+            if step is None:
+                raise ValueError(f"Continuous issue '{issue.name}' needs a resolution to be enumerated.")
+            if step <= 0:
+                raise ValueError(f"Resolution for '{issue.name}' must be positive.")
+            span = issue.max_value - issue.min_value
+            points = math.ceil(span / step - 1e-9) + 1 if span > 0 else 1
+            self.grids.append(np.linspace(issue.min_value, issue.max_value, points))
+
+        self.shape: Tuple[int, ...] = tuple(len(grid) for grid in self.grids)
+        self.cardinality: int = math.prod(self.shape) # Python int: exact, even past int64
+
+        # Flat index -> digit of column j is (index // strides[j]) % shape[j]
+        self.strides: List[int] = [1] * len(self.shape)
+        for j in range(len(self.shape) - 2, -1, -1):
+            self.strides[j] = self.strides[j + 1] * self.shape[j + 1]
+
+    def __len__(self) -> int:
+        return self.cardinality
+
+    @property
+    def n_chunks(self) -> int:
+        return -(-self.cardinality // self.chunk_size)
+
+    def chunk(self, start: int, stop: int) -> np.ndarray:
+        """Encoded rows of the outcomes [start, stop) in enumeration order."""
+        if self.cardinality >= 1 << 63:
+            raise ValueError(f"Cannot index {self.cardinality} outcomes with int64; use a coarser resolution.")
+        start, stop = max(0, start), min(stop, self.cardinality)
+        index = np.arange(start, max(start, stop), dtype=np.int64)
+        rows = np.empty((index.shape[0], len(self.grids)), dtype=np.float64)
+        for j, (grid, stride) in enumerate(zip(self.grids, self.strides)):
+            digits = index // stride if stride > 1 else index.copy()
+            if j > 0:
+                digits %= self.shape[j]
+            rows[:, j] = grid[digits]
+        return rows
+
+    def __iter__(self) -> Iterator[np.ndarray]:
+        for start in range(0, self.cardinality, self.chunk_size):
+            yield self.chunk(start, start + self.chunk_size)
+
+    def outcomes(self) -> Iterator[Outcome]:
+        """The same enumeration, decoded one outcome at a time."""
+        for block in self:
+            yield from self.compiled.decode_batch(block)
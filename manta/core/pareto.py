@@ -1,4 +1,16 @@
-from typing import List, Tuple, Any, Dict
+import bisect
+import itertools
+from typing import List, Tuple, Any, Dict, Sequence, Union, Optional, Callable, NamedTuple
+import numpy as np
+from manta.core.outcomes import Outcome
+from manta.core.preferences import LinearAdditiveUtility
+from manta.core.cache import CachedUtility
+from manta.core.meso import score_batch
+
+# Max number of boolean cells materialized by one blocked dominance comparison
+_DOMINANCE_CELLS = 1 << 22
+# Frontier points used to prune the whole space once, after the first SFS block
+_PRUNE_PIVOTS = 32
 
 def is_dominated(candidate_utils: Tuple[float, ...], frontier_utils: List[Tuple[float, ...]]) -> bool:
     """
@@ -9,48 +21,611 @@ def is_dominated(candidate_utils: Tuple[float, ...], frontier_utils: List[Tuple[
         # Check if point dominates candidate
         at_least_one_better = False
         all_at_least_equal = True
-        
+
         for p_val, c_val in zip(point, candidate_utils):
             if p_val < c_val:
                 all_at_least_equal = False
                 break
             if p_val > c_val:
                 at_least_one_better = True
-        
+
         if all_at_least_equal and at_least_one_better:
             return True
     return False
 
+def dominated_by_any(points: np.ndarray, candidates: np.ndarray) -> np.ndarray:
+    """
+    Blocked, vectorized dominance check.
+    Returns a boolean mask over `candidates` (shape (m, k)): True where some row of `points` (shape (f, k)) dominates it.
+    """
+    dominated = np.zeros(candidates.shape[0], dtype=bool)
+    if points.shape[0] == 0 or candidates.shape[0] == 0:
+        return dominated
+
+    # Compare in chunks of frontier rows so the (chunk, m) temporaries stay bounded.
+    # Looping over the k agents keeps every comparison a flat 2D operation.
+    chunk = max(1, _DOMINANCE_CELLS // candidates.shape[0])
+    for start in range(0, points.shape[0], chunk):
+        block = points[start:start + chunk]
+        ge, gt = _pairwise_dominance(block, candidates)
+        dominated |= (ge & gt).any(axis=0)
+    return dominated
+
+def _pairwise_dominance(a: np.ndarray, b: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """(len(a), len(b)) matrices: a[i] >= b[j] on every agent, and a[i] > b[j] on at least one."""
+    ge = a[:, 0, None] >= b[None, :, 0]
+    gt = a[:, 0, None] > b[None, :, 0]
+    for j in range(1, a.shape[1]):
+        ge &= a[:, j, None] >= b[None, :, j]
+        gt |= a[:, j, None] > b[None, :, j]
+    return ge, gt
+
+def _pareto_mask_2d(points: np.ndarray) -> np.ndarray:
+    """
+    O(n log n) sweep for two agents.
+    Sort by u1 descending (ties by u2 descending). A point survives if it has the best u2 among
+    points with the same u1, and beats the best u2 of every point with a strictly greater u1.
+    """
+    n = points.shape[0]
+    u1, u2 = points[:, 0], points[:, 1]
+    order = np.lexsort((-u2, -u1))
+    s1, s2 = u1[order], u2[order]
+
+    group_start = np.ones(n, dtype=bool)
+    group_start[1:] = s1[1:] != s1[:-1]
+    start_idx = np.maximum.accumulate(np.where(group_start, np.arange(n), 0))
+
+    running_best = np.maximum.accumulate(s2)
+    first_group = start_idx == 0
+    prev_best = running_best[np.where(first_group, 0, start_idx - 1)]
+
+    keep_sorted = (s2 == s2[start_idx]) & (first_group | (s2 > prev_best))
+    mask = np.empty(n, dtype=bool)
+    mask[order] = keep_sorted
+    return mask
+
+def _pareto_mask_sfs(points: np.ndarray, block_size: int) -> np.ndarray:
+    """
+    Sort-Filter-Skyline for k agents.
+    Points are visited in descending social welfare (same order as the original greedy filter),
+    so a point can only be dominated by points visited before it. Each block is checked against
+    the frontier found so far, then against the earlier survivors of its own block. After the
+    first block, its frontier prunes the rest of the space in one vectorized pass.
+    """
+    n, k = points.shape
+
+    # Sum left to right like the builtin sum(), so ties break exactly as before
+    welfare = points[:, 0].copy()
+    for j in range(1, k):
+        welfare += points[:, j]
+    order = np.argsort(-welfare, kind='stable')
+    ordered = points[order]
+
+    keep_sorted = np.zeros(n, dtype=bool)
+    frontier = np.empty((0, k), dtype=points.dtype)
+    pending = np.arange(n)
+    pos = 0
+    pruned = False
+
+    while pos < pending.shape[0]:
+        # A small first block is enough to find good pivots for the prune below
+        step = block_size if pruned else min(block_size, 2 * _PRUNE_PIVOTS)
+        idx = pending[pos:pos + step]
+        pos += step
+        block = ordered[idx]
+
+        # 1. Against the frontier so far (all earlier points)
+        alive = np.flatnonzero(~dominated_by_any(frontier, block))
+        candidates = block[alive]
+
+        # 2. Within the block: only earlier candidates count
+        ge, gt = _pairwise_dominance(candidates, candidates)
+        survivors = ~np.triu(ge & gt, k=1).any(axis=0)
+
+        keep_sorted[idx[alive[survivors]]] = True
+        frontier = np.vstack((frontier, candidates[survivors]))
+
+        # 3. One sweep of the best points found so far over everything left removes
+        #    most of the space before the block-by-block filtering continues
+        if not pruned and pos < pending.shape[0]:
+            rest = pending[pos:]
+            pending = rest[~dominated_by_any(frontier[:_PRUNE_PIVOTS], ordered[rest])]
+            pos = 0
+            pruned = True
+
+    mask = np.empty(n, dtype=bool)
+    mask[order] = keep_sorted
+    return mask
+
+def pareto_mask(utilities: Union[np.ndarray, Sequence[Tuple[float, ...]]], block_size: int = 512) -> np.ndarray:
+    """
+    Boolean mask of the non-dominated rows of a (n, k) utility matrix.
+    Dispatches to the 2-agent sweep or the k-agent Sort-Filter-Skyline.
+    """
+    points = np.asarray(utilities, dtype=np.float64)
+    if points.size == 0:
+        return np.zeros(points.shape[0] if points.ndim else 0, dtype=bool)
+    if points.ndim != 2:
+        raise ValueError("utilities must be a 2D array-like of shape (n_outcomes, n_agents).")
+
+    if points.shape[1] == 2:
+        return _pareto_mask_2d(points)
+    return _pareto_mask_sfs(points, block_size)
+
 def find_pareto_frontier(outcomes: List[Any], utilities: List[Tuple[float, ...]]) -> List[int]:
     """
     Find the indices of outcomes that are on the Pareto Frontier.
-    
+
     Args:
-        outcomes: List of outcome objects (not used in comparison, just for indexing if needed, 
+        outcomes: List of outcome objects (not used in comparison, just for indexing if needed,
                   but here we return indices so it might be redundant, but keeping signature generic).
-        utilities: List of utility vectors corresponding to outcomes. 
+        utilities: List of utility vectors corresponding to outcomes (or a (n, k) array).
                    Each tuple contains utilities for all agents for that outcome.
-                   
+
     Returns:
         List of indices of outcomes on the Pareto Frontier.
     """
-    # 1. Pre-sort by Social Welfare (sum of utilities) descending
-    # Store (original_index, utility_vector, social_welfare)
-    indexed_points = []
-    for i, utils in enumerate(utilities):
-        sw = sum(utils)
-        indexed_points.append((i, utils, sw))
-    
-    # Sort descending by SW
-    indexed_points.sort(key=lambda x: x[2], reverse=True)
-    
-    frontier_indices = []
-    frontier_utils = []
-    
-    # 2. Filtering Loop
-    for idx, candidate_utils, _ in indexed_points:
-        if not is_dominated(candidate_utils, frontier_utils):
-            frontier_indices.append(idx)
-            frontier_utils.append(candidate_utils)
-            
-    return sorted(frontier_indices)
+    return np.flatnonzero(pareto_mask(utilities)).tolist()
+
+def space_pareto_frontier(
+    outcome_space: Any,
+    utility_functions: Sequence[Callable[[Any], float]],
+    resolution: Optional[Union[float, Dict[str, float]]] = None,
+    chunk_size: int = 65_536
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Pareto frontier of a whole outcome space, streamed chunk by chunk (see OutcomeSpace.enumerate),
+    so memory is bounded by chunk_size plus the frontier instead of the size of the space.
+
+    Returns (encoded frontier outcomes, their (f, k) utilities), in enumeration order.
+    Decode the rows with outcome_space.compile().decode_batch().
+    """
+    enumeration = outcome_space.enumerate(resolution, chunk_size)
+    rows = np.empty((0, enumeration.compiled.width), dtype=np.float64)
+    utils = np.empty((0, len(utility_functions)), dtype=np.float64)
+    for block in enumeration:
+        block_utils = np.column_stack([score_batch(u, outcome_space, block) for u in utility_functions])
+        # Chunk survivors first (cheap, keeps the merge small), then against the frontier so far
+        keep = pareto_mask(block_utils)
+        rows = np.vstack((rows, block[keep]))
+        utils = np.vstack((utils, block_utils[keep]))
+        keep = pareto_mask(utils)
+        rows, utils = rows[keep], utils[keep]
+    return rows, utils
+
+class IncrementalParetoFrontier:
+    """
+    Pareto frontier maintained point by point (e.g. over the offers of a running negotiation).
+
+    insert() adds a point if no frontier point dominates it and evicts the points it dominates.
+    With 2 agents the frontier is kept sorted by u1 (so u2 descends): an insert is a binary search
+    (O(log n) comparisons) plus one list splice, which shifts the tail in O(n) but as a single
+    memmove of pointers. With k agents the frontier lives in a growable NumPy buffer (doubling,
+    compacted with a mask on eviction) and the dominance test is one vectorized pass over it.
+    """
+
+    def __init__(self):
+        self._outcomes: List[Any] = []
+        self._utils: List[Tuple[float, ...]] = [] # 2 agents: sorted by u1
+        self._u1: List[float] = [] # 2-agent sort key, parallel to _utils
+        self._array: Optional[np.ndarray] = None # 2 agents: cached array form of _utils
+        self._buffer: Optional[np.ndarray] = None # k agents: frontier utilities in rows [:len(self)]
+        self.n_agents: Optional[int] = None
+        self.inserted = 0
+
+    def __len__(self) -> int:
+        return len(self._outcomes)
+
+    @property
+    def outcomes(self) -> List[Any]:
+        return list(self._outcomes)
+
+    @property
+    def utilities(self) -> np.ndarray:
+        """Frontier utilities as a (len(self), n_agents) array."""
+        if self._buffer is not None:
+            return self._buffer[:len(self)].copy()
+        return self._frontier()
+
+    def _frontier(self) -> np.ndarray:
+        """utilities without the copy (k agents: a view of the buffer, valid until the next insert)."""
+        if self._buffer is not None:
+            return self._buffer[:len(self)]
+        if self._array is None:
+            self._array = np.array(self._utils, dtype=np.float64).reshape(len(self._utils), self.n_agents or 0)
+        return self._array
+
+    def insert(self, outcome: Any, utils: Sequence[float]) -> bool:
+        """Adds a point. Returns True if it joined the frontier."""
+        point = tuple(float(u) for u in utils)
+        if self.n_agents is None:
+            self.n_agents = len(point)
+            if self.n_agents != 2:
+                self._buffer = np.empty((16, self.n_agents), dtype=np.float64)
+        elif len(point) != self.n_agents:
+            raise ValueError(f"Expected {self.n_agents} utilities, got {len(point)}.")
+        self.inserted += 1
+
+        if self.n_agents == 2:
+            added = self._insert_2d(outcome, point)
+            if added:
+                self._array = None
+            return added
+        return self._insert_kd(outcome, point)
+
+    def _insert_2d(self, outcome: Any, point: Tuple[float, ...]) -> bool:
+        a, b = point
+
+        # 1. The first point with u1 >= a has the best u2 of all of them
+        i = bisect.bisect_left(self._u1, a)
+        if i < len(self._u1):
+            q1, q2 = self._utils[i]
+            if q2 >= b and (q1 > a or q2 > b):
+                return False
+
+        # 2. Points dominated by the new one (u1 <= a, u2 <= b) form a contiguous run
+        #    ending at the insert position. Exact duplicates are not dominated: if there
+        #    are any, nothing else can be dominated either.
+        j = bisect.bisect_right(self._u1, a)
+        lo = j
+        if not (j > 0 and self._utils[j - 1] == point):
+            while lo > 0 and self._utils[lo - 1][1] <= b:
+                lo -= 1
+
+        self._utils[lo:j] = [point]
+        self._u1[lo:j] = [a]
+        self._outcomes[lo:j] = [outcome]
+        return True
+
+    def _insert_kd(self, outcome: Any, point: Tuple[float, ...]) -> bool:
+        candidate = np.array([point], dtype=np.float64)
+        frontier = self._frontier()
+        if dominated_by_any(frontier, candidate)[0]:
+            return False
+
+        n = len(frontier)
+        evicted = dominated_by_any(candidate, frontier)
+        if evicted.any():
+            keep = np.flatnonzero(~evicted)
+            n = len(keep)
+            self._buffer[:n] = frontier[keep]
+            self._outcomes = [self._outcomes[i] for i in keep.tolist()]
+        elif n == self._buffer.shape[0]:
+            grown = np.empty((2 * n, self.n_agents), dtype=np.float64)
+            grown[:n] = frontier
+            self._buffer = grown
+
+        self._buffer[n] = candidate[0]
+        self._outcomes.append(outcome)
+        return True
+
+    def is_dominated(self, utils: Sequence[float]) -> bool:
+        """True if some frontier point dominates `utils`."""
+        if not len(self):
+            return False
+        return bool(dominated_by_any(self._frontier(), np.array([utils], dtype=np.float64))[0])
+
+    def distance(self, utils: Sequence[float]) -> float:
+        """
+        Euclidean distance from `utils` to the closest frontier point.
+        0.0 for points that no frontier point dominates (they are on the frontier).
+        """
+        if not self.is_dominated(utils):
+            return 0.0
+        gaps = self._frontier() - np.asarray(utils, dtype=np.float64)
+        return float(np.sqrt((gaps * gaps).sum(axis=1).min()))
+
+class ParetoTracker:
+    """
+    Runner observer that feeds every proposed offer into an IncrementalParetoFrontier and
+    records, per step, the distance of the best offer on the table to the frontier seen so far.
+
+    Usage:
+        tracker = ParetoTracker([buyer_utility, seller_utility])
+        Runner(config=config, agents=agents, observers=[tracker])
+    """
+
+    def __init__(self, utility_functions: List[Callable[[Any], float]]):
+        self.utility_functions = utility_functions
+        self.frontier = IncrementalParetoFrontier()
+        self.distances: List[float] = []
+
+    def observe(self, proposal: Any) -> float:
+        """Inserts an offer (or MESO list of offers); returns the smallest distance to the frontier."""
+        offers = proposal if isinstance(proposal, list) else [proposal]
+        points = []
+        for offer in offers:
+            utils = tuple(u(offer) for u in self.utility_functions)
+            self.frontier.insert(offer, utils)
+            points.append(utils)
+
+        distance = min(self.frontier.distance(utils) for utils in points) if points else 0.0
+        self.distances.append(distance)
+        return distance
+
+    def on_step(self, state: Any, record: Dict[str, Any]) -> None:
+        self.observe(record["proposal"])
+
+class BargainingPoint(NamedTuple):
+    outcome: Outcome
+    utilities: Tuple[float, ...]
+    value: float # Nash product, or the smallest normalized gain for Kalai-Smorodinsky
+
+class _LinearBargainingSet:
+    """
+    The part of the outcome space that can hold a bargaining solution, for two LinearAdditiveUtility
+    agents, built from the weights and curves instead of an enumeration:
+
+    - Discrete issues are merged one at a time, keeping only the frontier of the fixed utilities:
+      a combo dominated on its discrete part stays dominated whatever the continuous issues are.
+    - Continuous issues are split at the curve bounds into pieces where both utilities are affine.
+      For one choice of piece per issue, the reachable utilities form a zonotope, whose
+      upper-right boundary is a chain of at most one segment per issue (cheapest trade-offs first).
+
+    Every candidate is a (combo, segment) pair: utilities fixed[combo] + p0 + t * dp for t in [0, 1],
+    reached at continuous values x0 + t * dx.
+    """
+
+    def __init__(self, utility_functions: Sequence[LinearAdditiveUtility], outcome_space: Any):
+        self.compiled = outcome_space.compile()
+        self.supported = False
+        self.reason = ""
+        self.discrete = [issue for issue in self.compiled.issues if issue.type == 'discrete']
+        self.continuous = [issue for issue in self.compiled.issues if issue.type != 'discrete']
+
+        ramps = []
+        for issue in self.continuous:
+            agent_ramps = []
+            for utility in utility_functions:
+                ramp = self._ramp(utility, issue)
+                if ramp is None:
+                    self.reason = f"Continuous issue '{issue.name}' has no linear curve."
+                    return
+                agent_ramps.append(ramp)
+            ramps.append(agent_ramps)
+
+        self._combos(utility_functions)
+        self._segments(ramps)
+        self.supported = True
+
+    @staticmethod
+    def _ramp(utility: LinearAdditiveUtility, issue: Any) -> Optional[Tuple[float, float, float, bool]]:
+        """(weight, curve min, curve range, invert) of a continuous issue; a zero weight if it does not count."""
+        curve = utility._curves.get(issue.name)
+        if curve is None:
+            # _contribution() scores continuous values without a curve as 0
+            return (0.0, issue.min_value, 0.0, True)
+        if curve.get('type') != 'linear':
+            return None
+        return (utility.weights.get(issue.name, 0.0), curve['min'], curve['max'] - curve['min'], curve['invert'])
+
+    @staticmethod
+    def _ramp_value(ramp: Tuple[float, float, float, bool], x: float) -> float:
+        weight, lo, rng, invert = ramp
+        norm = 1.0 if rng == 0 else min(1.0, max(0.0, (x - lo) / rng))
+        return weight * (1.0 - norm if invert else norm)
+
+    def _combos(self, utility_functions: Sequence[LinearAdditiveUtility]) -> None:
+        # 1. Frontier of the discrete combos, merged issue by issue (duplicates keep the first combo)
+        fixed = np.array([[u.bias for u in utility_functions]], dtype=np.float64)
+        codes = np.zeros((1, 0), dtype=np.int64)
+        for issue in self.discrete:
+            table = np.array([
+                [u._contribution(issue.name, v) if (issue.name in u._curves or issue.name in u.weights) else 0.0 for u in utility_functions]
+                for v in issue.values
+            ], dtype=np.float64)
+            n = table.shape[0]
+            fixed = (fixed[:, None, :] + table[None, :, :]).reshape(-1, 2)
+            codes = np.hstack((np.repeat(codes, n, axis=0), np.tile(np.arange(n), codes.shape[0])[:, None]))
+            _, first = np.unique(fixed, axis=0, return_index=True)
+            first.sort()
+            fixed, codes = fixed[first], codes[first]
+            keep = pareto_mask(fixed)
+            fixed, codes = fixed[keep], codes[keep]
+        self.fixed, self.codes = fixed, codes
+
+    def _segments(self, ramps: List[List[Tuple[float, float, float, bool]]]) -> None:
+        # 2. Pieces of every continuous issue: intervals between the curve bounds
+        pieces = []
+        for issue, agent_ramps in zip(self.continuous, ramps):
+            lo, hi = issue.min_value, issue.max_value
+            cuts = {lo, hi}
+            for _, start, rng, _ in agent_ramps:
+                cuts.update(c for c in (start, start + rng) if lo < c < hi)
+            cuts = sorted(cuts)
+            issue_pieces = []
+            for left, right in zip(cuts[:-1], cuts[1:]) if len(cuts) > 1 else [(lo, lo)]:
+                p_left = np.array([self._ramp_value(r, left) for r in agent_ramps])
+                p_right = np.array([self._ramp_value(r, right) for r in agent_ramps])
+                issue_pieces.append((left, right, p_left, p_right))
+            pieces.append(issue_pieces)
+
+        # 3. Upper-right chain of the zonotope of every combination of pieces
+        m = len(self.continuous)
+        p0, dp, x0, dx = [], [], [], []
+        for cell in itertools.product(*pieces):
+            base = np.zeros(2)
+            start = np.zeros(m)
+            trades = []
+            for j, (left, right, p_left, p_right) in enumerate(cell):
+                g = p_right - p_left
+                if g[0] >= 0 and g[1] >= 0:
+                    base += p_right
+                    start[j] = right
+                elif g[0] <= 0 and g[1] <= 0:
+                    base += p_left
+                    start[j] = left
+                elif g[0] > 0: # Trade-off, starting from the end that is best for the second agent
+                    base += p_left
+                    start[j] = left
+                    trades.append((-g[1] / g[0], j, g, right - left))
+                else:
+                    base += p_right
+                    start[j] = right
+                    trades.append((g[1] / g[0], j, -g, left - right))
+            if not trades:
+                p0.append(base.copy())
+                dp.append(np.zeros(2))
+                x0.append(start.copy())
+                dx.append(np.zeros(m))
+            for _, j, g, step in sorted(trades, key=lambda trade: trade[0]):
+                p0.append(base.copy())
+                dp.append(g)
+                x0.append(start.copy())
+                move = np.zeros(m)
+                move[j] = step
+                dx.append(move)
+                base += g
+                start[j] += step
+
+        self.p0, self.dp = np.array(p0).reshape(-1, 2), np.array(dp).reshape(-1, 2)
+        self.x0, self.dx = np.array(x0).reshape(-1, m), np.array(dx).reshape(-1, m)
+
+    def lines(self, disagreement: Sequence[float]) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Gains over the disagreement point as a0 + a1 * t, b0 + b1 * t, shape (combos, segments)."""
+        a0 = self.fixed[:, 0, None] + self.p0[None, :, 0] - disagreement[0]
+        b0 = self.fixed[:, 1, None] + self.p0[None, :, 1] - disagreement[1]
+        a1 = np.broadcast_to(self.dp[None, :, 0], a0.shape)
+        b1 = np.broadcast_to(self.dp[None, :, 1], b0.shape)
+        return a0, a1, b0, b1
+
+    def outcome(self, combo: int, segment: int, t: float) -> Outcome:
+        outcome: Outcome = {}
+        codes = dict(zip((issue.name for issue in self.discrete), self.codes[combo].tolist()))
+        x = self.x0[segment] + t * self.dx[segment]
+        values = dict(zip((issue.name for issue in self.continuous), x.tolist()))
+        for issue in self.compiled.issues:
+            if issue.type == 'discrete':
+                outcome[issue.name] = issue.values[codes[issue.name]]
+            else:
+                outcome[issue.name] = min(issue.max_value, max(issue.min_value, values[issue.name]))
+        return outcome
+
+def _rational_range(a0: np.ndarray, a1: np.ndarray, b0: np.ndarray, b1: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """[lo, hi] of t in [0, 1] where both gains are >= 0 (lo > hi where there is none)."""
+    lo = np.zeros(a0.shape)
+    hi = np.ones(a0.shape)
+    for g0, g1 in ((a0, a1), (b0, b1)):
+        with np.errstate(divide='ignore', invalid='ignore'):
+            root = -g0 / g1
+        lo = np.where(g1 > 0, np.maximum(lo, root), lo)
+        hi = np.where(g1 < 0, np.minimum(hi, root), hi)
+        hi = np.where((g1 == 0) & (g0 < 0), -1.0, hi)
+    return lo, hi
+
+def _best_on_lines(score: Callable[[np.ndarray], np.ndarray], candidates: List[np.ndarray], lo: np.ndarray, hi: np.ndarray) -> Tuple[float, Tuple[int, ...], float]:
+    """Best (score, index, t) over the candidate t of every line, clipped to its [lo, hi]."""
+    best, where, best_t = -np.inf, None, 0.0
+    feasible = lo <= hi
+    for t in candidates:
+        t = np.clip(np.nan_to_num(t, nan=0.0), lo, np.maximum(lo, hi))
+        values = np.where(feasible, score(t), -np.inf)
+        i = np.unravel_index(int(np.argmax(values)), values.shape)
+        if values[i] > best:
+            best, where, best_t = float(values[i]), i, float(t[i])
+    return best, where, best_t
+
+def _linear_set(utility_functions: Sequence[Any], outcome_space: Any) -> Optional[_LinearBargainingSet]:
+    """The analytic bargaining set if both utilities are linear additive (cached ones included)."""
+    if len(utility_functions) != 2:
+        return None
+    unwrapped = [u.utility if isinstance(u, CachedUtility) else u for u in utility_functions]
+    if not all(isinstance(u, LinearAdditiveUtility) for u in unwrapped):
+        return None
+    bargaining_set = _LinearBargainingSet(unwrapped, outcome_space)
+    return bargaining_set if bargaining_set.supported else None
+
+def _space_frontier(utility_functions: Sequence[Any], outcome_space: Any, resolution: Any, chunk_size: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Fallback: the streamed frontier, with continuous issues on a 1001-point grid unless told otherwise."""
+    if resolution is None:
+        resolution = {
+            issue.name: (issue.max_value - issue.min_value) / 1000 or 1.0
+            for issue in outcome_space.issues if issue.type != 'discrete'
+        }
+    return space_pareto_frontier(outcome_space, utility_functions, resolution, chunk_size)
+
+def _frontier_point(outcome_space: Any, rows: np.ndarray, utils: np.ndarray, values: np.ndarray) -> Optional[BargainingPoint]:
+    if values.size == 0 or not np.isfinite(values).any():
+        return None
+    i = int(np.argmax(np.where(np.isfinite(values), values, -np.inf)))
+    outcome = outcome_space.compile().decode(rows[i])
+    return BargainingPoint(outcome, tuple(utils[i].tolist()), float(values[i]))
+
+def nash_point(
+    utility_functions: Sequence[Callable[[Any], float]],
+    outcome_space: Any,
+    disagreement: Optional[Sequence[float]] = None,
+    resolution: Optional[Union[float, Dict[str, float]]] = None,
+    chunk_size: int = 65_536
+) -> Optional[BargainingPoint]:
+    """
+    Outcome maximizing the Nash product prod(u_i - d_i) over the outcomes where every agent gains.
+    None if there is no such outcome.
+
+    Two LinearAdditiveUtility agents are solved from their weights and curves (continuous issues
+    exactly, see _LinearBargainingSet). Anything else searches the streamed frontier of the space,
+    with continuous issues discretized at `resolution` (1001 points per issue by default).
+    """
+    d = np.zeros(len(utility_functions)) if disagreement is None else np.asarray(disagreement, dtype=np.float64)
+    bargaining_set = _linear_set(utility_functions, outcome_space)
+    if bargaining_set is None:
+        rows, utils = _space_frontier(utility_functions, outcome_space, resolution, chunk_size)
+        gains = utils - d
+        values = np.where((gains > 0).all(axis=1), gains.prod(axis=1), -np.inf)
+        return _frontier_point(outcome_space, rows, utils, values)
+
+    a0, a1, b0, b1 = bargaining_set.lines(d)
+    lo, hi = _rational_range(a0, a1, b0, b1)
+    # (a0 + a1 t)(b0 + b1 t) peaks where its derivative vanishes
+    with np.errstate(divide='ignore', invalid='ignore'):
+        peak = -(a0 * b1 + b0 * a1) / (2 * a1 * b1)
+    value, where, t = _best_on_lines(lambda t: (a0 + a1 * t) * (b0 + b1 * t), [lo, hi, peak], lo, hi)
+    if where is None or value <= 0:
+        return None
+    combo, segment = where
+    utilities = (float(a0[where] + a1[where] * t + d[0]), float(b0[where] + b1[where] * t + d[1]))
+    return BargainingPoint(bargaining_set.outcome(combo, segment, t), utilities, value)
+
+def kalai_smorodinsky_point(
+    utility_functions: Sequence[Callable[[Any], float]],
+    outcome_space: Any,
+    disagreement: Optional[Sequence[float]] = None,
+    resolution: Optional[Union[float, Dict[str, float]]] = None,
+    chunk_size: int = 65_536
+) -> Optional[BargainingPoint]:
+    """
+    Kalai-Smorodinsky point: the outcome maximizing min_i (u_i - d_i) / (ideal_i - d_i), where ideal_i
+    is the best utility agent i can get without leaving another agent below its disagreement value.
+    On a continuous frontier, that is where every agent gets the same share of its ideal gain.
+    None if some agent cannot gain at all. Same solvers as nash_point().
+    """
+    d = np.zeros(len(utility_functions)) if disagreement is None else np.asarray(disagreement, dtype=np.float64)
+    bargaining_set = _linear_set(utility_functions, outcome_space)
+    if bargaining_set is None:
+        rows, utils = _space_frontier(utility_functions, outcome_space, resolution, chunk_size)
+        gains = utils - d
+        rational = (gains >= 0).all(axis=1)
+        if not rational.any():
+            return None
+        ideal = gains[rational].max(axis=0)
+        if (ideal <= 0).any():
+            return None
+        values = np.where(rational, (gains / ideal).min(axis=1), -np.inf)
+        return _frontier_point(outcome_space, rows, utils, values)
+
+    a0, a1, b0, b1 = bargaining_set.lines(d)
+    lo, hi = _rational_range(a0, a1, b0, b1)
+    ideal_a, _, _ = _best_on_lines(lambda t: a0 + a1 * t, [lo, hi], lo, hi)
+    ideal_b, _, _ = _best_on_lines(lambda t: b0 + b1 * t, [lo, hi], lo, hi)
+    if not (ideal_a > 0 and ideal_b > 0):
+        return None
+
+    # Normalized gains alpha(t), beta(t): the min peaks at an end or where they cross
+    with np.errstate(divide='ignore', invalid='ignore'):
+        cross = (b0 / ideal_b - a0 / ideal_a) / (a1 / ideal_a - b1 / ideal_b)
+    value, where, t = _best_on_lines(
+        lambda t: np.minimum((a0 + a1 * t) / ideal_a, (b0 + b1 * t) / ideal_b), [lo, hi, cross], lo, hi
+    )
+    combo, segment = where
+    utilities = (float(a0[where] + a1[where] * t + d[0]), float(b0[where] + b1[where] * t + d[1]))
+    return BargainingPoint(bargaining_set.outcome(combo, segment, t), utilities, value)
@@ -1,12 +1,38 @@
-from typing import Dict, Any, Optional, Union
+from typing import Dict, Any, Optional, Union, List, Sequence
+import numpy as np
 from pydantic import BaseModel, PrivateAttr
 from manta.core.outcomes import OutcomeSpace, Outcome
+from manta.core.value_functions import (
+    ValueFunction, DiscreteValueFunction, PiecewiseLinearValueFunction,
+    ExponentialValueFunction, SigmoidValueFunction, GaussianValueFunction
+)
+
+# Default scores for the demo's discrete issues (Best=1.0).
+# Used for 'service' and 'duration' when no explicit mapping was registered via add_discrete().
+DEFAULT_SCORE_MAP: Dict[str, float] = {
+    'enterprise': 1.0, 'premium': 0.5, 'standard': 0.0, # Service
+    '3_years': 1.0, '1_year': 0.0                      # Duration
+}
+DEFAULT_MAPPED_ISSUES = ('service', 'duration')
 
 class LinearAdditiveUtility(BaseModel):
     weights: Dict[str, float]
-    outcome_space: Optional[OutcomeSpace] = None 
-    
+    outcome_space: Optional[OutcomeSpace] = None
+    bias: float = 0.0 # Constant added to every outcome
+
     _curves: Dict[str, Any] = PrivateAttr(default_factory=dict)
+    # Cached NumPy form of the curves for calculate_batch (see _compile)
+    _compiled: Optional[Dict[str, Any]] = PrivateAttr(default=None)
+    # Cached IsoUtilityIndex for the analytical MESO solver (see manta.core.meso)
+    _iso_index: Optional[Any] = PrivateAttr(default=None)
+
+    def __init__(self, weights: Optional[Dict[str, float]] = None, value_functions: Optional[Dict[str, ValueFunction]] = None, **data):
+        """Also accepts LinearAdditiveUtility(weights, {issue: ValueFunction}, bias=...)."""
+        if weights is not None:
+            data['weights'] = weights
+        super().__init__(**data)
+        for issue, function in (value_functions or {}).items():
+            self.add_value_function(issue, self.weights.get(issue, 0.0), function)
 
     def add_curve(self, issue: str, weight: float, min_val: float = None, max_val: float = None, invert: bool = False):
         """Define a continuous curve (Price)."""
@@ -23,6 +49,7 @@ class LinearAdditiveUtility(BaseModel):
             "max": max_val,
             "invert": invert
         }
+        self._invalidate()
 
     ### NEW: Method to add discrete mappings (Strings -> Score)
     def add_discrete(self, issue: str, weight: float, mapping: Dict[str, float]):
@@ -32,52 +59,155 @@ class LinearAdditiveUtility(BaseModel):
             "weight": weight,
             "mapping": mapping
         }
+        self._invalidate()
+
+    def add_value_function(self, issue: str, weight: float, function: ValueFunction):
+        """Score an issue with any ValueFunction (tables, piecewise-linear, exponential, sigmoid, Gaussian)."""
+        self._curves[issue] = {
+            "type": "function",
+            "weight": weight,
+            "function": function
+        }
+        self._invalidate()
+
+    def _invalidate(self):
+        """Drops the caches derived from the curves."""
+        self._compiled = None
+        self._iso_index = None
+
+    def _contribution(self, issue: str, value: Any) -> float:
+        """Weighted score contributed by a single issue value."""
+        curve = self._curves.get(issue)
+        weight = self.weights.get(issue, 0.0)
 
-    # INSIDE CLASS LinearAdditiveUtility:
+        # --- CONTINUOUS LOGIC (PRICE) ---
+        if curve and curve.get('type') == 'linear':
+            rng = curve['max'] - curve['min']
+            if rng == 0:
+                norm = 1.0
+            else:
+                norm = (float(value) - curve['min']) / rng
+                norm = max(0.0, min(1.0, norm))
+
+            if curve['invert']:
+                norm = 1.0 - norm
+
+            return weight * norm
+
+        if curve and curve.get('type') == 'function':
+            return weight * curve['function'](value)
+
+        # --- DISCRETE LOGIC (SERVICE, DURATION, etc.) ---
+        # Explicit mappings win; otherwise fall back to the demo's default score map
+        if curve and curve.get('type') == 'discrete':
+            return weight * curve['mapping'].get(value, 0.0)
+        if issue in DEFAULT_MAPPED_ISSUES:
+            return weight * DEFAULT_SCORE_MAP.get(value, 0.0)
+
+        return 0.0
 
     def calculate(self, outcome: Outcome) -> float:
-        total_util = 0.0
-        
-        # Determine the effective weight for non-continuous issues
-        w_service = self.weights.get('service', 0.0)
-        w_duration = self.weights.get('duration', 0.0)
-        
+        total_util = self.bias
+
         for issue, value in outcome.items():
             if issue not in self._curves and issue not in self.weights:
                 continue
-                
-            curve = self._curves.get(issue)
-            weight = self.weights.get(issue, 0.0)
-            
-            # --- CONTINUOUS LOGIC (PRICE) ---
-            if curve and curve.get('type') == 'linear':
-                # (Keep existing calculation for min/max/invert here)
-                rng = curve['max'] - curve['min']
+            total_util += self._contribution(issue, value)
+
+        return total_util
+
+    def __call__(self, outcome: Outcome) -> float:
+        return self.calculate(outcome)
+
+    # --- BATCH (VECTORIZED) EVALUATION ---
+
+    def _compile(self) -> Dict[str, Any]:
+        """
+        Compiles the curves into NumPy arrays, one column per issue of the outcome space:
+        - discrete issues become a lookup table (value code -> weighted score),
+        - linear curves become (weight, min, range, invert) parameters,
+        - anything else is scored per value through _contribution.
+        The result is cached until the curves or weights change.
+        """
+        if self.outcome_space is None:
+            raise ValueError("calculate_batch requires an outcome_space to define the column layout.")
+
+        if self._compiled is not None and self._compiled['weights'] == self.weights:
+            return self._compiled
+
+        tables: List[Any] = []
+        for issue in self.outcome_space.issues:
+            name = issue.name
+            curve = self._curves.get(name)
+
+            if name not in self._curves and name not in self.weights:
+                tables.append(None)
+            elif issue.type == 'discrete':
+                # Last slot scores missing/unknown values (code -1) as 0.0
+                scores = [self._contribution(name, v) for v in issue.values] + [0.0]
+                tables.append(('lookup', np.array(scores, dtype=np.float64)))
+            elif curve and curve.get('type') == 'linear':
+                tables.append(('linear', (
+                    self.weights.get(name, 0.0),
+                    curve['min'],
+                    curve['max'] - curve['min'],
+                    curve['invert']
+                )))
+            elif curve and curve.get('type') == 'function':
+                tables.append(('function', (self.weights.get(name, 0.0), curve['function'])))
+            else:
+                tables.append(('generic', name))
+
+        self._compiled = {'weights': dict(self.weights), 'tables': tables}
+        return self._compiled
+
+    def calculate_batch(self, outcomes: Union[np.ndarray, Sequence[Outcome]]) -> np.ndarray:
+        """
+        Scores a whole batch of outcomes in one vectorized pass.
+
+        Args:
+            outcomes: Either a list of outcome dicts, or a 2D array already encoded with
+                      outcome_space.compile() (see CompiledOutcomeSpace).
+
+        Returns:
+            1D array of utilities, matching calculate() for every outcome.
+        """
+        compiled = self._compile()
+        if isinstance(outcomes, np.ndarray):
+            encoded = outcomes
+        else:
+            encoded = self.outcome_space.compile().encode_batch(outcomes)
+
+        issues = self.outcome_space.issues
+        total_util = np.full(encoded.shape[0], self.bias, dtype=np.float64)
+
+        for j, table in enumerate(compiled['tables']):
+            if table is None:
+                continue
+            kind, params = table
+            col = encoded[:, j]
+            missing = np.isnan(col)
+
+            if kind == 'lookup':
+                codes = np.where(missing, -1, col).astype(np.intp)
+                total_util += params[codes]
+            elif kind == 'linear':
+                weight, lo, rng, invert = params
                 if rng == 0:
-                    norm = 1.0
+                    norm = np.ones_like(col)
                 else:
-                    norm = (float(value) - curve['min']) / rng
-                    norm = max(0.0, min(1.0, norm))
-                
-                if curve['invert']:
+                    norm = np.clip((col - lo) / rng, 0.0, 1.0)
+                if invert:
                     norm = 1.0 - norm
-                
-                total_util += weight * norm
-            
-            # --- DISCRETE LOGIC (SERVICE, DURATION, etc.) ---
-            # This logic must handle the string-to-value mapping internally
-            elif issue == 'service' or issue == 'duration':
-                # Note: This is simplified based on your demo's assumed utility (Best=1.0)
-                score_map = {
-                    'enterprise': 1.0, 'premium': 0.5, 'standard': 0.0, # Service
-                    '3_years': 1.0, '1_year': 0.0                      # Duration
-                }
-                
-                # Check the exact value and get score contribution
-                norm = score_map.get(value, 0.0)
-                total_util += weight * norm
-            
-        return total_util
+                total_util += np.where(missing, 0.0, weight * norm)
+            elif kind == 'function':
+                weight, function = params
+                total_util += np.where(missing, 0.0, weight * function.evaluate(np.where(missing, 0.0, col)))
+            else:
+                name = issues[j].name
+                total_util += np.fromiter(
+                    (0.0 if m else self._contribution(name, v) for v, m in zip(col, missing)),
+                    dtype=np.float64, count=col.shape[0]
+                )
 
-    def __call__(self, outcome: Outcome) -> float:
-        return self.calculate(outcome)
\ No newline at end of file
+        return total_util
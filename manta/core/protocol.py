@@ -0,0 +1,79 @@
+import asyncio
+import inspect
+import math
+from time import perf_counter
+from typing import Any, Awaitable, List, Literal, Optional, Sequence, Union
+from pydantic import BaseModel, Field
+
+from manta.core.agent import BaseAgent, AgentState, AgentResult
+from manta.utils.logging import LatencyHistogram
+
+AcceptanceRule = Literal["unanimity", "quorum"]
+
+class MultilateralProtocol(BaseModel):
+    """
+    Multilateral negotiation protocol (set it as NegotiationConfig.protocol).
+
+    Agents propose in turn (round-robin). Every proposal is broadcast to all the other agents,
+    whose respond() calls run concurrently, so a round lasts as long as the slowest responder
+    instead of the sum of all of them. The round's responses are then combined:
+    - unanimity: the proposal is accepted when every responder accepts it.
+    - quorum: it is accepted when at least `quorum` (a fraction) of the responders accept it.
+    An 'end' response from any responder breaks the negotiation, as in alternating offers.
+    """
+    rule: AcceptanceRule = "unanimity"
+    quorum: float = Field(default=0.5, gt=0.0, le=1.0) # Only used by the 'quorum' rule
+
+    def required(self, n_responders: int) -> int:
+        """Number of 'accept' responses needed out of n_responders."""
+        if self.rule == "unanimity":
+            return n_responders
+        return max(1, math.ceil(self.quorum * n_responders - 1e-9))
+
+    def decide(self, responses: Sequence[str], n_responders: Optional[int] = None) -> str:
+        """
+        Outcome of a round: 'accept', 'reject' or 'end'. `n_responders` (default: one per
+        response) counts responders that did not answer, which never accept.
+        """
+        if "end" in responses:
+            return "end"
+        n_responders = len(responses) if n_responders is None else n_responders
+        accepted = sum(response == "accept" for response in responses)
+        return "accept" if n_responders > 0 and accepted >= self.required(n_responders) else "reject"
+
+    def responders(self, n_agents: int, proposer_idx: int) -> List[int]:
+        """Indices of every agent but the proposer, in turn order after it."""
+        return [(proposer_idx + offset) % n_agents for offset in range(1, n_agents)]
+
+if hasattr(asyncio, "timeout"):
+    async def bounded(awaitable: Awaitable[Any], timeout: float) -> Any:
+        """asyncio.wait_for(awaitable, timeout), without wait_for's extra task per call (Python 3.11+)."""
+        async with asyncio.timeout(timeout):
+            return await awaitable
+else:
+    bounded = asyncio.wait_for
+
+async def _respond(agent: BaseAgent, state: AgentState, timer: Optional[LatencyHistogram], timeout: Optional[float]) -> AgentResult:
+    if timer is not None: t_call = perf_counter()
+    result = agent.respond(state)
+    if inspect.isawaitable(result):
+        result = await (result if timeout is None else bounded(result, timeout))
+    if timer is not None: timer.record(perf_counter() - t_call)
+    return result
+
+async def broadcast(
+    responders: Sequence[BaseAgent],
+    states: Sequence[AgentState],
+    timers: Optional[Sequence[LatencyHistogram]] = None,
+    timeout: Optional[float] = None
+) -> List[Union[AgentResult, BaseException]]:
+    """
+    Awaits every responder's respond() concurrently (asyncio.gather), each with its own state.
+    With a `timeout`, calls still running after that many seconds are cancelled.
+    Returns the results in responder order; an agent that raised (or timed out, with
+    asyncio.TimeoutError) gets its exception instead.
+    """
+    return await asyncio.gather(
+        *(_respond(agent, state, timers[i] if timers is not None else None, timeout) for i, (agent, state) in enumerate(zip(responders, states))),
+        return_exceptions=True
+    )
@@ -1,6 +1,48 @@
+from typing import Literal, Dict, List, Optional, Sequence, Tuple, Union
+import numpy as np
+from pydantic import BaseModel, Field, PrivateAttr
 
-from typing import Literal
-from pydantic import BaseModel, Field
+# Beta (the 'Toughness' factor) of each style:
+# High Beta (>1) = Tough (Stays high for long time)
+# Low Beta (<1) = Soft (Drops quickly)
+STYLE_BETAS: Dict[str, float] = {
+    "boulware": 5.0, # Very Tough: At 50% time, we only drop 3% of the way
+    "linear": 1.0,
+    "conceder": 0.2, # Very Soft: At 50% time, we dropped 87% of the way
+}
+
+ArrayLike = Union[float, Sequence[float], np.ndarray]
+
+def concession_targets(progress: ArrayLike, start: ArrayLike, reservation: ArrayLike, beta: ArrayLike) -> np.ndarray:
+    """
+    Vectorized ConcessionStrategy.get_target: all arguments broadcast against each other, e.g.
+    one progress value for a population of agents (per-agent start/reservation/beta arrays),
+    or a grid of progress values (shape (steps,)) against agents (shape (n, 1)).
+    Matches get_target() up to floating-point rounding (NumPy's pow may differ by 1 ulp).
+    """
+    t = np.clip(np.asarray(progress, dtype=np.float64), 0.0, 1.0)
+    start = np.asarray(start, dtype=np.float64)
+    reservation = np.asarray(reservation, dtype=np.float64)
+    target = start + (reservation - start) * np.power(t, beta)
+    return np.maximum(target, reservation)
+
+def strategy_params(strategies: Sequence['ConcessionStrategy']) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """(start, reservation, beta) arrays for a population of strategies, ready for concession_targets."""
+    start = np.fromiter((s.start_utility for s in strategies), dtype=np.float64, count=len(strategies))
+    reservation = np.fromiter((s.reservation_value for s in strategies), dtype=np.float64, count=len(strategies))
+    beta = np.fromiter((s.beta for s in strategies), dtype=np.float64, count=len(strategies))
+    return start, reservation, beta
+
+def target_table(strategies: Sequence['ConcessionStrategy'], max_steps: int) -> np.ndarray:
+    """
+    (n_agents, max_steps + 1) table of targets: row i, column s is agent i's target at step s
+    (progress = s / max_steps). One NumPy call for the whole population.
+    """
+    if max_steps < 1:
+        raise ValueError("max_steps must be at least 1.")
+    start, reservation, beta = strategy_params(strategies)
+    progress = np.arange(max_steps + 1, dtype=np.float64) / max_steps
+    return concession_targets(progress[None, :], start[:, None], reservation[:, None], beta[:, None])
 
 class ConcessionStrategy(BaseModel):
     """
@@ -12,11 +54,18 @@ class ConcessionStrategy(BaseModel):
     # - Linear: Soft negotiator
     # - Conceder: Medium negotiator
     style: Literal["boulware", "linear", "conceder"] = "linear"
-    
+
     # The Range
     start_utility: float = 1.0  # Where we start (Dream deal)
     reservation_value: float = 0.5  # Where we walk away (Worst case)
-    
+
+    # Targets per step, filled by precompute() (see target_at)
+    _table: Optional[List[float]] = PrivateAttr(default=None)
+
+    @property
+    def beta(self) -> float:
+        return STYLE_BETAS[self.style]
+
     def get_target(self, progress: float) -> float:
         """
         Calculates target utility based on progress (0.0 to 1.0).
@@ -24,17 +73,33 @@ class ConcessionStrategy(BaseModel):
         """
         # Clamp progress to 0-1
         t = max(0.0, min(1.0, progress))
-        
-        # Determine Beta (The 'Toughness' factor) based on Style
-        # High Beta (>1) = Tough (Stays high for long time)
-        # Low Beta (<1) = Soft (Drops quickly)
-        beta = 1.0
-        if self.style == "boulware":
-            beta = 5.0 # Very Tough: At 50% time, we only drop 3% of the way
-        elif self.style == "conceder":
-            beta = 0.2 # Very Soft: At 50% time, we dropped 87% of the way
-            
+
         # The Concession Math
-        target = self.start_utility + (self.reservation_value - self.start_utility) * (t ** beta)
-        
-        return max(target, self.reservation_value)
\ No newline at end of file
+        target = self.start_utility + (self.reservation_value - self.start_utility) * (t ** self.beta)
+
+        return max(target, self.reservation_value)
+
+    def get_targets(self, progress: ArrayLike) -> np.ndarray:
+        """get_target over an array of progress values, in one NumPy call."""
+        return concession_targets(progress, self.start_utility, self.reservation_value, self.beta)
+
+    def precompute(self, max_steps: int) -> np.ndarray:
+        """
+        Tabulates the target of every step 0..max_steps, so target_at() is a list lookup.
+        Call it again after changing the strategy's parameters.
+        """
+        table = target_table([self], max_steps)[0]
+        self._table = table.tolist()
+        return table
+
+    def target_at(self, step: int, max_steps: Optional[int] = None) -> float:
+        """
+        Target at a step: O(1) from the precompute() table (steps past the end get the final
+        target), or computed from step / max_steps when there is no table.
+        """
+        table = self._table
+        if table is not None:
+            return table[min(max(step, 0), len(table) - 1)]
+        if not max_steps:
+            raise ValueError("target_at() needs max_steps (or a precompute() table).")
+        return self.get_target(step / max_steps)
@@ -0,0 +1,189 @@
+import math
+from typing import Any, Dict, Optional, Sequence, Tuple
+import numpy as np
+
+class ValueFunction:
+    """
+    Maps the value of one issue to a score (usually in [0, 1]).
+
+    - __call__(x): one value; evaluate(xs): a whole array in one vectorized pass (subclasses
+      override __call__ with plain math where it matters: a one-element array costs microseconds).
+    - bounds(lo, hi): the smallest and largest score over [lo, hi].
+    - inverse(v, lo, hi): some x in [lo, hi] scoring exactly v (None if there is none).
+
+    `continuous` functions take every score between their bounds on an interval, which is what
+    lets the analytical MESO solver back-solve them (see manta.core.meso.IsoUtilityIndex).
+    """
+    continuous = True
+
+    def __call__(self, x: Any) -> float:
+        return float(self.evaluate(np.array([x], dtype=np.float64))[0])
+
+    def evaluate(self, xs: np.ndarray) -> np.ndarray:
+        raise NotImplementedError
+
+    def bounds(self, lo: float, hi: float) -> Tuple[float, float]:
+        """Monotone functions peak at the ends of the interval."""
+        a, b = self(lo), self(hi)
+        return (a, b) if a <= b else (b, a)
+
+    def inverse(self, v: float, lo: float = -math.inf, hi: float = math.inf) -> Optional[float]:
+        raise NotImplementedError
+
+def _within(x: float, lo: float, hi: float) -> Optional[float]:
+    """x clamped into [lo, hi] if it is there up to rounding, else None."""
+    slack = 1e-9 * max(1.0, abs(lo) if math.isfinite(lo) else 0.0, abs(hi) if math.isfinite(hi) else 0.0)
+    if lo - slack <= x <= hi + slack:
+        return min(hi, max(lo, x))
+    return None
+
+class DiscreteValueFunction(ValueFunction):
+    """A score table: {value: score}; values not in the table score `default`."""
+    continuous = False
+
+    def __init__(self, mapping: Dict[Any, float], default: float = 0.0):
+        self.mapping = dict(mapping)
+        self.default = default
+
+    def __call__(self, x: Any) -> float:
+        try:
+            return float(self.mapping.get(x, self.default))
+        except TypeError: # Unhashable value
+            return float(self.default)
+
+    def evaluate(self, xs: Sequence[Any]) -> np.ndarray:
+        return np.fromiter((self(x) for x in xs), dtype=np.float64, count=len(xs))
+
+    def bounds(self, lo: float = -math.inf, hi: float = math.inf) -> Tuple[float, float]:
+        scores = [s for x, s in self.mapping.items() if not isinstance(x, (int, float)) or lo <= x <= hi]
+        return (min(scores), max(scores)) if scores else (self.default, self.default)
+
+    def inverse(self, v: float, lo: float = -math.inf, hi: float = math.inf) -> Optional[Any]:
+        """The first value (in table order) scoring v."""
+        for x, s in self.mapping.items():
+            if s == v and (not isinstance(x, (int, float)) or lo <= x <= hi):
+                return x
+        return None
+
+class PiecewiseLinearValueFunction(ValueFunction):
+    """Straight lines between (x, score) points, flat beyond the first and last ones."""
+
+    def __init__(self, points: Sequence[Tuple[float, float]]):
+        points = sorted((float(x), float(v)) for x, v in points)
+        if not points:
+            raise ValueError("PiecewiseLinearValueFunction needs at least one point.")
+        self.xs = np.array([x for x, _ in points])
+        self.vs = np.array([v for _, v in points])
+
+    def evaluate(self, xs: np.ndarray) -> np.ndarray:
+        return np.interp(np.asarray(xs, dtype=np.float64), self.xs, self.vs)
+
+    def bounds(self, lo: float, hi: float) -> Tuple[float, float]:
+        inside = self.vs[(self.xs > lo) & (self.xs < hi)]
+        scores = np.concatenate((inside, self.evaluate(np.array([lo, hi]))))
+        return float(scores.min()), float(scores.max())
+
+    def inverse(self, v: float, lo: float = -math.inf, hi: float = math.inf) -> Optional[float]:
+        """The smallest x in [lo, hi] scoring v."""
+        # Knots inside [lo, hi], plus the ends (the function is flat past the outer knots)
+        xs = [lo] if math.isfinite(lo) else [float(self.xs[0])]
+        xs += [x for x in self.xs.tolist() if lo < x < hi]
+        xs += [hi] if math.isfinite(hi) else [float(self.xs[-1])]
+        vs = self.evaluate(np.array(xs)).tolist()
+        for x0, x1, v0, v1 in zip(xs[:-1], xs[1:], vs[:-1], vs[1:]):
+            if min(v0, v1) <= v <= max(v0, v1):
+                return x0 if v1 == v0 else _within(x0 + (v - v0) / (v1 - v0) * (x1 - x0), lo, hi)
+        return None
+
+class ExponentialValueFunction(ValueFunction):
+    """
+    Concave (rate > 0) or convex (rate < 0) growth from 0 at min_value to 1 at max_value, clipped
+    outside: (1 - exp(-rate * t)) / (1 - exp(-rate)) with t the position in [min_value, max_value].
+    invert=True mirrors it (1 at min_value, for costs). rate=0 is the linear curve.
+    """
+
+    def __init__(self, min_value: float, max_value: float, rate: float = 3.0, invert: bool = False):
+        if max_value <= min_value:
+            raise ValueError("ExponentialValueFunction needs min_value < max_value.")
+        self.min_value, self.max_value = min_value, max_value
+        self.rate = rate
+        self.invert = invert
+
+    def evaluate(self, xs: np.ndarray) -> np.ndarray:
+        t = np.clip((np.asarray(xs, dtype=np.float64) - self.min_value) / (self.max_value - self.min_value), 0.0, 1.0)
+        if self.invert:
+            t = 1.0 - t
+        if self.rate == 0:
+            return t
+        return -np.expm1(-self.rate * t) / -math.expm1(-self.rate)
+
+    def __call__(self, x: Any) -> float:
+        t = min(1.0, max(0.0, (float(x) - self.min_value) / (self.max_value - self.min_value)))
+        if self.invert:
+            t = 1.0 - t
+        return t if self.rate == 0 else math.expm1(-self.rate * t) / math.expm1(-self.rate)
+
+    def inverse(self, v: float, lo: float = -math.inf, hi: float = math.inf) -> Optional[float]:
+        if not 0.0 <= v <= 1.0:
+            return None
+        t = v if self.rate == 0 else -math.log1p(v * math.expm1(-self.rate)) / self.rate
+        if self.invert:
+            t = 1.0 - t
+        return _within(self.min_value + t * (self.max_value - self.min_value), lo, hi)
+
+class SigmoidValueFunction(ValueFunction):
+    """Logistic S-curve 1 / (1 + exp(-steepness * (x - midpoint))); a negative steepness decreases."""
+
+    def __init__(self, midpoint: float, steepness: float):
+        if steepness == 0:
+            raise ValueError("SigmoidValueFunction needs a non-zero steepness.")
+        self.midpoint = midpoint
+        self.steepness = steepness
+
+    def evaluate(self, xs: np.ndarray) -> np.ndarray:
+        z = self.steepness * (np.asarray(xs, dtype=np.float64) - self.midpoint)
+        return 0.5 * (1.0 + np.tanh(0.5 * z)) # Same as the logistic, without overflow
+
+    def __call__(self, x: Any) -> float:
+        return 0.5 * (1.0 + math.tanh(0.5 * self.steepness * (float(x) - self.midpoint)))
+
+    def inverse(self, v: float, lo: float = -math.inf, hi: float = math.inf) -> Optional[float]:
+        if not 0.0 < v < 1.0:
+            # The asymptotes are only reached (numerically) far out: accept an end that scores v
+            for end in (lo, hi):
+                if math.isfinite(end) and self(end) == v:
+                    return end
+            return None
+        return _within(self.midpoint + math.log(v / (1.0 - v)) / self.steepness, lo, hi)
+
+class GaussianValueFunction(ValueFunction):
+    """Bell curve exp(-((x - mean) / std)^2 / 2): 1 at the ideal value `mean`, falling off on both sides."""
+
+    def __init__(self, mean: float, std: float):
+        if std <= 0:
+            raise ValueError("GaussianValueFunction needs a positive std.")
+        self.mean = mean
+        self.std = std
+
+    def evaluate(self, xs: np.ndarray) -> np.ndarray:
+        z = (np.asarray(xs, dtype=np.float64) - self.mean) / self.std
+        return np.exp(-0.5 * z * z)
+
+    def __call__(self, x: Any) -> float:
+        z = (float(x) - self.mean) / self.std
+        return math.exp(-0.5 * z * z)
+
+    def bounds(self, lo: float, hi: float) -> Tuple[float, float]:
+        peak = self(min(hi, max(lo, self.mean)))
+        return min(self(lo), self(hi)), peak
+
+    def inverse(self, v: float, lo: float = -math.inf, hi: float = math.inf) -> Optional[float]:
+        """The branch below the mean if it is in [lo, hi], else the one above."""
+        if not 0.0 < v <= 1.0:
+            return None
+        offset = self.std * math.sqrt(-2.0 * math.log(v))
+        for x in (self.mean - offset, self.mean + offset):
+            inside = _within(x, lo, hi)
+            if inside is not None:
+                return inside
+        return None
@@ -0,0 +1,194 @@
+from collections.abc import Sequence
+from typing import List, Optional, Any, Dict, Iterator, Union
+import numpy as np
+
+from manta.core.outcomes import OutcomeSpace
+
+# Response codes stored in the `responses` column (same literals as AgentResult.response)
+RESPONSES = ("offer", "accept", "reject", "end", "wait")
+RESPONSE_CODES: Dict[str, int] = {r: i for i, r in enumerate(RESPONSES)}
+
+COLUMNS = ("steps", "proposers", "responders", "responses", "offers")
+
+class NegotiationHistory(Sequence):
+    """
+    Columnar, array-backed log of a negotiation.
+
+    Every record is stored as one row of fixed-width columns: step, proposer index, responder index,
+    response code and (when an outcome space is set) the first offer of the proposal, encoded with
+    CompiledOutcomeSpace. The proposal object itself is kept by reference.
+
+    With a `capacity`, the log is a ring buffer that keeps only the latest `capacity` records, so
+    memory stays flat however long the negotiation runs. Without one, columns grow by doubling.
+
+    Indexing and iteration return the same dicts the runner used to append:
+        {"step", "proposer", "proposal", "responder", "response"}
+    """
+
+    def __init__(self, capacity: Optional[int] = None, outcome_space: Optional[OutcomeSpace] = None):
+        if capacity is not None and capacity < 1:
+            raise ValueError("capacity must be a positive number of records (or None for unbounded).")
+        self.capacity = capacity
+        self.outcome_space = outcome_space
+        self._compiled = outcome_space.compile() if outcome_space is not None else None
+        self.names: List[str] = [] # Agent names, indexed by the proposer/responder columns
+        self._name_idx: Dict[str, int] = {}
+        self.total = 0 # Records ever appended (including the ones a ring buffer dropped)
+        self._allocate(capacity or 64)
+        self._view: Optional[HistoryView] = None
+
+    def _allocate(self, rows: int) -> None:
+        width = self._compiled.width if self._compiled is not None else 0
+        self._steps = np.zeros(rows, dtype=np.int64)
+        self._proposers = np.zeros(rows, dtype=np.int32)
+        self._responders = np.zeros(rows, dtype=np.int32)
+        self._responses = np.zeros(rows, dtype=np.int8)
+        self._offers = np.full((rows, width), np.nan, dtype=np.float64)
+        self._proposals: List[Any] = [None] * rows
+
+    def _grow(self) -> None:
+        rows = self._steps.shape[0] * 2
+        for name in ("_steps", "_proposers", "_responders", "_responses", "_offers"):
+            old = getattr(self, name)
+            new = np.full((rows,) + old.shape[1:], np.nan, dtype=old.dtype) if name == "_offers" else np.zeros(rows, dtype=old.dtype)
+            new[:old.shape[0]] = old
+            setattr(self, name, new)
+        self._proposals.extend([None] * (rows - len(self._proposals)))
+
+    def configure(self, capacity: Optional[int] = None, outcome_space: Optional[OutcomeSpace] = None) -> None:
+        """Changes the capacity/encoding, keeping the (latest) records already stored."""
+        records = list(self)
+        self.__init__(capacity=capacity, outcome_space=outcome_space)
+        for record in records:
+            self.append(record)
+
+    # --- Writing ---
+
+    def _agent_index(self, name: str) -> int:
+        idx = self._name_idx.get(name)
+        if idx is None:
+            idx = self._name_idx[name] = len(self.names)
+            self.names.append(name)
+        return idx
+
+    def append(self, record: Dict[str, Any]) -> None:
+        """Appends one runner record (see class docstring)."""
+        if self.capacity is not None:
+            row = self.total % self.capacity
+        else:
+            row = self.total
+            if row == self._steps.shape[0]:
+                self._grow()
+
+        proposal = record["proposal"]
+        self._steps[row] = record["step"]
+        self._proposers[row] = self._agent_index(record["proposer"])
+        self._responders[row] = self._agent_index(record["responder"])
+        self._responses[row] = RESPONSE_CODES.get(record["response"], -1)
+        self._proposals[row] = proposal
+
+        if self._compiled is not None:
+            offer = proposal[0] if isinstance(proposal, list) and proposal else proposal
+            try:
+                self._offers[row] = self._compiled.encode(offer) if isinstance(offer, dict) else np.nan
+            except (TypeError, ValueError): # Malformed proposal (e.g. a string price): the raw object is still kept
+                self._offers[row] = np.nan
+        self.total += 1
+
+    # --- Reading ---
+
+    def __len__(self) -> int:
+        return min(self.total, self.capacity) if self.capacity is not None else self.total
+
+    def _row(self, i: int) -> int:
+        """Physical row of the i-th retained record (chronological order)."""
+        n = len(self)
+        if i < 0:
+            i += n
+        if not 0 <= i < n:
+            raise IndexError("history index out of range")
+        record_no = self.total - n + i
+        return record_no % self.capacity if self.capacity is not None else record_no
+
+    def _record(self, row: int) -> Dict[str, Any]:
+        code = int(self._responses[row])
+        return {
+            "step": int(self._steps[row]),
+            "proposer": self.names[self._proposers[row]],
+            "proposal": self._proposals[row],
+            "responder": self.names[self._responders[row]],
+            "response": RESPONSES[code] if code >= 0 else None
+        }
+
+    def __getitem__(self, i: Union[int, slice]) -> Any:
+        if isinstance(i, slice):
+            return [self._record(self._row(j)) for j in range(*i.indices(len(self)))]
+        return self._record(self._row(i))
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        for i in range(len(self)):
+            yield self._record(self._row(i))
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, (Sequence, list)) and not isinstance(other, str):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"NegotiationHistory(len={len(self)}, total={self.total}, capacity={self.capacity})"
+
+    def column(self, name: str) -> np.ndarray:
+        """
+        Read-only column in chronological order: 'steps', 'proposers', 'responders', 'responses'
+        or 'offers'. Zero-copy unless a ring buffer has wrapped around.
+        """
+        if name not in COLUMNS:
+            raise KeyError(f"Unknown column '{name}'. Available: {COLUMNS}")
+        data = getattr(self, f"_{name}")
+        n = len(self)
+        if self.capacity is not None and self.total > self.capacity:
+            start = self.total % self.capacity
+            out = np.concatenate((data[start:], data[:start]))
+        else:
+            out = data[:n]
+        out.flags.writeable = False
+        return out
+
+    def view(self) -> 'HistoryView':
+        """Read-only, zero-copy view for agents (live: it sees records appended later)."""
+        if self._view is None:
+            self._view = HistoryView(self)
+        return self._view
+
+class HistoryView(Sequence):
+    """Read-only window on a NegotiationHistory. Handed to agents through AgentState.history."""
+    __slots__ = ("_history",)
+
+    def __init__(self, history: NegotiationHistory):
+        self._history = history
+
+    def __len__(self) -> int:
+        return len(self._history)
+
+    def __getitem__(self, i: Union[int, slice]) -> Any:
+        return self._history[i]
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return iter(self._history)
+
+    def __eq__(self, other: Any) -> bool:
+        return self._history.__eq__(other)
+
+    def __repr__(self) -> str:
+        return f"HistoryView({self._history!r})"
+
+    @property
+    def names(self) -> List[str]:
+        return list(self._history.names)
+
+    @property
+    def total(self) -> int:
+        return self._history.total
+
+    def column(self, name: str) -> np.ndarray:
+        return self._history.column(name)
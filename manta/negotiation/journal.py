@@ -0,0 +1,331 @@
+"""
+Append-only binary journal of a negotiation, with checkpoint/resume and compaction.
+
+File layout: MAGIC, then frames of `<length:u32><crc32:u32><kind:u8><payload>`:
+- HEADER   (JSON) the NegotiationConfig and the agent names, always the first frame,
+- SNAPSHOT (JSON) the state and latest history records at the last compaction,
+- STEP     (binary) one per completed step: step number, proposer, the proposal, and the
+           (responder, response) pairs of that step (one pair in alternating offers),
+- END      (JSON) final status, written when the negotiation finishes.
+
+Proposals that are plain outcomes (or MESO lists of them) are stored encoded with
+CompiledOutcomeSpace (8 bytes per issue); anything else falls back to JSON.
+
+A frame is only trusted if it is complete and its CRC matches, so a worker dying mid-write
+loses at most the step being written: recover() replays the journal up to the last complete
+step and returns a Runner that resume()s from there.
+"""
+import json
+import math
+import os
+import struct
+import time
+import zlib
+from typing import Any, BinaryIO, Dict, List, Literal, Optional, Tuple
+import numpy as np
+
+from manta.core.agent import BaseAgent
+from manta.negotiation.history import NegotiationHistory, RESPONSES, RESPONSE_CODES
+from manta.negotiation.runner import Runner, NegotiationConfig, NegotiationState
+from manta.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+MAGIC = b"MNTJ\x01"
+HEADER, SNAPSHOT, STEP, END = 1, 2, 3, 4
+
+_FRAME = struct.Struct("<II") # length and crc32 of (kind + payload)
+_STEP = struct.Struct("<qHH") # step, proposer index, number of responses
+_RESPONSE = struct.Struct("<HB") # responder index, response code
+_COUNT = struct.Struct("<H")
+
+# Proposal encodings
+_NONE, _OUTCOME, _OUTCOMES, _JSON = 0, 1, 2, 3
+
+
+# --- 1. PROPOSAL ENCODING ---
+
+class _ProposalCodec:
+    """Packs proposals as CompiledOutcomeSpace rows when that is lossless, else as JSON."""
+
+    def __init__(self, config: NegotiationConfig):
+        self.compiled = config.outcome_space.compile()
+        self.discrete: List[bool] = self.compiled.discrete_mask.tolist()
+        self.row = struct.Struct(f"<{self.compiled.width}d")
+
+    def _encode(self, outcome: Any) -> Optional[List[float]]:
+        """The CompiledOutcomeSpace row of an outcome, or None if it would not decode back to it."""
+        if not isinstance(outcome, dict):
+            return None
+        compiled = self.compiled
+        row = [math.nan] * compiled.width
+        for key, value in outcome.items():
+            j = compiled.index.get(key)
+            if j is None:
+                return None
+            if self.discrete[j]:
+                code = compiled.code(j, value)
+                if code < 0:
+                    return None
+                row[j] = code
+            elif type(value) in (float, int):
+                row[j] = value
+            else:
+                return None
+        return row
+
+    def pack(self, proposal: Any) -> bytes:
+        if proposal is None:
+            return bytes((_NONE,))
+        row = self._encode(proposal)
+        if row is not None:
+            return bytes((_OUTCOME,)) + self.row.pack(*row)
+        if isinstance(proposal, list) and len(proposal) < 65536:
+            rows = [self._encode(outcome) for outcome in proposal]
+            if all(row is not None for row in rows):
+                return b"".join([bytes((_OUTCOMES,)), _COUNT.pack(len(rows)), *(self.row.pack(*row) for row in rows)])
+        return bytes((_JSON,)) + json.dumps(proposal, default=str).encode()
+
+    def unpack(self, data: memoryview) -> Tuple[Any, int]:
+        """(proposal, bytes read)."""
+        tag = data[0]
+        if tag == _NONE:
+            return None, 1
+        if tag == _OUTCOME:
+            return self.compiled.decode(self.row.unpack_from(data, 1)), 1 + self.row.size
+        if tag == _OUTCOMES:
+            (count,) = _COUNT.unpack_from(data, 1)
+            size = count * self.row.size
+            rows = np.frombuffer(data[3:3 + size], dtype="<f8").reshape(count, self.compiled.width)
+            return self.compiled.decode_batch(rows), 3 + size
+        return json.loads(bytes(data[1:])), len(data)
+
+
+# --- 2. THE JOURNAL (a Runner observer) ---
+
+class NegotiationJournal:
+    """
+    Writes a Runner's negotiation to an append-only journal, one STEP frame per completed step.
+
+        journal = NegotiationJournal("deal-42.journal")
+        journal.attach(runner)          # before run(); writes the HEADER
+        await runner.run()              # STEP frames, then END
+
+        runner = NegotiationJournal.recover("deal-42.journal", agents=[buyer, seller])
+        await runner.resume()
+
+    - sync: 'flush' hands every frame to the OS (survives a process crash), 'fsync' also forces
+      it to disk (survives a machine crash), 'none' leaves it in Python's buffer.
+    - compact_every: after that many STEP frames the journal is rewritten as HEADER + SNAPSHOT
+      (state and the latest `keep` records), so its size stays bounded. None = never.
+    """
+
+    def __init__(self, path: str, sync: Literal["none", "flush", "fsync"] = "flush",
+                 compact_every: Optional[int] = 10_000, keep: int = 1_000):
+        self.path = path
+        self.sync = sync
+        self.compact_every = compact_every
+        self.keep = keep
+        self._file: Optional[BinaryIO] = None
+        self._runner: Optional[Runner] = None
+        self._codec: Optional[_ProposalCodec] = None
+        self._names: Dict[str, int] = {}
+        self._pending: List[Dict[str, Any]] = [] # Records of the step being played
+        self._expected = 1 # Records per complete step
+        self.steps_written = 0 # STEP frames since the last compaction
+        self.bytes_written = 0
+
+    # --- Writing ---
+
+    def attach(self, runner: Runner, resume: bool = False) -> Runner:
+        """Registers the journal as an observer of `runner`; starts a new file unless resuming."""
+        self._runner = runner
+        self._codec = _ProposalCodec(runner.config)
+        self._names = {agent.name: i for i, agent in enumerate(runner.agents)}
+        protocol = runner.config.protocol
+        self._expected = len(runner.agents) - 1 if protocol is not None else 1
+        if resume:
+            self._file = open(self.path, "ab")
+        else:
+            self._file = open(self.path, "wb")
+            self._file.write(MAGIC)
+            self._write_frame(HEADER, self._header())
+        if self not in runner.observers:
+            runner.observers.append(self)
+        return runner
+
+    def _header(self) -> bytes:
+        return json.dumps({
+            "config": self._runner.config.model_dump(mode="json"),
+            "agents": list(self._names),
+            "created": time.time(),
+        }).encode()
+
+    def _write_frame(self, kind: int, payload: bytes, file: Optional[BinaryIO] = None) -> None:
+        file = file or self._file
+        body = bytes((kind,)) + payload
+        file.write(_FRAME.pack(len(body), zlib.crc32(body)) + body)
+        self.bytes_written += _FRAME.size + len(body)
+        if self.sync != "none":
+            file.flush()
+            if self.sync == "fsync":
+                os.fsync(file.fileno())
+
+    def on_step(self, state: NegotiationState, record: Dict[str, Any]) -> None:
+        pending = self._pending
+        if pending and (record["step"] != pending[0]["step"] or record["proposer"] != pending[0]["proposer"]):
+            self._write_step() # A responder abstained: the previous step ended short
+        pending.append(record)
+        if len(pending) >= self._expected:
+            self._write_step()
+            if self.compact_every is not None and self.steps_written >= self.compact_every:
+                self.compact()
+
+    def _write_step(self) -> None:
+        records, self._pending = self._pending, []
+        first = records[0]
+        payload = b"".join([
+            _STEP.pack(first["step"], self._names[first["proposer"]], len(records)),
+            self._codec.pack(first["proposal"]),
+            *(_RESPONSE.pack(self._names[r["responder"]], RESPONSE_CODES.get(r["response"], 255)) for r in records),
+        ])
+        self._write_frame(STEP, payload)
+        self.steps_written += 1
+
+    def on_end(self, state: NegotiationState) -> None:
+        if self._pending:
+            self._write_step()
+        self._write_frame(END, json.dumps({
+            "status": state.status, "step": state.step, "current_offer": state.current_offer,
+        }, default=str).encode())
+
+    def compact(self) -> None:
+        """Rewrites the journal as HEADER + SNAPSHOT of the current state (atomic rename)."""
+        state = self._runner.state
+        history = state.history
+        records = history[max(0, len(history) - self.keep):] if self.keep else []
+        step = state.step
+        if state.status == "ongoing" and len(history) and history[-1]["step"] == step:
+            step += 1 # Called as the step completes, before the runner moves on (same as a STEP frame)
+        snapshot = json.dumps({
+            "step": step,
+            "status": state.status,
+            "current_offer": state.current_offer,
+            "current_proposer_id": state.current_proposer_id,
+            "records": records,
+        }, default=str).encode()
+
+        tmp = self.path + ".tmp"
+        with open(tmp, "wb") as f:
+            f.write(MAGIC)
+            self._write_frame(HEADER, self._header(), f)
+            self._write_frame(SNAPSHOT, snapshot, f)
+            f.flush()
+            os.fsync(f.fileno())
+        self._file.close()
+        os.replace(tmp, self.path)
+        self._file = open(self.path, "ab")
+        self.steps_written = 0
+        logger.debug("journal.compacted", path=self.path, step=state.step, size=os.path.getsize(self.path))
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    # --- Reading and recovery ---
+
+    @staticmethod
+    def read(path: str) -> Tuple[Dict[str, Any], List[Tuple[int, Any]]]:
+        """(header, [(kind, payload bytes)...]) of every complete, intact frame after the header."""
+        header, frames, _ = NegotiationJournal._scan(path)
+        return header, frames
+
+    @staticmethod
+    def _scan(path: str) -> Tuple[Dict[str, Any], List[Tuple[int, Any]], int]:
+        """read(), plus the size of the intact part of the file."""
+        with open(path, "rb") as f:
+            data = f.read()
+        if not data.startswith(MAGIC):
+            raise ValueError(f"{path} is not a negotiation journal.")
+
+        frames = []
+        offset = len(MAGIC)
+        while offset + _FRAME.size <= len(data):
+            length, crc = _FRAME.unpack_from(data, offset)
+            body = data[offset + _FRAME.size:offset + _FRAME.size + length]
+            if length == 0 or len(body) < length or zlib.crc32(body) != crc:
+                logger.warning("journal.truncated", path=path, offset=offset, size=len(data))
+                break # Torn write at the tail: everything after it is lost
+            frames.append((body[0], memoryview(body)[1:]))
+            offset += _FRAME.size + length
+
+        if not frames or frames[0][0] != HEADER:
+            raise ValueError(f"{path} has no journal header.")
+        return json.loads(bytes(frames[0][1])), frames[1:], offset
+
+    @classmethod
+    def replay(cls, path: str, config: Optional[NegotiationConfig] = None) -> Tuple[Dict[str, Any], NegotiationConfig, NegotiationState]:
+        """(header, config, state): the NegotiationState (history included) at the last complete step."""
+        header, frames = cls.read(path)
+        return (header, *cls._rebuild(header, frames, config))
+
+    @staticmethod
+    def _rebuild(header: Dict[str, Any], frames: List[Tuple[int, Any]], config: Optional[NegotiationConfig]) -> Tuple[NegotiationConfig, NegotiationState]:
+        config = config or NegotiationConfig.model_validate(header["config"])
+        names = header["agents"]
+        codec = _ProposalCodec(config)
+
+        state = NegotiationState(start_time=time.time())
+        state.history.configure(capacity=config.history_limit, outcome_space=config.outcome_space)
+        for kind, payload in frames:
+            if kind == SNAPSHOT:
+                snapshot = json.loads(bytes(payload))
+                state.history = NegotiationHistory(capacity=config.history_limit, outcome_space=config.outcome_space)
+                for record in snapshot.pop("records"):
+                    state.history.append(record)
+                for key, value in snapshot.items():
+                    setattr(state, key, value)
+            elif kind == STEP:
+                step, proposer, n_responses = _STEP.unpack_from(payload)
+                proposal, size = codec.unpack(payload[_STEP.size:len(payload) - n_responses * _RESPONSE.size])
+                offset = _STEP.size + size
+                responses = []
+                for _ in range(n_responses):
+                    responder, code = _RESPONSE.unpack_from(payload, offset)
+                    offset += _RESPONSE.size
+                    response = RESPONSES[code] if code < len(RESPONSES) else None
+                    responses.append(response)
+                    state.history.append({
+                        "step": step, "proposer": names[proposer], "proposal": proposal,
+                        "responder": names[responder], "response": response,
+                    })
+                # The step is complete: the offer is on the table, the next agent proposes
+                state.current_offer = proposal
+                state.current_proposer_id = names[proposer]
+                state.step = step + 1
+                outcome = config.protocol.decide(responses, len(names) - 1) if config.protocol is not None else responses[-1]
+                if outcome in ("accept", "end"):
+                    state.status, state.step = ("success" if outcome == "accept" else "broken"), step
+            elif kind == END:
+                end = json.loads(bytes(payload))
+                state.status, state.step = end["status"], end["step"]
+        return config, state
+
+    @classmethod
+    def recover(cls, path: str, agents: List[BaseAgent], config: Optional[NegotiationConfig] = None,
+                **journal_options: Any) -> Runner:
+        """
+        A Runner rebuilt from the journal, with the journal re-attached (appending), ready for
+        `await runner.resume()`. `agents` must be fresh agents with the journaled names, in order.
+        """
+        header, frames, intact = cls._scan(path)
+        if [agent.name for agent in agents] != header["agents"]:
+            raise ValueError(f"Agents {[a.name for a in agents]} do not match the journal's {header['agents']}.")
+        config, state = cls._rebuild(header, frames, config)
+        # Drop a torn tail, so the resumed run appends right after the last intact frame
+        with open(path, "r+b") as f:
+            f.truncate(intact)
+        runner = Runner(config=config, agents=agents, state=state)
+        cls(path, **journal_options).attach(runner, resume=True)
+        return runner
@@ -1,167 +1,611 @@
 import time
-import logging
+import inspect
 import asyncio
-from typing import List, Optional, Any, Literal
-from pydantic import BaseModel, Field
+import contextlib
+from time import perf_counter
+from typing import List, Optional, Any, Literal, Dict, Tuple
+from pydantic import BaseModel, Field, ConfigDict, field_serializer
 
 # Add OutcomeSpace here so the Config knows what it is
 from manta.core.outcomes import OutcomeSpace, Outcome
-from manta.core.agent import BaseAgent, AgentState, AgentResult
+from manta.core.agent import BaseAgent, AgentState, AgentResult, FastAgentState, validate_result
+from manta.core.protocol import MultilateralProtocol, bounded, broadcast
+from manta.negotiation.history import NegotiationHistory, RESPONSE_CODES
+from manta.utils.logging import NegotiationMetrics, LatencyHistogram, ProfileMode, current_metrics, instrument, get_logger
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
-logger = logging.getLogger(__name__)
+logger = get_logger(__name__)
+
+# What a timed-out agent call means (NegotiationConfig.timeout_policy)
+TimeoutPolicy = Literal["end", "skip", "default"]
 
 class NegotiationConfig(BaseModel):
     max_steps: Optional[int] = None
     time_limit: Optional[float] = None
     outcome_space: OutcomeSpace
 
+    # Turbo mode (simulation workloads):
+    # - no per-step sleep; yield to the event loop with sleep(0) every `yield_every` steps only,
+    # - one AgentState per negotiation, mutated in place (agents must not keep it between calls),
+    # - plain-function agents are called inline (Runner.run_sync() runs them without an event loop).
+    turbo: bool = False
+    yield_every: Optional[int] = None
+
+    # Keep only the latest N history records (ring buffer); None keeps everything
+    history_limit: Optional[int] = None
+
+    # Strict/debug mode: hand the agents validated AgentState models and validate every
+    # AgentResult they return. Off by default: the loop uses unvalidated FastAgentState objects
+    # and only checks the fields it reads (response, proposal).
+    strict: bool = False
+
+    # Instrumentation: per-agent propose/respond latency, step wall time and generate_meso time,
+    # stored as a snapshot in NegotiationState.metrics (see manta.utils.logging). Off = no timing.
+    # `profile` additionally captures a cProfile or tracemalloc report of the whole negotiation.
+    metrics: bool = False
+    profile: Optional[ProfileMode] = None
+
+    # Turn protocol: None = alternating offers (each proposal goes to the next agent only);
+    # a MultilateralProtocol broadcasts every proposal to all other agents (see manta.core.protocol)
+    protocol: Optional[MultilateralProtocol] = None
+
+    # Per-call deadlines: every awaited propose()/respond() may take at most `call_timeout` seconds,
+    # and never longer than what is left of `time_limit` (in-flight calls are cancelled at the
+    # negotiation deadline, which ends it as 'timedout'). What a call timeout means:
+    # - 'end': the negotiation ends as 'broken',
+    # - 'skip': the agent loses its turn (the step advances, nothing is recorded),
+    # - 'default': a responder is taken to have answered `timeout_response`; a proposer skips.
+    # The agent's on_error() hook is notified. Plain-function (sync) agents cannot be interrupted.
+    call_timeout: Optional[float] = None
+    timeout_policy: TimeoutPolicy = "end"
+    timeout_response: Literal["accept", "reject", "end"] = "reject"
+
 class NegotiationState(BaseModel):
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
     running: bool = False
     step: int = 0
     start_time: float = 0.0
     current_proposer_id: str = ""
     current_offer: Optional[Any] = None
-    history: List[dict] = []
+    history: NegotiationHistory = Field(default_factory=NegotiationHistory)
     status: Literal["ongoing", "success", "timedout", "broken"] = "ongoing"
+    # Metrics snapshot of the last run (NegotiationConfig.metrics / profile), else None
+    metrics: Optional[Dict[str, Any]] = None
+
+    @field_serializer('history')
+    def _serialize_history(self, history: NegotiationHistory) -> List[dict]:
+        return list(history)
 
 class Runner(BaseModel):
     config: NegotiationConfig
     agents: List[BaseAgent]
     state: NegotiationState = Field(default_factory=NegotiationState)
-    
+    # Objects with an on_step(state, record) method, notified after every history record
+    # (e.g. manta.core.pareto.ParetoTracker)
+    observers: List[Any] = Field(default_factory=list)
+
     class Config:
         arbitrary_types_allowed = True
 
-    def _get_agent_state(self) -> AgentState:
+    def _get_agent_state(self, current_offer: Any = None) -> AgentState:
         now = time.time()
         relative_time = 0.0
         if self.config.time_limit and self.config.time_limit > 0:
             relative_time = (now - self.state.start_time) / self.config.time_limit
-        
-        return AgentState(
+
+        if current_offer is None:
+            current_offer = self.state.current_offer
+        build = AgentState if self.config.strict else FastAgentState
+        return build(
             step=self.state.step,
             time=now,
             relative_time=relative_time,
-            current_offer=self.state.current_offer,
-            history=self.state.history
+            current_offer=current_offer,
+            history=self.state.history.view()
         )
 
-    async def run(self):
-        """Execute the negotiation simulation loop."""
+    def _result(self, result: Any) -> AgentResult:
+        """Public boundary: what an agent returned, fully validated in strict mode."""
+        return validate_result(result) if self.config.strict else result
+
+    def _response(self, result: Any) -> str:
+        """A responder's answer. Unknown responses are errors in every mode (history/journal cannot store them)."""
+        response = self._result(result).response
+        if response not in RESPONSE_CODES:
+            raise ValueError(f"Invalid response {response!r}.")
+        return response
+
+    def _refresh_agent_state(self, agent_state: AgentState, current_offer: Any) -> AgentState:
+        """Turbo mode: updates the shared AgentState in place instead of building a new one."""
+        now = time.time()
+        agent_state.step = self.state.step
+        agent_state.time = now
+        if self.config.time_limit and self.config.time_limit > 0:
+            agent_state.relative_time = (now - self.state.start_time) / self.config.time_limit
+        agent_state.current_offer = current_offer
+        return agent_state
+
+    def _record(self, record: dict) -> None:
+        self.state.history.append(record)
+        for observer in self.observers:
+            try:
+                observer.on_step(self.state, record)
+            except Exception as e:
+                logger.error("observer.failed", observer=type(observer).__name__, step=record["step"], error=str(e))
+
+    def _timers(self, metrics: Optional[NegotiationMetrics]) -> Optional[Tuple[List[LatencyHistogram], List[LatencyHistogram], LatencyHistogram]]:
+        """Per-agent propose/respond histograms and the step histogram, resolved once per negotiation."""
+        if metrics is None:
+            return None
+        return (
+            [metrics.histogram(f"propose.{agent.name}") for agent in self.agents],
+            [metrics.histogram(f"respond.{agent.name}") for agent in self.agents],
+            metrics.histogram("step"),
+        )
+
+    def _is_sync(self) -> bool:
+        """True if no agent's propose/respond is a coroutine function."""
+        return not any(
+            inspect.iscoroutinefunction(agent.propose) or inspect.iscoroutinefunction(agent.respond)
+            for agent in self.agents
+        )
+
+    # --- Loop building blocks (shared by run() and run_sync()) ---
+
+    def _start(self, resume: bool = False) -> bool:
+        """
+        Resets the state (unless resuming) and initializes the agents. Returns False if an agent failed.
+        On resume, time_limit counts from now.
+        """
         self.state.running = True
         self.state.start_time = time.time()
-        self.state.step = 0
-        self.state.status = "ongoing"
+        if not resume:
+            self.state.step = 0
+            self.state.status = "ongoing"
+
+        history = self.state.history
+        if history.capacity != self.config.history_limit or history.outcome_space is not self.config.outcome_space:
+            history.configure(capacity=self.config.history_limit, outcome_space=self.config.outcome_space)
         
         # Initialize agents
         for agent in self.agents:
             try:
                 agent.on_negotiation_start(self._get_agent_state())
             except Exception as e:
-                logger.error(f"Error initializing agent {agent.name}: {e}")
+                logger.error("agent.crashed", agent=agent.name, phase="start", error=str(e))
                 self.state.status = "broken"
-                return self.state # Return state immediately on crash
+                return False
+        return True
+
+    def _call_timeout(self) -> Optional[float]:
+        """Seconds the next agent call may take: call_timeout, capped by what is left of time_limit."""
+        timeout = self.config.call_timeout
+        if self.config.time_limit is not None:
+            left = self.state.start_time + self.config.time_limit - time.time()
+            timeout = left if timeout is None else min(timeout, left)
+        return timeout
 
-        current_proposer_idx = 0
+    def _bounded(self, awaitable: Any) -> Any:
+        """The awaitable, cancelled after its deadline (manta.core.protocol.bounded) if it has one."""
+        timeout = self._call_timeout()
+        return awaitable if timeout is None else bounded(awaitable, timeout)
+
+    def _timed_out(self, agent: BaseAgent, phase: str) -> str:
+        """
+        Handles an agent call that hit its deadline: notifies the agent (on_error) and applies
+        the timeout policy. Returns 'skip' or 'default', or 'stop' if the negotiation is over.
+        """
+        deadline = self.config.time_limit is not None and time.time() - self.state.start_time >= self.config.time_limit
+        reason = "negotiation deadline" if deadline else f"call_timeout of {self.config.call_timeout}s"
+        logger.warning("agent.timeout", agent=agent.name, phase=phase, step=self.state.step, reason=reason)
+        try:
+            agent.on_error(f"{phase} timed out at step {self.state.step} ({reason})")
+        except Exception as e:
+            logger.error("agent.crashed", agent=agent.name, phase="on_error", step=self.state.step, error=str(e))
+
+        if deadline:
+            self.state.status = "timedout"
+            return "stop"
+        if self.config.timeout_policy == "end":
+            self.state.status = "broken"
+            return "stop"
+        return self.config.timeout_policy
+
+    def _first_proposer(self, resume: bool) -> int:
+        """0, or on resume the agent after the proposer of the last completed step."""
+        if resume and self.state.current_proposer_id:
+            names = [agent.name for agent in self.agents]
+            if self.state.current_proposer_id in names:
+                return (names.index(self.state.current_proposer_id) + 1) % len(self.agents)
+        return 0
+
+    def _deadline_reached(self) -> bool:
+        if self.config.max_steps is not None and self.state.step >= self.config.max_steps:
+            self.state.status = "timedout"
+            return True
+        
+        if self.config.time_limit is not None:
+            elapsed = time.time() - self.state.start_time
+            if elapsed >= self.config.time_limit:
+                self.state.status = "timedout"
+                return True
+        return False
+
+    def _check_proposal(self, proposer: BaseAgent, proposal_result: AgentResult) -> Optional[Any]:
+        """Returns the proposal, or None (with the state set to broken) if the negotiation must stop."""
+        # CRITICAL FIX: Check if agent explicitly wants to end
+        if proposal_result.response == "end":
+            logger.info("negotiation.ended", agent=proposer.name, step=self.state.step)
+            self.state.status = "broken"
+            return None
+
+        proposal = proposal_result.proposal
+        if proposal is None:
+            # FIXED: Do NOT continue if proposal is None. This caused the crash.
+            logger.warning("agent.no_proposal", agent=proposer.name, step=self.state.step)
+            self.state.status = "broken"
+        return proposal
+
+    async def _propose(self, proposer: BaseAgent, proposer_idx: int, shared_state: Optional[AgentState],
+                       timers: Optional[Tuple[List[LatencyHistogram], List[LatencyHistogram], LatencyHistogram]]) -> Tuple[Any, str]:
+        """
+        The proposal step of the async loops: calls propose() (shared_state: turbo mode), applies
+        the call deadline and validates the result. Returns (proposal, action) with action 'ok',
+        'skip' (timed out: the turn passes to the next agent) or 'stop' (the state says why).
+        """
+        try:
+            if shared_state is not None:
+                agent_state = self._refresh_agent_state(shared_state, self.state.current_offer)
+            else:
+                agent_state = self._get_agent_state()
+            if timers is not None: t_call = perf_counter()
+            proposal_result = proposer.propose(agent_state)
+            if inspect.isawaitable(proposal_result):
+                proposal_result = await self._bounded(proposal_result)
+            if timers is not None: timers[0][proposer_idx].record(perf_counter() - t_call)
+            proposal = self._check_proposal(proposer, self._result(proposal_result))
+        except asyncio.TimeoutError:
+            if self._timed_out(proposer, "propose") == "stop":
+                return None, "stop"
+            # 'skip' and 'default': the turn passes to the next agent
+            self.state.step += 1
+            return None, "skip"
+        except Exception as e:
+            logger.error("agent.crashed", agent=proposer.name, phase="propose", step=self.state.step, error=str(e))
+            self.state.status = "broken"
+            return None, "stop"
+        return proposal, ("stop" if proposal is None else "ok")
+
+    def _process_response(self, proposer: BaseAgent, responder: BaseAgent, proposal: Any, response: str) -> bool:
+        """Applies the response to the state. Returns True if the negotiation continues."""
+        record = {
+            "step": self.state.step,
+            "proposer": proposer.name,
+            "proposal": proposal,
+            "responder": responder.name,
+            "response": response
+        }
+
+        if response == "accept":
+            self.state.status = "success"
+            self.state.current_offer = proposal # Final agreement
+            # Log the final accept
+            self._record(record)
+            return False
+        elif response == "reject":
+            self.state.current_offer = proposal # Update current offer on table
+        elif response == "end":
+            self.state.status = "broken"
+            self._record(record) # Recorded like every multilateral response (see _process_round)
+            return False
+        
+        # Update State
+        self._record(record)
+        self.state.step += 1
+        return True
+
+    def _process_round(self, proposer: BaseAgent, responders: List[BaseAgent], proposal: Any, responses: List[str], n_responders: int) -> bool:
+        """
+        Multilateral counterpart of _process_response: one record per responder that answered,
+        one step per round. `n_responders` includes the ones that abstained (they do not accept).
+        """
+        for responder, response in zip(responders, responses):
+            self._record({
+                "step": self.state.step,
+                "proposer": proposer.name,
+                "proposal": proposal,
+                "responder": responder.name,
+                "response": response
+            })
+
+        outcome = self.config.protocol.decide(responses, n_responders)
+        if outcome == "end":
+            self.state.status = "broken"
+            return False
+        self.state.current_offer = proposal
+        if outcome == "accept":
+            self.state.status = "success"
+            return False
+
+        self.state.step += 1
+        return True
+
+    def _finish(self):
+        # Cleanup
+        for agent in self.agents:
+            try:
+                agent.on_negotiation_end(self._get_agent_state())
+            except Exception as e:
+                logger.error("agent.crashed", agent=agent.name, phase="end", error=str(e))
+
+        # Observers with an on_end(state) method (e.g. manta.negotiation.journal.NegotiationJournal)
+        for observer in self.observers:
+            on_end = getattr(observer, "on_end", None)
+            if on_end is None:
+                continue
+            try:
+                on_end(self.state)
+            except Exception as e:
+                logger.error("observer.failed", observer=type(observer).__name__, step=self.state.step, error=str(e))
+
+        return self.state
+
+    # --- The Loops ---
+
+    @contextlib.contextmanager
+    def _instrumented(self):
+        """
+        Yields the NegotiationMetrics to record into (None when disabled); stores the snapshot on the
+        state, also when the negotiation raises or is cancelled (instrument() fills it on exit).
+        """
+        with instrument(self.config.metrics, self.config.profile) as snapshot:
+            try:
+                yield current_metrics()
+            finally:
+                self.state.metrics = snapshot
+
+    async def run(self, resume: bool = False):
+        """
+        Execute the negotiation simulation loop (resume: continue from the current state, see resume()).
+        Synchronous agents are called inline; the loop still yields to the event loop (every
+        `yield_every` steps in turbo mode). run_sync() is the opt-in loop without an event loop.
+        """
+        turbo = self.config.turbo
+        if self.config.protocol is not None:
+            with self._instrumented() as metrics:
+                return await self._run_multilateral(turbo, metrics, resume)
+
+        with self._instrumented() as metrics:
+            return await self._run(turbo, metrics, resume)
+
+    async def resume(self):
+        """
+        Continues the negotiation from the current state (step, offer on the table, history)
+        instead of starting over, e.g. after NegotiationJournal.recover(). The agents'
+        on_negotiation_start() is called again.
+        """
+        return await self.run(resume=True)
+
+    async def _run(self, turbo: bool, metrics: Optional[NegotiationMetrics], resume: bool = False):
+        if not self._start(resume):
+            return self.state # Return state immediately on crash
+
+        shared_state = self._get_agent_state() if turbo else None
+        yield_every = self.config.yield_every
+        current_proposer_idx = self._first_proposer(resume)
+        timers = self._timers(metrics)
         
         while self.state.status == "ongoing":
             # 1. Check Deadlines
-            if self.config.max_steps is not None and self.state.step >= self.config.max_steps:
-                self.state.status = "timedout"
+            if self._deadline_reached():
                 break
-            
-            if self.config.time_limit is not None:
-                elapsed = time.time() - self.state.start_time
-                if elapsed >= self.config.time_limit:
-                    self.state.status = "timedout"
-                    break
 
             # 2. Determine Turn
+            responder_idx = (current_proposer_idx + 1) % len(self.agents)
             proposer = self.agents[current_proposer_idx]
-            responder = self.agents[(current_proposer_idx + 1) % len(self.agents)]
+            responder = self.agents[responder_idx]
             self.state.current_proposer_id = proposer.name
+            if metrics is not None: t_step = perf_counter()
 
-            # 3. Action - Propose
+            # 3. Action - Propose (and 4. Validation)
+            proposal, action = await self._propose(proposer, current_proposer_idx, shared_state, timers)
+            if action == "stop":
+                break
+            if action == "skip":
+                current_proposer_idx = responder_idx
+                continue
+            
+            # 5. Action - Respond (the responder sees the proposal as the current offer)
             try:
-                # FIXED: We await the async method
-                proposal_result = await proposer.propose(self._get_agent_state())
-                
-                # CRITICAL FIX: Check if agent explicitly wants to end
-                if proposal_result.response == "end":
-                    logger.info(f"Agent {proposer.name} decided to end the negotiation.")
-                    self.state.status = "broken"
+                if turbo:
+                    agent_state = self._refresh_agent_state(shared_state, proposal)
+                else:
+                    agent_state = self._get_agent_state(proposal)
+                if metrics is not None: t_call = perf_counter()
+                response_result = responder.respond(agent_state)
+                if inspect.isawaitable(response_result):
+                    response_result = await self._bounded(response_result)
+                if metrics is not None: timers[1][responder_idx].record(perf_counter() - t_call)
+                response = self._response(response_result)
+            except asyncio.TimeoutError:
+                action = self._timed_out(responder, "respond")
+                if action == "stop":
                     break
-
-                proposal = proposal_result.proposal
+                if action == "skip":
+                    self.state.step += 1
+                    current_proposer_idx = responder_idx
+                    continue
+                response = self.config.timeout_response
             except Exception as e:
-                logger.error(f"Agent {proposer.name} crashed during propose: {e}")
+                logger.error("agent.crashed", agent=responder.name, phase="respond", step=self.state.step, error=str(e))
                 self.state.status = "broken"
                 break
 
-            # 4. Validation
-            if proposal is None:
-                # FIXED: Do NOT continue if proposal is None. This caused the crash.
-                logger.warning(f"Agent {proposer.name} made no proposal (None). Stopping.")
-                self.state.status = "broken"
+            # 6. Process Response
+            carry_on = self._process_response(proposer, responder, proposal, response)
+            if metrics is not None: timers[2].record(perf_counter() - t_step)
+            if not carry_on:
                 break
             
-            # 5. Action - Respond
-            
-            # Let's update the state temporarily for the responder call
-            temp_state = self._get_agent_state()
-            temp_state.current_offer = proposal
+            # The Modulo operator (%) enforces the Alternating turn
+            current_proposer_idx = responder_idx
             
+            # Yield control in async loop (turbo: only every `yield_every` steps)
+            if not turbo:
+                await asyncio.sleep(0.01)
+            elif yield_every and self.state.step % yield_every == 0:
+                await asyncio.sleep(0)
+
+        return self._finish()
+
+    def run_sync(self, resume: bool = False):
+        """
+        Turbo fast path for agents whose propose/respond are plain functions:
+        the same loop as run(), without an event loop, awaits or per-step state rebuilds.
+        """
+        if self.config.protocol is not None:
+            raise TypeError("run_sync() only plays alternating offers; use run() with a multilateral protocol.")
+        if not self._is_sync():
+            raise TypeError("run_sync() requires agents with synchronous propose() and respond().")
+
+        with self._instrumented() as metrics:
+            return self._run_sync(metrics, resume)
+
+    def _run_sync(self, metrics: Optional[NegotiationMetrics], resume: bool = False):
+        if not self._start(resume):
+            return self.state
+
+        shared_state = self._get_agent_state()
+        current_proposer_idx = self._first_proposer(resume)
+        timers = self._timers(metrics)
+
+        while self.state.status == "ongoing":
+            if self._deadline_reached():
+                break
+
+            responder_idx = (current_proposer_idx + 1) % len(self.agents)
+            proposer = self.agents[current_proposer_idx]
+            responder = self.agents[responder_idx]
+            self.state.current_proposer_id = proposer.name
+            if metrics is not None: t_step = perf_counter()
+
             try:
-                # FIXED: We await the async method
-                response_result = await responder.respond(temp_state)
-                response = response_result.response
+                agent_state = self._refresh_agent_state(shared_state, self.state.current_offer)
+                if metrics is not None: t_call = perf_counter()
+                proposal_result = proposer.propose(agent_state)
+                if metrics is not None: timers[0][current_proposer_idx].record(perf_counter() - t_call)
+                proposal = self._check_proposal(proposer, self._result(proposal_result))
             except Exception as e:
-                logger.error(f"Agent {responder.name} crashed during respond: {e}")
+                logger.error("agent.crashed", agent=proposer.name, phase="propose", step=self.state.step, error=str(e))
                 self.state.status = "broken"
                 break
 
-            # 6. Process Response
-            if response == "accept":
-                self.state.status = "success"
-                self.state.current_offer = proposal # Final agreement
-                # Log the final accept
-                self.state.history.append({
-                    "step": self.state.step,
-                    "proposer": proposer.name,
-                    "proposal": proposal,
-                    "responder": responder.name,
-                    "response": response
-                })
-                break
-            elif response == "reject":
-                self.state.current_offer = proposal # Update current offer on table
-            elif response == "end":
-                self.state.status = "broken"
+            if proposal is None:
                 break
-            
-            # 7. Update State
-            self.state.history.append({
-                "step": self.state.step,
-                "proposer": proposer.name,
-                "proposal": proposal,
-                "responder": responder.name,
-                "response": response
-            })
-            
-            self.state.step += 1
-            # The Modulo operator (%) enforces the Alternating turn
-            current_proposer_idx = (current_proposer_idx + 1) % len(self.agents)
-            
-            # Small sleep to yield control in async loop
-            await asyncio.sleep(0.01)
 
-        # Cleanup
-        for agent in self.agents:
             try:
-                agent.on_negotiation_end(self._get_agent_state())
+                agent_state = self._refresh_agent_state(shared_state, proposal)
+                if metrics is not None: t_call = perf_counter()
+                response_result = responder.respond(agent_state)
+                if metrics is not None: timers[1][responder_idx].record(perf_counter() - t_call)
+                response = self._response(response_result)
             except Exception as e:
-                logger.error(f"Error finalizing agent {agent.name}: {e}")
+                logger.error("agent.crashed", agent=responder.name, phase="respond", step=self.state.step, error=str(e))
+                self.state.status = "broken"
+                break
+
+            carry_on = self._process_response(proposer, responder, proposal, response)
+            if metrics is not None: timers[2].record(perf_counter() - t_step)
+            if not carry_on:
+                break
+
+            current_proposer_idx = responder_idx
+
+        return self._finish()
+
+    async def _run_multilateral(self, turbo: bool, metrics: Optional[NegotiationMetrics], resume: bool = False):
+        """
+        run() under NegotiationConfig.protocol: round-robin proposers, each proposal answered by
+        all the other agents concurrently (manta.core.protocol.broadcast).
+        """
+        if not self._start(resume):
+            return self.state
+
+        protocol = self.config.protocol
+        n_agents = len(self.agents)
+        shared_state = self._get_agent_state() if turbo else None
+        yield_every = self.config.yield_every
+        current_proposer_idx = self._first_proposer(resume)
+        timers = self._timers(metrics)
+
+        while self.state.status == "ongoing":
+            # 1. Check Deadlines
+            if self._deadline_reached():
+                break
+
+            # 2. Determine Turn
+            proposer = self.agents[current_proposer_idx]
+            responder_ids = protocol.responders(n_agents, current_proposer_idx)
+            responders = [self.agents[i] for i in responder_ids]
+            self.state.current_proposer_id = proposer.name
+            if metrics is not None: t_step = perf_counter()
+
+            # 3. Action - Propose
+            proposal, action = await self._propose(proposer, current_proposer_idx, shared_state, timers)
+            if action == "stop":
+                break
+            if action == "skip":
+                current_proposer_idx = (current_proposer_idx + 1) % n_agents
+                continue
+
+            # 4. Action - Respond, all responders at once (turbo: they share one read-only state)
+            if turbo:
+                agent_state = self._refresh_agent_state(shared_state, proposal)
+                states = [agent_state] * len(responders)
+            else:
+                states = [self._get_agent_state(proposal) for _ in responders]
+            results = await broadcast(
+                responders, states, [timers[1][i] for i in responder_ids] if timers is not None else None,
+                timeout=self._call_timeout()
+            )
+
+            answered, responses = [], [] # Responders that timed out under 'skip' abstain
+            for responder, result in zip(responders, results):
+                try:
+                    if isinstance(result, asyncio.TimeoutError):
+                        action = self._timed_out(responder, "respond")
+                        if action == "stop":
+                            break
+                        if action == "skip":
+                            continue
+                        response = self.config.timeout_response
+                    elif isinstance(result, BaseException):
+                        # Whatever the agent raised (CancelledError included) is its failure, not the runner's
+                        logger.error("agent.crashed", agent=responder.name, phase="respond", step=self.state.step, error=str(result) or type(result).__name__)
+                        self.state.status = "broken"
+                        break
+                    else:
+                        response = self._response(result)
+                except Exception as e:
+                    logger.error("agent.crashed", agent=responder.name, phase="respond", step=self.state.step, error=str(e))
+                    self.state.status = "broken"
+                    break
+                answered.append(responder)
+                responses.append(response)
+            if self.state.status != "ongoing":
+                break
+
+            # 5. Process Round
+            carry_on = self._process_round(proposer, answered, proposal, responses, len(responders))
+            if metrics is not None: timers[2].record(perf_counter() - t_step)
+            if not carry_on:
+                break
+
+            current_proposer_idx = (current_proposer_idx + 1) % n_agents
+
+            if not turbo:
+                await asyncio.sleep(0.01)
+            elif yield_every and self.state.step % yield_every == 0:
+                await asyncio.sleep(0)
 
-        return self.state
\ No newline at end of file
+        return self._finish()
@@ -0,0 +1,262 @@
+import os
+import time
+import asyncio
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import List, Optional, Any, Dict, Iterator, Literal, Tuple, Type
+from pydantic import BaseModel, Field, ConfigDict
+
+from manta.core.outcomes import OutcomeSpace, Outcome
+from manta.core.agent import BaseAgent
+from manta.agents.standard import StandardAgent
+from manta.negotiation.runner import Runner, NegotiationConfig
+from manta.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# 1. Result Objects
+class MatchResult(BaseModel):
+    """Outcome of one buyer-vs-seller negotiation."""
+    buyer_idx: int
+    seller_idx: int
+    repetition: int = 0
+    status: Literal["success", "timedout", "broken", "ongoing", "error"]
+    steps: int = 0
+    agreement: Optional[Outcome] = None
+    buyer_utility: Optional[float] = None
+    seller_utility: Optional[float] = None
+    # Normalized gain: (utility - reservation value) / (1 - reservation value), i.e. the share of
+    # what the agent could gain above its walk-away point. Comparable across utility functions.
+    buyer_gain: Optional[float] = None
+    seller_gain: Optional[float] = None
+    duration: float = 0.0
+    error: Optional[str] = None
+
+    @property
+    def winner(self) -> Optional[str]:
+        """'buyer' or 'seller' (whoever got the higher normalized gain from the agreement), else None."""
+        if self.buyer_gain is None or self.seller_gain is None or self.buyer_gain == self.seller_gain:
+            return None
+        return "buyer" if self.buyer_gain > self.seller_gain else "seller"
+
+class ConfigStats(BaseModel):
+    """Aggregated results of one agent configuration across all its matches."""
+    role: Literal["buyer", "seller"]
+    index: int
+    name: str
+    matches: int = 0
+    agreements: int = 0
+    wins: int = 0
+    total_utility: float = 0.0 # Summed over agreements
+    total_steps: int = 0
+
+    @property
+    def agreement_rate(self) -> float:
+        return self.agreements / self.matches if self.matches else 0.0
+
+    @property
+    def win_rate(self) -> float:
+        return self.wins / self.matches if self.matches else 0.0
+
+    @property
+    def mean_utility(self) -> float:
+        return self.total_utility / self.agreements if self.agreements else 0.0
+
+    @property
+    def mean_steps(self) -> float:
+        return self.total_steps / self.matches if self.matches else 0.0
+
+    def add(self, result: MatchResult) -> None:
+        self.matches += 1
+        self.total_steps += result.steps
+        utility = result.buyer_utility if self.role == "buyer" else result.seller_utility
+        if result.status == "success" and utility is not None:
+            self.agreements += 1
+            self.total_utility += utility
+        if result.winner == self.role:
+            self.wins += 1
+
+class TournamentSummary(BaseModel):
+    results: List[MatchResult] = Field(default_factory=list)
+    buyers: List[ConfigStats] = Field(default_factory=list)
+    sellers: List[ConfigStats] = Field(default_factory=list)
+    duration: float = 0.0
+
+    @property
+    def agreement_rate(self) -> float:
+        if not self.results:
+            return 0.0
+        return sum(r.status == "success" for r in self.results) / len(self.results)
+
+    def add(self, result: MatchResult) -> None:
+        self.results.append(result)
+        self.buyers[result.buyer_idx].add(result)
+        self.sellers[result.seller_idx].add(result)
+
+# 2. Worker Side (module level so the process pool can pickle it)
+def _agent_utility(agent: BaseAgent, offer: Any) -> Optional[float]:
+    utility = getattr(agent, "_utility", None) or getattr(agent, "utility", None)
+    if utility is None or offer is None:
+        return None
+    if isinstance(offer, list): offer = offer[0] # MESO: the responder accepted the first option
+    return float(utility(offer))
+
+def _normalized_gain(agent: BaseAgent, utility: Optional[float]) -> Optional[float]:
+    """See MatchResult.buyer_gain. Agents without a reservation_val count from 0."""
+    reservation = float(getattr(agent, "reservation_val", 0.0))
+    if utility is None or reservation >= 1.0:
+        return None
+    return (utility - reservation) / (1.0 - reservation)
+
+async def _play_match(
+    agent_class: Type[BaseAgent],
+    buyer_config: Dict[str, Any],
+    seller_config: Dict[str, Any],
+    negotiation: Dict[str, Any],
+    match: Tuple[int, int, int]
+) -> MatchResult:
+    buyer_idx, seller_idx, repetition = match
+    start = time.perf_counter()
+    try:
+        buyer = agent_class(**buyer_config)
+        seller = agent_class(**seller_config)
+        runner = Runner(config=NegotiationConfig(**negotiation), agents=[buyer, seller])
+        state = await runner.run()
+    except Exception as e:
+        return MatchResult(
+            buyer_idx=buyer_idx, seller_idx=seller_idx, repetition=repetition, status="error",
+            duration=time.perf_counter() - start, error=f"{type(e).__name__}: {e}"
+        )
+
+    agreement = state.current_offer if state.status == "success" else None
+    buyer_utility = _agent_utility(buyer, agreement)
+    seller_utility = _agent_utility(seller, agreement)
+    return MatchResult(
+        buyer_idx=buyer_idx,
+        seller_idx=seller_idx,
+        repetition=repetition,
+        status=state.status,
+        steps=state.step,
+        agreement=agreement[0] if isinstance(agreement, list) else agreement,
+        buyer_utility=buyer_utility,
+        seller_utility=seller_utility,
+        buyer_gain=_normalized_gain(buyer, buyer_utility),
+        seller_gain=_normalized_gain(seller, seller_utility),
+        duration=time.perf_counter() - start,
+    )
+
+def _run_shard(
+    agent_class: Type[BaseAgent],
+    buyer_configs: List[Dict[str, Any]],
+    seller_configs: List[Dict[str, Any]],
+    negotiation: Dict[str, Any],
+    matches: List[Tuple[int, int, int]]
+) -> List[MatchResult]:
+    """Runs one shard of pairings concurrently inside this worker's event loop."""
+    async def main():
+        return await asyncio.gather(*(
+            _play_match(agent_class, buyer_configs[b], seller_configs[s], negotiation, (b, s, r))
+            for b, s, r in matches
+        ))
+    return asyncio.run(main())
+
+# Per-worker copy of the tournament payload, sent once through the pool initializer
+# so that shards only carry their (buyer, seller, repetition) tuples.
+_WORKER_PAYLOAD: Optional[Tuple[Any, ...]] = None
+
+def _init_worker(*payload: Any) -> None:
+    global _WORKER_PAYLOAD
+    _WORKER_PAYLOAD = payload
+
+def _run_worker_shard(matches: List[Tuple[int, int, int]]) -> List[MatchResult]:
+    return _run_shard(*_WORKER_PAYLOAD, matches)
+
+# 3. The Tournament
+class Tournament(BaseModel):
+    """
+    Plays every buyer configuration against every seller configuration.
+
+    Pairings are split into shards and spread over a process pool; each worker runs its shard's
+    negotiations concurrently in its own event loop (in turbo mode they take turns every
+    `yield_every` steps; None plays each match to the end before the next one starts).
+    Results stream back shard by shard (iter_results) or are aggregated into a
+    TournamentSummary (run).
+
+    Usage:
+        tournament = Tournament(buyer_configs=[...], seller_configs=[...], outcome_space=space)
+        summary = tournament.run()
+    """
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    buyer_configs: List[Dict[str, Any]]
+    seller_configs: List[Dict[str, Any]]
+    outcome_space: OutcomeSpace
+    agent_class: Type[BaseAgent] = StandardAgent # Must be importable from a module (picklable)
+
+    # Negotiation settings for every match
+    max_steps: Optional[int] = 10
+    time_limit: Optional[float] = None
+    turbo: bool = True
+    yield_every: Optional[int] = 1 # Turbo: steps between yields, so a shard's matches interleave
+    repetitions: int = 1
+
+    # Parallelism: None = one worker per core; 0 or 1 = run in this process
+    workers: Optional[int] = None
+    shard_size: Optional[int] = None # Default: ~4 shards per worker
+
+    def _agent_configs(self, configs: List[Dict[str, Any]], role: str) -> List[Dict[str, Any]]:
+        prepared = []
+        for i, config in enumerate(configs):
+            config = dict(config)
+            config.setdefault("outcome_space", self.outcome_space)
+            config.setdefault("role", role)
+            config.setdefault("name", f"{role}_{i}")
+            prepared.append(config)
+        return prepared
+
+    def _shards(self, workers: int) -> List[List[Tuple[int, int, int]]]:
+        matches = [
+            (b, s, r)
+            for r in range(self.repetitions)
+            for b in range(len(self.buyer_configs))
+            for s in range(len(self.seller_configs))
+        ]
+        size = self.shard_size or max(1, -(-len(matches) // (workers * 4)))
+        return [matches[i:i + size] for i in range(0, len(matches), size)]
+
+    def iter_results(self) -> Iterator[MatchResult]:
+        """Yields MatchResults as their shards finish (completion order, not pairing order)."""
+        workers = self.workers if self.workers is not None else (os.cpu_count() or 1)
+        buyers = self._agent_configs(self.buyer_configs, "buyer")
+        sellers = self._agent_configs(self.seller_configs, "seller")
+        negotiation = {
+            "max_steps": self.max_steps,
+            "time_limit": self.time_limit,
+            "outcome_space": self.outcome_space,
+            "turbo": self.turbo,
+            "yield_every": self.yield_every,
+        }
+        shards = self._shards(max(1, workers))
+
+        if workers <= 1:
+            for shard in shards:
+                yield from _run_shard(self.agent_class, buyers, sellers, negotiation, shard)
+            return
+
+        payload = (self.agent_class, buyers, sellers, negotiation)
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=payload) as pool:
+            futures = [pool.submit(_run_worker_shard, shard) for shard in shards]
+            for future in as_completed(futures):
+                yield from future.result()
+
+    def run(self) -> TournamentSummary:
+        start = time.perf_counter()
+        summary = TournamentSummary(
+            buyers=[ConfigStats(role="buyer", index=i, name=c.get("name", f"buyer_{i}")) for i, c in enumerate(self.buyer_configs)],
+            sellers=[ConfigStats(role="seller", index=i, name=c.get("name", f"seller_{i}")) for i, c in enumerate(self.seller_configs)],
+        )
+        for result in self.iter_results():
+            if result.status == "error":
+                logger.error("match.failed", buyer=result.buyer_idx, seller=result.seller_idx, error=result.error)
+            summary.add(result)
+        summary.duration = time.perf_counter() - start
+        return summary
@@ -0,0 +1,423 @@
+import io
+import sys
+import json
+import time
+import queue
+import atexit
+import pstats
+import cProfile
+import logging
+import tracemalloc
+import contextlib
+import logging.handlers
+from contextvars import ContextVar
+from typing import Dict, Any, Optional, List, Iterator, Literal, Union
+
+# --- 1. LATENCY HISTOGRAMS ---
+
+# Bucket i holds durations in [2^(i-1), 2^i) microseconds; the last bucket also takes everything above
+N_BUCKETS = 40
+
+class LatencyHistogram:
+    """
+    Fixed-size, log2-bucketed latency histogram (microsecond resolution).
+    record() is O(1) and allocation free, so it can run on every step.
+    """
+    __slots__ = ("count", "total", "min", "max", "buckets")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.min = float("inf")
+        self.max = 0.0
+        self.buckets = [0] * N_BUCKETS
+
+    def record(self, seconds: float) -> None:
+        self.count += 1
+        self.total += seconds
+        if seconds < self.min: self.min = seconds
+        if seconds > self.max: self.max = seconds
+        self.buckets[min(int(seconds * 1e6).bit_length(), N_BUCKETS - 1)] += 1
+
+    def percentile(self, q: float) -> float:
+        """Upper bound (seconds) of the bucket holding the q-th percentile (q in [0, 100])."""
+        if self.count == 0:
+            return 0.0
+        rank = q / 100.0 * self.count
+        seen = 0
+        for i, n in enumerate(self.buckets):
+            seen += n
+            if n and seen >= rank:
+                return min((1 << i) * 1e-6, self.max)
+        return self.max
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "total": self.total,
+            "mean": self.total / self.count if self.count else 0.0,
+            "min": self.min if self.count else 0.0,
+            "max": self.max,
+            "p50": self.percentile(50),
+            "p90": self.percentile(90),
+            "p99": self.percentile(99),
+            # Non-empty buckets, keyed by their upper bound in microseconds
+            "buckets": {1 << i: n for i, n in enumerate(self.buckets) if n},
+        }
+
+# --- 2. NEGOTIATION METRICS ---
+
+class _Timer:
+    __slots__ = ("histogram", "start")
+
+    def __init__(self, histogram: LatencyHistogram):
+        self.histogram = histogram
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.histogram.record(time.perf_counter() - self.start)
+        return False
+
+class NegotiationMetrics:
+    """
+    Named latency histograms for one negotiation. The runner records:
+        'step'                 wall time of a whole step (propose + respond + bookkeeping)
+        'propose.<agent>'      latency of each agent's propose()
+        'respond.<agent>'      latency of each agent's respond()
+        'meso'                 time spent inside generate_meso()
+    Agents add their own with BaseAgent.timer(label) ('<agent>.<label>').
+    """
+
+    def __init__(self):
+        self.histograms: Dict[str, LatencyHistogram] = {}
+        self.started = time.perf_counter()
+
+    def histogram(self, name: str) -> LatencyHistogram:
+        hist = self.histograms.get(name)
+        if hist is None:
+            hist = self.histograms[name] = LatencyHistogram()
+        return hist
+
+    def record(self, name: str, seconds: float) -> None:
+        self.histogram(name).record(seconds)
+
+    def timer(self, name: str) -> _Timer:
+        """Context manager recording the duration of its block under `name`."""
+        return _Timer(self.histogram(name))
+
+    def snapshot(self) -> Dict[str, Any]:
+        histograms = {name: hist.snapshot() for name, hist in self.histograms.items()}
+        wall_time = time.perf_counter() - self.started
+        step = self.histograms.get("step")
+        agent_time = sum(
+            hist.total for name, hist in self.histograms.items() if name.startswith(("propose.", "respond."))
+        )
+        return {
+            "wall_time": wall_time,
+            "steps": step.count if step else 0,
+            # Step time not spent inside the agents: runner, history and observers
+            "runner_overhead": (step.total - agent_time) if step else 0.0,
+            "histograms": histograms,
+        }
+
+# The metrics of the negotiation running in this context (None = instrumentation off).
+# A ContextVar keeps concurrent negotiations (e.g. a tournament shard) apart.
+_current: ContextVar[Optional[NegotiationMetrics]] = ContextVar("manta_metrics", default=None)
+
+def current_metrics() -> Optional[NegotiationMetrics]:
+    """Metrics of the negotiation being run, or None when instrumentation is disabled."""
+    return _current.get()
+
+def timer(name: str):
+    """Times a block into the current negotiation's metrics; a no-op when instrumentation is off."""
+    metrics = _current.get()
+    return metrics.timer(name) if metrics is not None else contextlib.nullcontext()
+
+# --- 3. PROFILING (one negotiation at a time) ---
+
+ProfileMode = Literal["cprofile", "tracemalloc"]
+
+class Profiler:
+    """Captures a cProfile or tracemalloc report between start() and stop()."""
+
+    def __init__(self, mode: ProfileMode, top: int = 25):
+        if mode not in ("cprofile", "tracemalloc"):
+            raise ValueError(f"Unknown profile mode '{mode}'. Use 'cprofile' or 'tracemalloc'.")
+        self.mode = mode
+        self.top = top
+        self._profile: Optional[cProfile.Profile] = None
+        self._owns_tracemalloc = False
+
+    def start(self) -> None:
+        if self.mode == "cprofile":
+            self._profile = cProfile.Profile()
+            self._profile.enable()
+        else:
+            self._owns_tracemalloc = not tracemalloc.is_tracing()
+            if self._owns_tracemalloc:
+                tracemalloc.start()
+            tracemalloc.reset_peak()
+            self._baseline = tracemalloc.take_snapshot()
+
+    def stop(self) -> Dict[str, Any]:
+        if self.mode == "cprofile":
+            self._profile.disable()
+            out = io.StringIO()
+            stats = pstats.Stats(self._profile, stream=out)
+            stats.sort_stats("cumulative").print_stats(self.top)
+            return {"mode": "cprofile", "total_calls": stats.total_calls, "report": out.getvalue()}
+
+        current, peak = tracemalloc.get_traced_memory()
+        diff = tracemalloc.take_snapshot().compare_to(self._baseline, "lineno")
+        if self._owns_tracemalloc:
+            tracemalloc.stop()
+        top: List[str] = [str(stat) for stat in diff[:self.top]]
+        return {"mode": "tracemalloc", "current_bytes": current, "peak_bytes": peak, "top": top}
+
+@contextlib.contextmanager
+def instrument(enabled: bool = True, profile: Optional[ProfileMode] = None) -> Iterator[Optional[Dict[str, Any]]]:
+    """
+    Collects NegotiationMetrics (and an optional profile) for the block. Yields the dict that
+    receives the snapshot on exit, or None when disabled (no timing happens at all).
+
+        with instrument() as snapshot:
+            ...
+        snapshot["histograms"]["step"]["p99"]
+    """
+    if not enabled and profile is None:
+        yield None
+        return
+
+    profiler = Profiler(profile) if profile is not None else None
+    metrics = NegotiationMetrics()
+    token = _current.set(metrics)
+    snapshot: Dict[str, Any] = {}
+    if profiler is not None:
+        profiler.start()
+    try:
+        yield snapshot
+    finally:
+        report = profiler.stop() if profiler is not None else None
+        _current.reset(token)
+        snapshot.update(metrics.snapshot())
+        if report is not None:
+            snapshot["profile"] = report
+
+# --- 4. STRUCTURED LOGGING ---
+
+# Every library logger lives under 'manta'. Nothing is emitted until the application opts in
+# with configure_logging() (or attaches its own handlers): importing manta configures nothing.
+LOGGER_NAME = "manta"
+_package_logger = logging.getLogger(LOGGER_NAME)
+_package_logger.addHandler(logging.NullHandler())
+
+class Sampler:
+    """
+    Keeps 1 in every round(1 / rate) records of an event, e.g. {"agent.assess": 0.01}.
+    A key ending in '.*' covers every event with that prefix. Counter based (no RNG), so the
+    first record of an event is always kept. Only applies below WARNING.
+    """
+
+    def __init__(self, rates: Dict[str, float]):
+        self.every: Dict[str, int] = {}
+        self.prefixes: Dict[str, int] = {}
+        for key, rate in rates.items():
+            if not 0.0 < rate <= 1.0:
+                raise ValueError(f"Sample rate for '{key}' must be in (0, 1], got {rate}.")
+            every = max(1, round(1.0 / rate))
+            if key.endswith(".*"):
+                self.prefixes[key[:-1]] = every
+            else:
+                self.every[key] = every
+        self.counts: Dict[str, int] = {}
+
+    def _every(self, event: str) -> int:
+        every = self.every.get(event)
+        if every is None:
+            every = next((n for prefix, n in self.prefixes.items() if event.startswith(prefix)), 1)
+            self.every[event] = every # Cache the prefix match
+        return every
+
+    def keep(self, event: str) -> bool:
+        every = self._every(event)
+        if every == 1:
+            return True
+        n = self.counts.get(event, 0)
+        self.counts[event] = n + 1
+        return n % every == 0
+
+_sampler: Optional[Sampler] = None
+
+class StructuredLogger:
+    """
+    Logger for structured events: an event name plus keyword fields.
+
+        logger = get_logger(__name__)
+        logger.debug("agent.target", agent=self.name, step=state.step, target=target)
+
+    Disabled levels cost one cached level check (fields are never formatted), and sampled-out
+    records stop before reaching the queue.
+    """
+    __slots__ = ("name", "_logger")
+
+    def __init__(self, name: str):
+        self.name = name
+        self._logger = logging.getLogger(name)
+
+    def is_enabled(self, level: int) -> bool:
+        return self._logger.isEnabledFor(level)
+
+    def log(self, level: int, event: str, **fields: Any) -> None:
+        self._log(level, event, fields)
+
+    def debug(self, event: str, **fields: Any) -> None:
+        self._log(logging.DEBUG, event, fields)
+
+    def info(self, event: str, **fields: Any) -> None:
+        self._log(logging.INFO, event, fields)
+
+    def warning(self, event: str, **fields: Any) -> None:
+        self._log(logging.WARNING, event, fields)
+
+    def error(self, event: str, **fields: Any) -> None:
+        self._log(logging.ERROR, event, fields)
+
+    def _log(self, level: int, event: str, fields: Dict[str, Any]) -> None:
+        if not self._logger.isEnabledFor(level):
+            return
+        if _sampler is not None and level < logging.WARNING and not _sampler.keep(event):
+            return
+        self._logger.log(level, event, extra={"event": event, "fields": fields}, stacklevel=3)
+
+def get_logger(name: str) -> StructuredLogger:
+    """Structured logger for a library module (pass __name__; it must live under 'manta')."""
+    return StructuredLogger(name)
+
+class StructuredFormatter(logging.Formatter):
+    """Renders structured records as JSON lines ('json') or 'time LEVEL logger event key=value' ('text')."""
+
+    def __init__(self, fmt: Literal["text", "json"] = "text"):
+        super().__init__()
+        if fmt not in ("text", "json"):
+            raise ValueError(f"Unknown log format '{fmt}'. Use 'text' or 'json'.")
+        self.fmt = fmt
+
+    def format(self, record: logging.LogRecord) -> str:
+        event = getattr(record, "event", None) or record.getMessage()
+        fields = getattr(record, "fields", None) or {}
+        if self.fmt == "json":
+            payload = {"ts": record.created, "level": record.levelname, "logger": record.name, "event": event}
+            payload.update(fields)
+            if record.exc_text:
+                payload["exc"] = record.exc_text
+            return json.dumps(payload, default=str)
+
+        line = f"{self.formatTime(record)} {record.levelname:<7} {record.name} {event}"
+        if fields:
+            line += " " + " ".join(f"{k}={v:.4g}" if isinstance(v, float) else f"{k}={v}" for k, v in fields.items())
+        if record.exc_text:
+            line += "\n" + record.exc_text
+        return line
+
+class _DroppingQueueHandler(logging.handlers.QueueHandler):
+    """Never blocks the caller: when the queue is full, the record is dropped and counted."""
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+class _QueueListener(logging.handlers.QueueListener):
+    def enqueue_sentinel(self) -> None:
+        # Wait for room: under a burst the queue may be full when the sink shuts down
+        self.queue.put(self._sentinel)
+
+class LogSink:
+    """The installed pipeline: manta loggers -> bounded queue -> background writer thread."""
+
+    def __init__(self, handler: logging.Handler, queue_size: int):
+        self.handler = handler
+        self.queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        self.queue_handler = _DroppingQueueHandler(self.queue)
+        self.listener = _QueueListener(self.queue, handler, respect_handler_level=True)
+        self.running = False
+
+    @property
+    def dropped(self) -> int:
+        return self.queue_handler.dropped
+
+    def start(self) -> None:
+        if not self.running:
+            self.listener.start()
+            self.running = True
+
+    def stop(self) -> None:
+        """Writes out everything queued so far and stops the writer thread."""
+        if self.running:
+            self.listener.stop()
+            self.running = False
+        self.handler.flush()
+
+    def flush(self) -> None:
+        """Blocks until every queued record has been written."""
+        self.stop()
+        self.start()
+
+_sink: Optional[LogSink] = None
+
+def configure_logging(
+    level: Union[int, str] = "INFO",
+    fmt: Literal["text", "json"] = "text",
+    stream: Optional[Any] = None,
+    handler: Optional[logging.Handler] = None,
+    sample: Optional[Dict[str, float]] = None,
+    queue_size: int = 10_000
+) -> LogSink:
+    """
+    Opt-in log output for the 'manta' loggers. Records are formatted and written by a
+    background thread; callers (agents, the event loop) only pay for a non-blocking enqueue.
+    When the queue is full, records are dropped (see LogSink.dropped) rather than blocking.
+
+    Args:
+        level: Minimum level for manta loggers.
+        fmt: 'text' or 'json' (one JSON object per line).
+        stream: Where the default StreamHandler writes (default: stderr).
+        handler: Use this handler instead of a StreamHandler (its formatter is kept if set).
+        sample: Per-event sample rates for records below WARNING, e.g. {"agent.*": 0.1}.
+    """
+    global _sink, _sampler
+    shutdown_logging()
+
+    if handler is None:
+        handler = logging.StreamHandler(stream if stream is not None else sys.stderr)
+    if handler.formatter is None:
+        handler.setFormatter(StructuredFormatter(fmt))
+
+    _sink = LogSink(handler, queue_size)
+    _sampler = Sampler(sample) if sample else None
+    _package_logger.addHandler(_sink.queue_handler)
+    _package_logger.setLevel(level)
+    _package_logger.propagate = False
+    _sink.start()
+    return _sink
+
+def shutdown_logging() -> None:
+    """Flushes and removes the sink installed by configure_logging() (no-op if none)."""
+    global _sink, _sampler
+    if _sink is None:
+        return
+    _sink.stop()
+    _package_logger.removeHandler(_sink.queue_handler)
+    _package_logger.setLevel(logging.NOTSET)
+    _package_logger.propagate = True
+    _sink, _sampler = None, None
+
+atexit.register(shutdown_logging)
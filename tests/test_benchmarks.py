@@ -0,0 +1,34 @@
+import unittest
+from benchmarks.suite import Case, CaseResult, Report, compare, iter_cases, run_suite
+
+def _report(**seconds):
+    return Report(results=[
+        CaseResult(name=name, group="g", params={}, ops=1, calls=1, seconds=s, median=s, repeats=1)
+        for name, s in seconds.items()
+    ])
+
+class TestBenchmarkSuite(unittest.TestCase):
+
+    def test_case_names_include_parameters(self):
+        case = Case(group="meso", params={"method": "monte_carlo", "issues": 4})
+        self.assertEqual(case.name, "meso[method=monte_carlo,issues=4]")
+        cases = [case for case, _ in iter_cases(quick=True)]
+        self.assertEqual(len({case.name for case in cases}), len(cases))
+        self.assertTrue({"utility.batch", "meso", "pareto", "runner.turbo"} <= {case.group for case in cases})
+
+    def test_compare_flags_slowdowns(self):
+        baseline = _report(a=1.0, b=1.0, c=1.0, gone=1.0)
+        current = _report(a=1.05, b=1.5, c=0.5, added=1.0)
+        status = {row.name: row.status for row in compare(baseline, current, threshold=0.10)}
+        self.assertEqual(status, {"a": "ok", "b": "regression", "c": "improvement", "added": "new", "gone": "missing"})
+
+    def test_run_records_json_round_trip(self):
+        report = run_suite(groups=["pareto"], quick=True, match="agents=2,n=1000]", repeats=2, min_time=0.001)
+        self.assertEqual([r.name for r in report.results], ["pareto[agents=2,n=1000]"])
+        self.assertGreater(report.results[0].seconds, 0.0)
+        self.assertIn("numpy", report.meta)
+        restored = Report.model_validate_json(report.model_dump_json())
+        self.assertEqual(restored, report)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,149 @@
+import asyncio
+import threading
+import time
+import unittest
+import numpy as np
+from manta.core.outcomes import OutcomeSpace, Issue
+from manta.core.preferences import LinearAdditiveUtility
+from manta.core.cache import CachedUtility
+from manta.core.meso import generate_meso
+
+SPACE = OutcomeSpace(issues=[
+    Issue(name="price", type="continuous", min_value=50, max_value=150),
+    Issue(name="service", type="discrete", values=["standard", "premium", "enterprise"]),
+])
+SERVICE = {"standard": 0.0, "premium": 0.5, "enterprise": 1.0}
+
+class PricingModel:
+    """A plain callable utility that counts its evaluations."""
+    def __init__(self, delay: float = 0.0):
+        self.calls = 0
+        self.delay = delay
+
+    def __call__(self, outcome):
+        self.calls += 1
+        if self.delay:
+            time.sleep(self.delay)
+        if outcome["service"] == "invalid":
+            raise ValueError("unpriceable")
+        return 0.7 * (150 - outcome["price"]) / 100 + 0.3 * SERVICE[outcome["service"]]
+
+class TestCachedUtility(unittest.TestCase):
+
+    def test_canonical_keys(self):
+        model = PricingModel()
+        cached = CachedUtility(model, resolution=0.01, outcome_space=SPACE)
+        first = cached({"price": 100.0, "service": "premium"})
+        # Same outcome: issue order, int vs float and sub-resolution noise do not matter
+        for outcome in ({"service": "premium", "price": 100}, {"price": 100.0000001, "service": "premium"}):
+            self.assertEqual(cached(outcome), first)
+        self.assertEqual(model.calls, 1)
+        cached({"price": 100.02, "service": "premium"})
+        self.assertEqual(model.calls, 2)
+
+        info = cached.cache_info()
+        self.assertEqual((info.hits, info.misses, info.size), (2, 2, 2))
+        self.assertAlmostEqual(info.hit_rate, 0.5)
+
+    def test_lru_eviction(self):
+        model = PricingModel()
+        cached = CachedUtility(model, maxsize=2)
+        a, b, c = ({"price": p, "service": "standard"} for p in (60.0, 70.0, 80.0))
+        cached(a)
+        cached(b)
+        cached(a) # a is now the most recently used
+        cached(c) # Evicts b
+        self.assertEqual(cached.cache_info().evictions, 1)
+        cached(a)
+        self.assertEqual(model.calls, 3)
+        cached(b)
+        self.assertEqual(model.calls, 4)
+
+        cached.cache_clear()
+        self.assertEqual(cached.cache_info()[:5], (0, 0, 0, 0, 0))
+
+    def test_batch_shares_entries_with_calculate(self):
+        utility = LinearAdditiveUtility(weights={"price": 0.7, "service": 0.3}, outcome_space=SPACE)
+        utility.add_curve("price", 0.7, invert=True)
+        utility.add_discrete("service", 0.3, SERVICE)
+        cached = CachedUtility(utility, resolution=1e-3)
+
+        compiled = SPACE.compile()
+        offers = [{"price": 50.0 + 10 * i, "service": s} for i in range(5) for s in SERVICE]
+        encoded = compiled.encode_batch(offers + offers[:4]) # Duplicates within the batch
+        np.testing.assert_allclose(cached.calculate_batch(encoded), utility.calculate_batch(encoded))
+        self.assertEqual(cached.cache_info().size, 15)
+        self.assertEqual(cached.calculate(offers[3]), utility.calculate(offers[3]))
+        self.assertEqual(cached.cache_info().misses, 15)
+
+        # Delegation keeps the wrapped utility's structure visible
+        self.assertEqual(cached.weights, utility.weights)
+
+    def test_batch_without_vectorized_utility(self):
+        model = PricingModel()
+        cached = CachedUtility(model, outcome_space=SPACE)
+        rows = np.array([[100.0, 0], [100.0, 0], [120.0, 2], [100.0, np.nan]])
+        scores = cached.calculate_batch(rows)
+        self.assertEqual(model.calls, 3) # The duplicate is computed once, the NaN row is not cached
+        self.assertAlmostEqual(scores[1], model({"price": 100.0, "service": "standard"}))
+        self.assertEqual(cached.cache_info().uncacheable, 1)
+
+    def test_generate_meso(self):
+        utility = LinearAdditiveUtility(weights={"price": 0.7, "service": 0.3}, outcome_space=SPACE)
+        utility.add_curve("price", 0.7, invert=True)
+        utility.add_discrete("service", 0.3, SERVICE)
+        cached = CachedUtility(utility)
+        # The analytical solver still sees the linear structure
+        self.assertEqual(generate_meso(cached, SPACE, 0.6), generate_meso(utility, SPACE, 0.6))
+
+        model = PricingModel()
+        cached = CachedUtility(model, resolution=1.0, outcome_space=SPACE)
+        offers = generate_meso(cached, SPACE, 0.6, tolerance=0.05, method="monte_carlo", rng=0)
+        self.assertTrue(offers)
+        for offer in offers:
+            self.assertAlmostEqual(cached(offer), model(offer), delta=0.01)
+        # 101 prices x 3 services: the sampler hits the cache most of the time
+        self.assertLessEqual(cached.cache_info().size, 303)
+        self.assertGreater(cached.cache_info().hit_rate, 0.5)
+
+    def test_errors_are_not_cached(self):
+        model = PricingModel()
+        cached = CachedUtility(model)
+        for _ in range(2):
+            with self.assertRaises(ValueError):
+                cached({"price": 100.0, "service": "invalid"})
+        self.assertEqual((model.calls, cached.cache_info().size), (2, 0))
+
+    def test_thread_safety(self):
+        model = PricingModel()
+        cached = CachedUtility(model, maxsize=50, resolution=1.0)
+        offers = [{"price": float(p), "service": "premium"} for p in range(50, 150)]
+
+        def work():
+            for offer in offers * 5:
+                cached(offer)
+
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        info = cached.cache_info()
+        self.assertEqual(info.hits + info.misses, 2000)
+        self.assertEqual(info.size, 50)
+        self.assertGreaterEqual(info.misses - info.evictions, 50) # Two threads can both miss a key
+
+    def test_async_misses_share_one_call(self):
+        model = PricingModel(delay=0.02)
+        cached = CachedUtility(model, outcome_space=SPACE)
+
+        async def scenario():
+            offer = {"price": 120.0, "service": "enterprise"}
+            return await asyncio.gather(*(cached.acalculate(offer) for _ in range(10)))
+
+        scores = asyncio.run(scenario())
+        self.assertEqual(len(set(scores)), 1)
+        self.assertEqual(model.calls, 1)
+
+if __name__ == '__main__':
+    unittest.main()
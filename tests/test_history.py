@@ -0,0 +1,75 @@
+import asyncio
+import unittest
+from manta.core.agent import BaseAgent, AgentState, AgentResult
+from manta.core.outcomes import OutcomeSpace, Issue
+from manta.negotiation.history import NegotiationHistory
+from manta.negotiation.runner import Runner, NegotiationConfig
+
+SPACE = OutcomeSpace(issues=[
+    Issue(name="price", type="continuous", min_value=0, max_value=200),
+    Issue(name="service", type="discrete", values=["standard", "premium"]),
+])
+
+def record(step, response="reject"):
+    proposer, responder = ("A", "B") if step % 2 == 0 else ("B", "A")
+    return {"step": step, "proposer": proposer, "proposal": [{"price": float(step), "service": "premium"}],
+            "responder": responder, "response": response}
+
+class TestNegotiationHistory(unittest.TestCase):
+
+    def test_records_roundtrip(self):
+        history = NegotiationHistory(outcome_space=SPACE)
+        records = [record(i) for i in range(100)] + [record(100, "accept")]
+        for r in records:
+            history.append(r)
+
+        self.assertEqual(len(history), 101)
+        self.assertEqual(list(history), records)
+        self.assertEqual(history[-1], records[-1])
+        self.assertEqual(history[10:12], records[10:12])
+        self.assertEqual(history.column("steps").tolist(), list(range(101)))
+        self.assertEqual(history.column("offers")[5].tolist(), [5.0, 1.0])
+        self.assertEqual(history.names, ["A", "B"])
+
+    def test_ring_buffer_keeps_latest(self):
+        history = NegotiationHistory(capacity=8)
+        for i in range(30):
+            history.append(record(i))
+
+        self.assertEqual((len(history), history.total), (8, 30))
+        self.assertEqual([r["step"] for r in history], list(range(22, 30)))
+        self.assertEqual(history.column("steps").tolist(), list(range(22, 30)))
+
+    def test_view_is_read_only_and_live(self):
+        history = NegotiationHistory()
+        view = history.view()
+        self.assertFalse(hasattr(view, "append"))
+        history.append(record(0))
+        self.assertEqual(len(view), 1)
+        with self.assertRaises(ValueError):
+            view.column("steps")[0] = 5
+
+class Haggler(BaseAgent):
+    lengths: list = []
+
+    async def propose(self, state: AgentState) -> AgentResult:
+        self.lengths.append(len(state.history))
+        return AgentResult(response="offer", proposal={"price": 100.0, "service": "standard"})
+
+    async def respond(self, state: AgentState) -> AgentResult:
+        return AgentResult(response="reject")
+
+class TestRunnerHistory(unittest.TestCase):
+
+    def test_agents_see_bounded_history(self):
+        agent = Haggler(name="A", lengths=[])
+        config = NegotiationConfig(max_steps=40, outcome_space=SPACE, turbo=True, history_limit=10)
+        state = asyncio.run(Runner(config=config, agents=[agent, Haggler(name="B")]).run())
+
+        self.assertEqual((len(state.history), state.history.total), (10, 40))
+        self.assertEqual(agent.lengths[:6], [0, 2, 4, 6, 8, 10])
+        self.assertEqual(max(agent.lengths), 10)
+        self.assertEqual(len(state.model_dump()["history"]), 10)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,144 @@
+import asyncio
+import os
+import struct
+import tempfile
+import unittest
+from manta.core.agent import BaseAgent, AgentState, AgentResult
+from manta.core.outcomes import OutcomeSpace, Issue
+from manta.core.protocol import MultilateralProtocol
+from manta.negotiation.journal import NegotiationJournal, MAGIC
+from manta.negotiation.runner import Runner, NegotiationConfig
+
+SPACE = OutcomeSpace(issues=[
+    Issue(name="price", type="continuous", min_value=0, max_value=200),
+    Issue(name="service", type="discrete", values=["standard", "premium"]),
+])
+
+class Haggler(BaseAgent):
+    accept_at: int = -1
+    meso: bool = False # Propose MESO lists
+
+    def propose(self, state: AgentState) -> AgentResult:
+        offer = {"price": 100.0 + state.step, "service": "premium"}
+        return AgentResult(response="offer", proposal=[offer, {"price": 90.5, "service": "standard"}] if self.meso else offer)
+
+    def respond(self, state: AgentState) -> AgentResult:
+        return AgentResult(response="accept" if 0 <= self.accept_at <= state.step else "reject")
+
+def agents(accept_at: int = -1, meso: bool = False):
+    return [Haggler(name="A", meso=meso), Haggler(name="B", accept_at=accept_at, meso=meso)]
+
+def frame_offsets(data: bytes):
+    offsets, offset = [], len(MAGIC)
+    while offset < len(data):
+        offsets.append(offset)
+        offset += 8 + struct.unpack_from("<I", data, offset)[0]
+    return offsets
+
+class TestNegotiationJournal(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.dir.name, "deal.journal")
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def _run(self, runner, **options):
+        journal = NegotiationJournal(self.path, **options)
+        journal.attach(runner)
+        state = asyncio.run(runner.run())
+        journal.close()
+        return state, journal
+
+    def test_replay_matches_the_run(self):
+        for meso in (False, True):
+            runner = Runner(config=NegotiationConfig(outcome_space=SPACE, max_steps=20, turbo=True), agents=agents(7, meso))
+            state, _ = self._run(runner)
+            _, config, replayed = NegotiationJournal.replay(self.path)
+            self.assertEqual(config.model_dump(), runner.config.model_dump())
+            self.assertEqual((replayed.status, replayed.step, replayed.current_offer), (state.status, state.step, state.current_offer))
+            self.assertEqual(list(replayed.history), list(state.history))
+
+    def test_recover_after_crash_and_resume(self):
+        runner = Runner(config=NegotiationConfig(outcome_space=SPACE, max_steps=12, turbo=True), agents=agents())
+        state, _ = self._run(runner)
+        expected = list(state.history)
+
+        # The worker died while writing step 5: the torn frame and everything after it are ignored
+        with open(self.path, "rb") as f:
+            data = f.read()
+        offsets = frame_offsets(data) # Header, 12 steps, end
+        self.assertEqual(len(offsets), 14)
+        with open(self.path, "wb") as f:
+            f.write(data[:offsets[6] + 10])
+
+        recovered = NegotiationJournal.recover(self.path, agents())
+        self.assertEqual((recovered.state.status, recovered.state.step, len(recovered.state.history)), ("ongoing", 5, 5))
+        self.assertEqual(recovered.state.current_offer, expected[4]["proposal"])
+
+        resumed = asyncio.run(recovered.resume())
+        self.assertEqual((resumed.status, resumed.step), ("timedout", 12))
+        self.assertEqual(list(resumed.history), expected)
+        recovered.observers[0].close()
+
+        # The resumed journal is complete again
+        _, _, replayed = NegotiationJournal.replay(self.path)
+        self.assertEqual((replayed.status, list(replayed.history)), ("timedout", expected))
+
+    def test_compaction_bounds_the_file(self):
+        config = NegotiationConfig(outcome_space=SPACE, max_steps=500, turbo=True)
+        state, _ = self._run(Runner(config=config, agents=agents()), compact_every=50, keep=10)
+        compacted = os.path.getsize(self.path)
+        self._run(Runner(config=config, agents=agents()), compact_every=None)
+        self.assertLess(compacted * 5, os.path.getsize(self.path))
+
+        self._run(Runner(config=config, agents=agents()), compact_every=50, keep=10)
+        _, _, replayed = NegotiationJournal.replay(self.path)
+        self.assertEqual((replayed.status, replayed.step), ("timedout", 500))
+        self.assertEqual(list(replayed.history), list(state.history)[-10:])
+
+    def test_recover_from_a_snapshot_and_resume(self):
+        runner = Runner(config=NegotiationConfig(outcome_space=SPACE, max_steps=12, turbo=True), agents=agents())
+        state, _ = self._run(runner)
+        expected = list(state.history)
+
+        # The worker died right after the second compaction (10 steps): only the snapshot is left
+        self._run(Runner(config=NegotiationConfig(outcome_space=SPACE, max_steps=10, turbo=True), agents=agents()),
+                  compact_every=5, keep=20)
+        with open(self.path, "rb") as f:
+            data = f.read()
+        offsets = frame_offsets(data) # Header, snapshot, end
+        self.assertEqual(len(offsets), 3)
+        with open(self.path, "wb") as f:
+            f.write(data[:offsets[2]])
+
+        recovered = NegotiationJournal.recover(self.path, agents(), compact_every=5, keep=20)
+        recovered.config.max_steps = 12
+        self.assertEqual((recovered.state.status, recovered.state.step, len(recovered.state.history)), ("ongoing", 10, 10))
+        resumed = asyncio.run(recovered.resume())
+        recovered.observers[0].close()
+        self.assertEqual((resumed.status, resumed.step), ("timedout", 12))
+        self.assertEqual([(r["step"], r["proposer"]) for r in resumed.history], [(r["step"], r["proposer"]) for r in expected])
+        self.assertEqual(list(resumed.history), expected)
+
+    def test_multilateral_steps(self):
+        config = NegotiationConfig(outcome_space=SPACE, max_steps=10, turbo=True, protocol=MultilateralProtocol())
+        trio = [Haggler(name="A"), Haggler(name="B", accept_at=4), Haggler(name="C", accept_at=4)]
+        state, _ = self._run(Runner(config=config, agents=trio))
+        self.assertEqual(state.status, "success")
+        _, _, replayed = NegotiationJournal.replay(self.path)
+        self.assertEqual((replayed.status, replayed.step, list(replayed.history)), (state.status, state.step, list(state.history)))
+
+    def test_rejects_other_files_and_agents(self):
+        with open(self.path, "wb") as f:
+            f.write(b"not a journal")
+        with self.assertRaises(ValueError):
+            NegotiationJournal.replay(self.path)
+
+        self._run(Runner(config=NegotiationConfig(outcome_space=SPACE, max_steps=2, turbo=True), agents=agents()))
+        with self.assertRaises(ValueError):
+            NegotiationJournal.recover(self.path, [Haggler(name="X"), Haggler(name="Y")])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+import io
+import json
+import logging
+import unittest
+from manta.core.agent import BaseAgent, AgentState, AgentResult
+from manta.core.outcomes import OutcomeSpace, Issue
+from manta.negotiation.runner import Runner, NegotiationConfig
+from manta.utils.logging import Sampler, configure_logging, get_logger, shutdown_logging
+
+SPACE = OutcomeSpace(issues=[Issue(name="price", type="continuous", min_value=0, max_value=200)])
+
+class CrashingAgent(BaseAgent):
+    def propose(self, state: AgentState) -> AgentResult:
+        raise ValueError("boom")
+
+    def respond(self, state: AgentState) -> AgentResult:
+        return AgentResult(response="reject")
+
+class TestStructuredLogging(unittest.TestCase):
+
+    def tearDown(self):
+        shutdown_logging()
+
+    def _lines(self, stream):
+        shutdown_logging() # Flushes the background writer
+        return [json.loads(line) for line in stream.getvalue().splitlines()]
+
+    def test_import_configures_nothing(self):
+        self.assertNotEqual(logging.getLogger().level, logging.INFO) # No basicConfig(level=INFO) on import
+        self.assertFalse(get_logger("manta.test").is_enabled(logging.INFO))
+
+    def test_json_events_through_the_queue(self):
+        stream = io.StringIO()
+        configure_logging(level="DEBUG", fmt="json", stream=stream)
+        get_logger("manta.test").debug("agent.target", agent="A", target=0.9)
+        get_logger("manta.test").info("plain")
+        lines = self._lines(stream)
+        self.assertEqual([(l["event"], l["level"]) for l in lines], [("agent.target", "DEBUG"), ("plain", "INFO")])
+        self.assertEqual((lines[0]["agent"], lines[0]["target"], lines[0]["logger"]), ("A", 0.9, "manta.test"))
+
+    def test_levels_and_sampling(self):
+        stream = io.StringIO()
+        configure_logging(level="INFO", fmt="json", stream=stream, sample={"agent.*": 0.25})
+        log = get_logger("manta.test")
+        for i in range(8):
+            log.debug("debug.hidden", i=i)
+            log.info("agent.assess", i=i)
+            log.error("agent.crashed", i=i) # WARNING and above are never sampled
+        events = [(l["event"], l["i"]) for l in self._lines(stream)]
+        self.assertEqual([i for e, i in events if e == "agent.assess"], [0, 4])
+        self.assertEqual(len([e for e, _ in events if e == "agent.crashed"]), 8)
+        self.assertNotIn("debug.hidden", {e for e, _ in events})
+
+        with self.assertRaises(ValueError):
+            Sampler({"agent.assess": 0.0})
+
+    def test_full_queue_drops_instead_of_blocking(self):
+        stream = io.StringIO()
+        sink = configure_logging(level="INFO", stream=stream, queue_size=1)
+        sink.stop() # Nobody drains the queue
+        for i in range(5):
+            get_logger("manta.test").info("burst", i=i)
+        self.assertEqual(sink.dropped, 4)
+
+    def test_runner_errors_are_structured(self):
+        stream = io.StringIO()
+        configure_logging(level="INFO", fmt="json", stream=stream)
+        runner = Runner(config=NegotiationConfig(outcome_space=SPACE, max_steps=3, turbo=True),
+                        agents=[CrashingAgent(name="A"), CrashingAgent(name="B")])
+        self.assertEqual(runner.run_sync().status, "broken")
+        crash = [l for l in self._lines(stream) if l["event"] == "agent.crashed"]
+        self.assertEqual((crash[0]["agent"], crash[0]["phase"], crash[0]["error"]), ("A", "propose", "boom"))
+
+if __name__ == '__main__':
+    unittest.main()
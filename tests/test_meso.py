@@ -0,0 +1,167 @@
+import itertools
+import unittest
+from manta.core.outcomes import OutcomeSpace, Issue
+from manta.core.preferences import LinearAdditiveUtility
+import numpy as np
+from manta.core.meso import generate_meso, get_iso_index, select_diverse, embed_offers
+
+SPACE = OutcomeSpace(issues=[
+    Issue(name="price", type="continuous", min_value=50.0, max_value=200.0),
+    Issue(name="service", type="discrete", values=["standard", "premium", "enterprise"]),
+    Issue(name="duration", type="discrete", values=["1_year", "3_years"]),
+    Issue(name="payment", type="discrete", values=["net30", "net60", "upfront"]),
+])
+
+def make_utility(invert=True):
+    utility = LinearAdditiveUtility(weights={"price": 0.6, "service": 0.3, "duration": 0.1}, outcome_space=SPACE)
+    utility.add_curve("price", weight=0.6, invert=invert)
+    return utility
+
+def legacy_analytical_solve(utility, space, target, tolerance, max_offers):
+    """The per-query product scan the index replaces (buyer curves only)."""
+    discrete = [(i.name, i.values) for i in space.issues if i.name != "price"]
+    price = space.get_issue("price")
+    weight = utility.weights["price"]
+    found = []
+    for combo in itertools.product(*(vals for _, vals in discrete)):
+        if len(found) >= max_offers:
+            break
+        partial = {name: combo[i] for i, (name, _) in enumerate(discrete)}
+        u_fixed = utility.calculate({**partial, "price": price.min_value}) - weight
+        v_required = (target - u_fixed) / weight
+        if v_required < 0 or v_required > 1:
+            continue
+        offer = {**partial, "price": price.min_value + (1.0 - v_required) * (price.max_value - price.min_value)}
+        if abs(utility.calculate(offer) - target) <= tolerance:
+            found.append(offer)
+    return found
+
+class TestAnalyticalMeso(unittest.TestCase):
+
+    def test_matches_product_scan(self):
+        utility = make_utility()
+        for target in (0.1, 0.35, 0.5, 0.8, 0.95, 1.0):
+            with self.subTest(target=target):
+                expected = legacy_analytical_solve(utility, SPACE, target, 0.05, 5)
+                offers = generate_meso(utility, SPACE, target, tolerance=0.05, max_offers=5)
+                self.assertEqual([{k: v for k, v in o.items() if k != "price"} for o in offers],
+                                 [{k: v for k, v in o.items() if k != "price"} for o in expected])
+                for offer, ref in zip(offers, expected):
+                    self.assertAlmostEqual(offer["price"], ref["price"])
+
+    def test_offers_hit_target_for_seller_curves(self):
+        utility = make_utility(invert=False)
+        offers = generate_meso(utility, SPACE, 0.7, tolerance=1e-9, max_offers=3)
+        self.assertEqual(len(offers), 3)
+        for offer in offers:
+            self.assertAlmostEqual(utility.calculate(offer), 0.7)
+            self.assertTrue(SPACE.is_valid(offer))
+
+    def test_index_is_cached_and_rebuilt(self):
+        utility = make_utility()
+        index = get_iso_index(utility, SPACE)
+        self.assertEqual(len(index), 18)
+        self.assertIs(get_iso_index(utility, SPACE), index)
+
+        utility.add_curve("price", weight=0.6, invert=False)
+        self.assertIsNot(get_iso_index(utility, SPACE), index)
+
+    def test_unreachable_target(self):
+        self.assertEqual(generate_meso(make_utility(), SPACE, 1.5), [])
+
+    def test_several_continuous_issues(self):
+        space = OutcomeSpace(issues=[
+            Issue(name="price", type="continuous", min_value=50.0, max_value=200.0),
+            Issue(name="volume", type="continuous", min_value=0.0, max_value=1000.0),
+            Issue(name="lead_time", type="continuous", min_value=1.0, max_value=30.0),
+            Issue(name="notes", type="continuous", min_value=0.0, max_value=1.0), # No curve: free
+            Issue(name="service", type="discrete", values=["standard", "premium", "enterprise"]),
+        ])
+        utility = LinearAdditiveUtility(weights={"price": 0.4, "volume": 0.2, "lead_time": 0.2, "service": 0.2}, outcome_space=space)
+        utility.add_curve("price", weight=0.4) # Seller: higher is better
+        utility.add_curve("volume", weight=0.2, min_val=100.0, max_val=600.0) # Saturates inside the issue
+        utility.add_curve("lead_time", weight=0.2, min_val=0.0, max_val=60.0, invert=True) # Wider than the issue
+
+        for rng in (None, 7):
+            offers = generate_meso(utility, space, 0.7, tolerance=1e-9, max_offers=3, rng=rng)
+            self.assertEqual([o["service"] for o in offers], ["standard", "premium", "enterprise"])
+            for offer in offers:
+                self.assertAlmostEqual(utility.calculate(offer), 0.7, places=12)
+                self.assertTrue(space.is_valid(offer))
+
+        # Seeded offers are reproducible, and spread differently from the even split
+        self.assertEqual(generate_meso(utility, space, 0.7, rng=3), generate_meso(utility, space, 0.7, rng=3))
+        self.assertNotEqual(generate_meso(utility, space, 0.7, rng=3), generate_meso(utility, space, 0.7))
+        # Even split: every issue gives up the same fraction of its range
+        even = generate_meso(utility, space, 0.7, max_offers=1)[0]
+        self.assertAlmostEqual((even["price"] - 50.0) / 150.0, (even["volume"] - 100.0) / 500.0)
+        # The best offer scores 0.4 + 0.2 + 0.2 * (1 - 1/60) + 0.2 (enterprise)
+        self.assertEqual(generate_meso(utility, space, 0.999, max_offers=3), [])
+        self.assertEqual(len(generate_meso(utility, space, 0.996, tolerance=1e-9, max_offers=3)), 1)
+
+def min_spacing(offers, space):
+    points = embed_offers(offers, space)
+    gaps = np.sqrt(((points[:, None, :] - points[None, :, :]) ** 2).sum(axis=2))
+    return gaps[np.triu_indices(len(offers), k=1)].min()
+
+class TestDiverseMeso(unittest.TestCase):
+
+    def test_diverse_offers_spread_out(self):
+        utility = make_utility()
+        first = generate_meso(utility, SPACE, 0.6, tolerance=1e-9, max_offers=4)
+        diverse = generate_meso(utility, SPACE, 0.6, tolerance=1e-9, max_offers=4, selection="diverse")
+        self.assertEqual(len(diverse), 4)
+        for offer in diverse:
+            self.assertAlmostEqual(utility.calculate(offer), 0.6)
+        # The first hits only differ on the last issues; the diverse ones change several at a time
+        self.assertEqual(len({o["service"] for o in first}), 1)
+        self.assertGreater(len({o["service"] for o in diverse}), 1)
+        self.assertGreater(min_spacing(diverse, SPACE), min_spacing(first, SPACE))
+
+        # Monte Carlo hits go through the same selection
+        sampled = generate_meso(utility, SPACE, 0.6, tolerance=0.01, max_offers=4, method="monte_carlo", rng=0, selection="diverse")
+        self.assertEqual(len(sampled), 4)
+        self.assertGreater(min_spacing(sampled, SPACE), min_spacing(first, SPACE))
+
+    def test_select_diverse(self):
+        space = OutcomeSpace(issues=[Issue(name="x", type="continuous", min_value=0.0, max_value=10.0)])
+        offers = [{"x": float(x)} for x in (0, 1, 2, 5, 9, 10)]
+        self.assertEqual(select_diverse(offers, space, 3), [{"x": 0.0}, {"x": 10.0}, {"x": 5.0}])
+        self.assertEqual(select_diverse(offers[:2], space, 3), offers[:2])
+
+        # Fewer distinct offers than k: no offer twice
+        tiers = OutcomeSpace(issues=[Issue(name="s", type="discrete", values=["a", "b"])])
+        pool = [{"s": "a"}, {"s": "a"}, {"s": "b"}, {"s": "b"}]
+        self.assertEqual(select_diverse(pool, tiers, 3), [{"s": "a"}, {"s": "b"}])
+        self.assertEqual(select_diverse(pool[:2], tiers, 3), [{"s": "a"}])
+
+class TestMonteCarloMeso(unittest.TestCase):
+
+    def test_seeded_and_within_tolerance(self):
+        utility = make_utility()
+        offers = generate_meso(utility, SPACE, 0.6, tolerance=0.01, max_offers=5, method="monte_carlo", rng=42)
+        again = generate_meso(utility, SPACE, 0.6, tolerance=0.01, max_offers=5, method="monte_carlo", rng=42)
+
+        self.assertEqual(len(offers), 5)
+        self.assertEqual(offers, again)
+        for offer in offers:
+            self.assertTrue(SPACE.is_valid(offer))
+            self.assertLessEqual(abs(utility.calculate(offer) - 0.6), 0.01)
+
+    def test_plain_callable_and_dedupe(self):
+        space = OutcomeSpace(issues=[Issue(name="size", type="discrete", values=[1, 2, 3, 4])])
+
+        def utility(outcome):
+            if outcome["size"] == 4:
+                raise ValueError("unsupported size")
+            return outcome["size"] / 4.0
+
+        offers = generate_meso(utility, space, 0.5, tolerance=0.26, max_offers=10, method="monte_carlo", rng=0)
+        self.assertEqual(sorted(o["size"] for o in offers), [1, 2, 3])
+
+    def test_fallback_from_analytical(self):
+        offers = generate_meso(lambda o: o["price"] / 200.0, SPACE, 0.5, tolerance=0.02, rng=1)
+        self.assertEqual(len(offers), 3)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,106 @@
+import asyncio
+import unittest
+from manta.core.agent import BaseAgent, AgentState, AgentResult
+from manta.core.outcomes import OutcomeSpace, Issue
+from manta.agents.standard import StandardAgent
+from manta.negotiation.runner import Runner, NegotiationConfig
+from manta.utils.logging import LatencyHistogram, current_metrics, instrument
+
+SPACE = OutcomeSpace(issues=[
+    Issue(name="price", type="continuous", min_value=50, max_value=150),
+    Issue(name="service", type="discrete", values=["standard", "premium", "enterprise"]),
+])
+
+class TimedAgent(BaseAgent):
+    def propose(self, state: AgentState) -> AgentResult:
+        with self.timer("thinking"):
+            pass
+        return AgentResult(response="offer", proposal={"price": 100.0, "service": "standard"})
+
+    def respond(self, state: AgentState) -> AgentResult:
+        return AgentResult(response="reject")
+
+class TestLatencyHistogram(unittest.TestCase):
+
+    def test_percentiles_and_snapshot(self):
+        hist = LatencyHistogram()
+        for us in [1] * 90 + [1000] * 10:
+            hist.record(us * 1e-6)
+        snap = hist.snapshot()
+        self.assertEqual(snap["count"], 100)
+        self.assertAlmostEqual(snap["mean"], 100.9e-6)
+        self.assertLessEqual(snap["p50"], 2e-6)
+        self.assertGreaterEqual(snap["p99"], 512e-6)
+        self.assertEqual(sum(snap["buckets"].values()), 100)
+        self.assertEqual(LatencyHistogram().snapshot()["p99"], 0.0)
+
+class TestRunnerMetrics(unittest.TestCase):
+
+    def _runner(self, agents, **config):
+        config.setdefault("turbo", True)
+        return Runner(config=NegotiationConfig(outcome_space=SPACE, max_steps=6, **config), agents=agents)
+
+    def test_disabled_by_default(self):
+        state = self._runner([TimedAgent(name="A"), TimedAgent(name="B")]).run_sync()
+        self.assertIsNone(state.metrics)
+        self.assertIsNone(current_metrics())
+
+    def test_step_and_agent_histograms(self):
+        state = self._runner([TimedAgent(name="A"), TimedAgent(name="B")], metrics=True).run_sync()
+        hists = state.metrics["histograms"]
+        self.assertEqual(state.metrics["steps"], 6)
+        self.assertEqual(hists["step"]["count"], 6)
+        self.assertEqual(hists["propose.A"]["count"] + hists["propose.B"]["count"], 6)
+        self.assertEqual(hists["respond.B"]["count"], 3)
+        self.assertEqual(hists["A.thinking"]["count"], 3)
+        self.assertIsNone(current_metrics())
+
+    def test_meso_time_and_async_loop(self):
+        weights = {"price": 0.7, "service": 0.3}
+        agents = [
+            StandardAgent(name="buyer", role="buyer", weights=weights, outcome_space=SPACE, reservation_val=0.99),
+            StandardAgent(name="seller", role="seller", weights=weights, outcome_space=SPACE, reservation_val=0.99),
+        ]
+        state = asyncio.run(self._runner(agents, metrics=True).run())
+        hists = state.metrics["histograms"]
+        self.assertEqual(hists["meso"]["count"], hists["propose.buyer"]["count"] + hists["propose.seller"]["count"])
+        self.assertGreater(hists["meso"]["total"], 0.0)
+
+    def test_concurrent_negotiations_are_isolated(self):
+        on = self._runner([TimedAgent(name="A"), TimedAgent(name="B")], metrics=True, turbo=False)
+        off = self._runner([TimedAgent(name="C"), TimedAgent(name="D")], turbo=False)
+
+        async def both():
+            return await asyncio.gather(on.run(), off.run())
+        state_on, state_off = asyncio.run(both())
+        self.assertIsNone(state_off.metrics)
+        self.assertEqual(set(state_on.metrics["histograms"]), {"step", "propose.A", "propose.B", "respond.A", "respond.B", "A.thinking", "B.thinking"})
+
+    def test_metrics_survive_cancellation(self):
+        class SlowAgent(TimedAgent):
+            async def respond(self, state: AgentState) -> AgentResult:
+                await asyncio.sleep(0.01 if state.step < 2 else 10.0)
+                return AgentResult(response="reject")
+
+        runner = self._runner([SlowAgent(name="A"), SlowAgent(name="B")], metrics=True)
+
+        async def cancelled():
+            task = asyncio.ensure_future(runner.run())
+            await asyncio.sleep(0.2)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+        asyncio.run(cancelled())
+        self.assertEqual(runner.state.metrics["histograms"]["step"]["count"], 2)
+
+    def test_profile_modes(self):
+        state = self._runner([TimedAgent(name="A"), TimedAgent(name="B")], profile="cprofile").run_sync()
+        self.assertIn("_run_sync", state.metrics["profile"]["report"])
+        state = self._runner([TimedAgent(name="A"), TimedAgent(name="B")], profile="tracemalloc").run_sync()
+        self.assertGreater(state.metrics["profile"]["peak_bytes"], 0)
+        with self.assertRaises(ValueError):
+            with instrument(profile="perf"):
+                pass
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+import asyncio
+import unittest
+from manta.core.outcomes import OutcomeSpace, Issue
+from manta.core.opponent import FrequencyOpponentModel
+from manta.agents.standard import StandardAgent
+from manta.negotiation.runner import Runner, NegotiationConfig
+
+SPACE = OutcomeSpace(issues=[
+    Issue(name="price", type="continuous", min_value=50, max_value=150),
+    Issue(name="service", type="discrete", values=["standard", "premium", "enterprise"]),
+    Issue(name="duration", type="discrete", values=["1_year", "3_years"])
+])
+
+class TestFrequencyOpponentModel(unittest.TestCase):
+
+    def test_update_learns_values_and_weights(self):
+        model = FrequencyOpponentModel(SPACE)
+        # The opponent moves on price but never on service
+        for price in (140.0, 120.0, 100.0):
+            model.update({"price": price, "service": "premium", "duration": "1_year" if price > 110 else "3_years"})
+
+        self.assertEqual(model.observed, 3)
+        self.assertEqual(model.counts[1], [1.0, 4.0, 1.0]) # Laplace smoothed
+        self.assertEqual(model.weights[0], 1.0) # Price moved every time
+        self.assertAlmostEqual(model.weights[1], 1.4) # Service kept twice
+        self.assertAlmostEqual(model.weights[2], 1.2) # Duration kept once
+
+    def test_meso_round_is_one_observation(self):
+        model = FrequencyOpponentModel(SPACE)
+        # 3 options per round: only duration is fixed across rounds (service is shared by the
+        # options of a round, but changes from round to round)
+        for price, service in ((140.0, "standard"), (120.0, "premium"), (100.0, "enterprise")):
+            model.update_proposal([
+                {"price": price, "service": service, "duration": "3_years"},
+                {"price": price - 30.0, "service": service, "duration": "3_years"},
+                {"price": price + 5.0, "service": service, "duration": "3_years"},
+            ])
+        self.assertEqual(model.observed, 3)
+        self.assertEqual(model.weights[:2], [1.0, 1.0]) # Sibling options are not consecutive offers
+        self.assertAlmostEqual(model.weights[2], 1.4) # Duration kept between the 3 rounds
+        self.assertEqual([round(c, 9) for c in model.counts[2]], [1.0, 4.0]) # One count per round
+        self.assertEqual([round(c, 9) for c in model.counts[1]], [2.0, 2.0, 2.0])
+
+    def test_predict_ranks_opponent_favourite_first(self):
+        model = FrequencyOpponentModel(SPACE)
+        model.update_proposal([
+            {"price": 150.0, "service": "enterprise", "duration": "3_years"},
+            {"price": 148.0, "service": "enterprise", "duration": "1_year"},
+        ])
+        offers = [
+            {"price": 60.0, "service": "standard", "duration": "1_year"},
+            {"price": 145.0, "service": "enterprise", "duration": "3_years"},
+            {"price": 100.0, "service": "premium", "duration": "3_years"},
+        ]
+        scores = model.predict(offers)
+        self.assertEqual(scores.shape, (3,))
+        self.assertTrue(((scores >= 0.0) & (scores <= 1.0)).all())
+        self.assertEqual(model.rank(offers), [offers[1], offers[2], offers[0]])
+
+    def test_rank_is_noop_without_observations(self):
+        model = FrequencyOpponentModel(SPACE)
+        offers = [{"price": float(p), "service": "standard", "duration": "1_year"} for p in (70, 90, 60)]
+        self.assertEqual(model.rank(offers), offers)
+        model.update_proposal(None)
+        self.assertEqual(model.observed, 0)
+
+class TestAgentWithOpponentModel(unittest.TestCase):
+
+    def negotiate(self, opponent_model: bool):
+        buyer = StandardAgent(name="buyer", role="buyer", outcome_space=SPACE, personality="boulware",
+                              aspiration_start=0.85, reservation_val=0.5, opponent_model=opponent_model,
+                              weights={"price": 0.6, "service": 0.3, "duration": 0.1})
+        seller = StandardAgent(name="seller", role="seller", outcome_space=SPACE, personality="boulware",
+                               aspiration_start=0.85, reservation_val=0.5, opponent_model=opponent_model,
+                               weights={"price": 0.7, "service": 0.2, "duration": 0.1})
+        runner = Runner(config=NegotiationConfig(max_steps=10, outcome_space=SPACE, turbo=True), agents=[buyer, seller])
+        return asyncio.run(runner.run())
+
+    def test_fewer_rounds_to_agreement(self):
+        # Two tough agents time out without the model, and agree quickly with it
+        self.assertEqual(self.negotiate(opponent_model=False).status, "timedout")
+        state = self.negotiate(opponent_model=True)
+        self.assertEqual(state.status, "success")
+        self.assertLess(state.step, 10)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+import itertools
+import unittest
+import numpy as np
+from manta.core.outcomes import OutcomeSpace, Issue
+
+class TestCompiledOutcomeSpace(unittest.TestCase):
+
+    def setUp(self):
+        self.space = OutcomeSpace(issues=[
+            Issue(name="price", type="continuous", min_value=50.0, max_value=200.0),
+            Issue(name="service", type="discrete", values=["standard", "premium", "enterprise"]),
+            Issue(name="duration", type="discrete", values=["1_year", "3_years"]),
+        ])
+
+    def test_lookup_and_validity(self):
+        self.assertEqual(self.space.get_issue("service").name, "service")
+        self.assertIsNone(self.space.get_issue("color"))
+
+        self.assertTrue(self.space.is_valid({"price": 100.0, "service": "premium"}))
+        self.assertFalse(self.space.is_valid({"price": 300.0}))
+        self.assertFalse(self.space.is_valid({"service": "gold"}))
+        self.assertFalse(self.space.is_valid({"color": "red"}))
+
+    def test_encode_decode_roundtrip(self):
+        compiled = self.space.compile()
+        outcome = {"price": 120.5, "service": "enterprise", "duration": "1_year"}
+
+        row = compiled.encode(outcome)
+        np.testing.assert_array_equal(row, [120.5, 2.0, 0.0])
+        self.assertEqual(compiled.decode(row), outcome)
+
+    def test_encode_batch_missing_and_unknown(self):
+        compiled = self.space.compile()
+        encoded = compiled.encode_batch([{"price": 60.0}, {"service": "gold", "duration": "3_years"}])
+
+        self.assertTrue(np.isnan(encoded[0, 1]))
+        self.assertEqual(encoded[1, 1], -1)
+        self.assertEqual(compiled.decode_batch(encoded), [{"price": 60.0}, {"duration": "3_years"}])
+
+    def test_cache_follows_issue_list(self):
+        compiled = self.space.compile()
+        self.assertIs(self.space.compile(), compiled)
+
+        self.space.issues.append(Issue(name="payment", type="discrete", values=["net30", "upfront"]))
+        self.assertEqual(self.space.compile().width, 4)
+        self.assertIsNotNone(self.space.get_issue("payment"))
+
+        # Issues replaced or edited in place
+        self.space.issues[1] = Issue(name="service", type="discrete", values=["basic", "gold"])
+        self.assertEqual(self.space.get_issue("service").values, ["basic", "gold"])
+        self.assertTrue(self.space.is_valid({"service": "gold"}))
+        self.space.issues[1].values.append("platinum")
+        self.assertTrue(self.space.is_valid({"service": "platinum"}))
+        self.space.issues[0].max_value = 400.0
+        self.assertTrue(self.space.is_valid({"price": 300.0}))
+        compiled = self.space.compile()
+        self.assertIs(self.space.compile(), compiled)
+
+class TestOutcomeEnumeration(unittest.TestCase):
+
+    def setUp(self):
+        self.space = OutcomeSpace(issues=[
+            Issue(name="price", type="continuous", min_value=50.0, max_value=150.0),
+            Issue(name="service", type="discrete", values=["standard", "premium", "enterprise"]),
+            Issue(name="duration", type="discrete", values=["1_year", "3_years"]),
+        ])
+
+    def test_product_order_in_chunks(self):
+        outcomes = self.space.enumerate(resolution=30.0, chunk_size=7)
+        # The grid keeps both bounds, with a step of at most the resolution
+        np.testing.assert_allclose(outcomes.grids[0], [50.0, 75.0, 100.0, 125.0, 150.0])
+        self.assertEqual((outcomes.cardinality, len(outcomes), outcomes.n_chunks), (30, 30, 5))
+
+        blocks = list(outcomes)
+        self.assertEqual([b.shape[0] for b in blocks], [7, 7, 7, 7, 2])
+        expected = list(itertools.product(outcomes.grids[0].tolist(), range(3), range(2)))
+        np.testing.assert_array_equal(np.vstack(blocks), expected)
+        self.assertEqual(next(outcomes.outcomes()), {"price": 50.0, "service": "standard", "duration": "1_year"})
+        np.testing.assert_array_equal(outcomes.chunk(29, 40), [[150.0, 2, 1]])
+
+    def test_cardinality(self):
+        self.assertEqual(self.space.cardinality(resolution=0.01), 10_001 * 6)
+        self.assertEqual(self.space.cardinality(resolution={"price": 100.0}), 12)
+        with self.assertRaises(ValueError):
+            self.space.enumerate() # A continuous issue needs a resolution
+
+        # Exact past int64, without generating anything
+        wide = OutcomeSpace(issues=[Issue(name=f"x{i}", type="discrete", values=list(range(10))) for i in range(20)])
+        self.assertEqual(wide.cardinality(), 10 ** 20)
+
+if __name__ == '__main__':
+    unittest.main()
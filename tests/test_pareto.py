@@ -0,0 +1,175 @@
+import asyncio
+import unittest
+import numpy as np
+from manta.core.pareto import (
+    find_pareto_frontier, is_dominated, pareto_mask, IncrementalParetoFrontier, ParetoTracker, space_pareto_frontier,
+    nash_point, kalai_smorodinsky_point
+)
+from manta.core.outcomes import OutcomeSpace, Issue
+from manta.core.preferences import LinearAdditiveUtility
+
+def reference_frontier(utilities):
+    """The original greedy filter: descending social welfare, keep if not dominated by kept points."""
+    ranked = sorted(enumerate(utilities), key=lambda x: sum(x[1]), reverse=True)
+    frontier_indices, frontier_utils = [], []
+    for idx, utils in ranked:
+        if not is_dominated(utils, frontier_utils):
+            frontier_indices.append(idx)
+            frontier_utils.append(utils)
+    return sorted(frontier_indices)
+
+class TestParetoEngine(unittest.TestCase):
+
+    def test_known_frontier(self):
+        utilities = [(10.0, 10.0), (5.0, 5.0), (12.0, 8.0), (8.0, 12.0), (9.0, 9.0)]
+        self.assertEqual(find_pareto_frontier(["A", "B", "C", "D", "E"], utilities), [0, 2, 3])
+
+    def test_matches_reference(self):
+        rng = np.random.default_rng(7)
+        for k in (1, 2, 3, 4):
+            for n in (1, 10, 300):
+                # Integer grids create ties and duplicates; floats create the generic case
+                for utils in (rng.integers(0, 6, size=(n, k)).astype(float), rng.random((n, k))):
+                    as_tuples = [tuple(row) for row in utils.tolist()]
+                    with self.subTest(k=k, n=n):
+                        self.assertEqual(find_pareto_frontier(as_tuples, as_tuples), reference_frontier(as_tuples))
+
+    def test_small_blocks(self):
+        utils = np.random.default_rng(3).random((400, 3))
+        as_tuples = [tuple(row) for row in utils.tolist()]
+        self.assertEqual(np.flatnonzero(pareto_mask(utils, block_size=7)).tolist(), reference_frontier(as_tuples))
+
+    def test_empty(self):
+        self.assertEqual(find_pareto_frontier([], []), [])
+
+class TestSpaceFrontier(unittest.TestCase):
+
+    def test_streamed_frontier_matches_full_scan(self):
+        space = OutcomeSpace(issues=[
+            Issue(name="price", type="continuous", min_value=50, max_value=150),
+            Issue(name="service", type="discrete", values=["standard", "premium", "enterprise"]),
+            Issue(name="duration", type="discrete", values=["1_year", "3_years"]),
+        ])
+        buyer = LinearAdditiveUtility(weights={"price": 0.6, "service": 0.3, "duration": 0.1}, outcome_space=space)
+        buyer.add_curve("price", 0.6, invert=True)
+        buyer.add_discrete("service", 0.3, {"standard": 0.0, "premium": 0.6, "enterprise": 1.0})
+        buyer.add_discrete("duration", 0.1, {"1_year": 1.0, "3_years": 0.0})
+
+        # The seller is a plain function: scored per decoded outcome
+        def seller(outcome):
+            return 0.7 * (outcome["price"] - 50) / 100 + 0.2 * (outcome["service"] != "standard") + 0.1 * (outcome["duration"] == "3_years")
+
+        rows, utils = space_pareto_frontier(space, [buyer, seller], resolution=5.0, chunk_size=16)
+        everything = np.vstack(list(space.enumerate(resolution=5.0)))
+        all_utils = np.column_stack([buyer.calculate_batch(everything), [seller(o) for o in space.compile().decode_batch(everything)]])
+        keep = pareto_mask(all_utils)
+        np.testing.assert_array_equal(rows, everything[keep])
+        np.testing.assert_allclose(utils, all_utils[keep])
+
+def bargaining_scenario():
+    space = OutcomeSpace(issues=[
+        Issue(name="price", type="continuous", min_value=50, max_value=150),
+        Issue(name="service", type="discrete", values=["standard", "premium", "enterprise"]),
+        Issue(name="duration", type="discrete", values=["1_year", "3_years"]),
+        Issue(name="volume", type="continuous", min_value=0, max_value=1000),
+    ])
+    buyer = LinearAdditiveUtility(weights={"price": 0.5, "service": 0.2, "duration": 0.1, "volume": 0.2}, outcome_space=space)
+    buyer.add_curve("price", 0.5, invert=True)
+    buyer.add_discrete("service", 0.2, {"standard": 0.0, "premium": 0.6, "enterprise": 1.0})
+    buyer.add_discrete("duration", 0.1, {"1_year": 1.0, "3_years": 0.0})
+    buyer.add_curve("volume", 0.2, min_val=100, max_val=600)
+    seller = LinearAdditiveUtility(weights={"price": 0.6, "service": 0.1, "duration": 0.2, "volume": 0.1}, outcome_space=space)
+    seller.add_curve("price", 0.6, min_val=70, max_val=140) # Narrower than the issue: the curve is clipped
+    seller.add_discrete("service", 0.1, {"standard": 1.0, "premium": 0.5, "enterprise": 0.0})
+    seller.add_discrete("duration", 0.2, {"1_year": 0.0, "3_years": 1.0})
+    seller.add_curve("volume", 0.1, min_val=200, max_val=900, invert=True)
+    return space, buyer, seller
+
+class TestBargainingSolutions(unittest.TestCase):
+
+    def test_analytic_matches_frontier_search(self):
+        space, buyer, seller = bargaining_scenario()
+        resolution = {"price": 1.0, "volume": 50.0}
+        for disagreement in ((0.0, 0.0), (0.3, 0.2)):
+            for solve in (nash_point, kalai_smorodinsky_point):
+                exact = solve([buyer, seller], space, disagreement)
+                # A plain function forces the (discretized) frontier search
+                grid = solve([buyer, lambda o: seller(o)], space, disagreement, resolution=resolution)
+                np.testing.assert_allclose(exact.utilities, (buyer(exact.outcome), seller(exact.outcome)))
+                if solve is nash_point: # (A coarse grid also underestimates the KS ideal point)
+                    self.assertGreaterEqual(exact.value, grid.value - 1e-12)
+                self.assertAlmostEqual(exact.value, grid.value, delta=0.005)
+                self.assertEqual({k: v for k, v in exact.outcome.items() if k in ("service", "duration")},
+                                 {k: v for k, v in grid.outcome.items() if k in ("service", "duration")})
+
+    def test_kalai_smorodinsky_equal_shares(self):
+        space, buyer, seller = bargaining_scenario()
+        point = kalai_smorodinsky_point([buyer, seller], space)
+        # Both ideals are 1.0 here: the continuous price splits the gains evenly
+        self.assertAlmostEqual(point.utilities[0], point.utilities[1])
+        self.assertAlmostEqual(point.value, point.utilities[0])
+
+    def test_no_gain_no_solution(self):
+        space, buyer, seller = bargaining_scenario()
+        self.assertIsNone(nash_point([buyer, seller], space, (0.9, 0.9)))
+        self.assertIsNone(kalai_smorodinsky_point([buyer, seller], space, (0.9, 0.9)))
+
+class TestIncrementalFrontier(unittest.TestCase):
+
+    def _check_stream(self, utils):
+        frontier = IncrementalParetoFrontier()
+        for i, row in enumerate(utils):
+            frontier.insert(i, row)
+            seen = [tuple(r) for r in utils[:i + 1]]
+            self.assertEqual(sorted(frontier.outcomes), find_pareto_frontier(seen, seen))
+        np.testing.assert_array_equal(frontier.utilities, [utils[i] for i in frontier.outcomes])
+
+    def test_matches_batch_frontier(self):
+        rng = np.random.default_rng(11)
+        for k in (2, 3, 4):
+            with self.subTest(k=k):
+                self._check_stream(rng.integers(0, 8, size=(150, k)).astype(float).tolist())
+                self._check_stream(rng.random((150, k)).tolist())
+
+    def test_insert_result_and_distance(self):
+        frontier = IncrementalParetoFrontier()
+        self.assertTrue(frontier.insert("A", (0.5, 0.5)))
+        self.assertFalse(frontier.insert("B", (0.2, 0.5)))
+        self.assertTrue(frontier.insert("C", (0.5, 0.5))) # Duplicates are not dominated
+        self.assertTrue(frontier.insert("D", (0.6, 0.6))) # Evicts A and C
+
+        self.assertEqual(frontier.outcomes, ["D"])
+        self.assertAlmostEqual(frontier.distance((0.6, 0.2)), 0.4)
+        self.assertEqual(frontier.distance((0.9, 0.0)), 0.0)
+
+        with self.assertRaises(ValueError):
+            frontier.insert("E", (1.0, 1.0, 1.0))
+
+    def test_tracker_in_runner(self):
+        from manta.core.agent import BaseAgent, AgentResult
+        from manta.core.outcomes import OutcomeSpace, Issue
+        from manta.negotiation.runner import Runner, NegotiationConfig
+
+        class PriceAgent(BaseAgent):
+            async def propose(self, state):
+                return AgentResult(response="offer", proposal=[{"price": 10.0 * state.step}, {"price": 5.0}])
+
+            async def respond(self, state):
+                return AgentResult(response="accept" if state.step >= 3 else "reject")
+
+        space = OutcomeSpace(issues=[Issue(name="price", type="continuous", min_value=0, max_value=100)])
+        tracker = ParetoTracker([lambda o: o["price"], lambda o: 100.0 - o["price"]])
+        runner = Runner(
+            config=NegotiationConfig(max_steps=10, outcome_space=space),
+            agents=[PriceAgent(name="A"), PriceAgent(name="B")],
+            observers=[tracker],
+        )
+        asyncio.run(runner.run())
+
+        self.assertEqual(runner.state.status, "success")
+        self.assertEqual(len(tracker.distances), len(runner.state.history))
+        self.assertEqual(tracker.frontier.inserted, 2 * len(runner.state.history))
+        self.assertEqual(tracker.distances, [0.0] * len(runner.state.history)) # Zero-sum: everything is efficient
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,65 @@
+import random
+import unittest
+import numpy as np
+from manta.core.outcomes import OutcomeSpace, Issue
+from manta.core.preferences import LinearAdditiveUtility
+
+SPACE = OutcomeSpace(issues=[
+    Issue(name="price", type="continuous", min_value=50.0, max_value=200.0),
+    Issue(name="service", type="discrete", values=["standard", "premium", "enterprise"]),
+    Issue(name="duration", type="discrete", values=["1_year", "3_years"]),
+    Issue(name="payment", type="discrete", values=["net30", "net60", "upfront"]),
+])
+
+def random_outcomes(n, seed=0):
+    rng = random.Random(seed)
+    return [
+        {
+            "price": rng.uniform(40.0, 210.0), # Slightly out of bounds to exercise clipping
+            "service": rng.choice(["standard", "premium", "enterprise"]),
+            "duration": rng.choice(["1_year", "3_years"]),
+            "payment": rng.choice(["net30", "net60", "upfront"]),
+        }
+        for _ in range(n)
+    ]
+
+class TestCalculateBatch(unittest.TestCase):
+
+    def setUp(self):
+        self.utility = LinearAdditiveUtility(
+            weights={"price": 0.6, "service": 0.3, "duration": 0.1}, outcome_space=SPACE
+        )
+        self.utility.add_curve("price", weight=0.6, invert=True)
+
+    def test_matches_scalar_calculate(self):
+        outcomes = random_outcomes(500)
+        expected = [self.utility.calculate(o) for o in outcomes]
+        self.assertEqual(self.utility.calculate_batch(outcomes).tolist(), expected)
+
+    def test_encoded_input(self):
+        outcomes = random_outcomes(50, seed=1)
+        encoded = SPACE.compile().encode_batch(outcomes)
+        np.testing.assert_array_equal(
+            self.utility.calculate_batch(encoded), self.utility.calculate_batch(outcomes)
+        )
+
+    def test_discrete_mapping_and_recompile(self):
+        outcomes = random_outcomes(100, seed=2)
+        self.utility.calculate_batch(outcomes) # Populate the cache
+
+        self.utility.weights["payment"] = 0.2
+        self.utility.add_discrete("payment", 0.2, {"upfront": 1.0, "net30": 0.5})
+        expected = [self.utility.calculate(o) for o in outcomes]
+        self.assertEqual(self.utility.calculate_batch(outcomes).tolist(), expected)
+
+    def test_missing_issue_scores_zero(self):
+        outcome = {"price": 50.0, "service": "enterprise"}
+        self.assertEqual(self.utility.calculate_batch([outcome])[0], self.utility.calculate(outcome))
+
+    def test_requires_outcome_space(self):
+        utility = LinearAdditiveUtility(weights={"price": 1.0})
+        with self.assertRaises(ValueError):
+            utility.calculate_batch([{"price": 1.0}])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,133 @@
+import asyncio
+import time
+import unittest
+from manta.core.agent import BaseAgent, AgentState, AgentResult
+from manta.core.outcomes import OutcomeSpace, Issue
+from manta.core.protocol import MultilateralProtocol, broadcast
+from manta.negotiation.runner import Runner, NegotiationConfig
+
+SPACE = OutcomeSpace(issues=[Issue(name="price", type="continuous", min_value=0, max_value=200)])
+
+class VotingAgent(BaseAgent):
+    accept_at: int = -1 # Step from which offers are accepted (-1 = never)
+    response: str = "reject" # Response before accept_at
+    delay: float = 0.0 # Seconds each respond() takes
+
+    async def propose(self, state: AgentState) -> AgentResult:
+        return AgentResult(response="offer", proposal={"price": 100 + state.step})
+
+    async def respond(self, state: AgentState) -> AgentResult:
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        if 0 <= self.accept_at <= state.step:
+            return AgentResult(response="accept")
+        return AgentResult(response=self.response)
+
+class CrashingResponder(VotingAgent):
+    async def respond(self, state: AgentState) -> AgentResult:
+        raise ValueError("I crashed!")
+
+class CancellingResponder(VotingAgent):
+    async def respond(self, state: AgentState) -> AgentResult:
+        raise asyncio.CancelledError() # E.g. an agent cancelling its own internal task badly
+
+class TestMultilateralProtocol(unittest.TestCase):
+
+    def _run(self, agents, protocol, **config):
+        config.setdefault("max_steps", 10)
+        config = NegotiationConfig(outcome_space=SPACE, turbo=True, protocol=protocol, **config)
+        return asyncio.run(Runner(config=config, agents=agents).run())
+
+    def test_rules(self):
+        unanimity = MultilateralProtocol()
+        self.assertEqual(unanimity.decide(["accept", "accept", "accept"]), "accept")
+        self.assertEqual(unanimity.decide(["accept", "reject", "accept"]), "reject")
+        self.assertEqual(unanimity.decide(["accept", "end"]), "end")
+
+        majority = MultilateralProtocol(rule="quorum", quorum=0.5)
+        self.assertEqual(majority.required(3), 2)
+        self.assertEqual(majority.decide(["accept", "reject", "accept"]), "accept")
+        self.assertEqual(majority.decide(["accept", "reject", "reject"]), "reject")
+        self.assertEqual(MultilateralProtocol(rule="quorum", quorum=1 / 3).required(3), 1)
+        self.assertEqual(MultilateralProtocol().responders(4, 2), [3, 0, 1])
+
+        with self.assertRaises(ValueError):
+            MultilateralProtocol(rule="quorum", quorum=0.0)
+
+    def test_every_agent_responds(self):
+        agents = [VotingAgent(name="A"), VotingAgent(name="B", accept_at=0), VotingAgent(name="C", accept_at=2)]
+        state = self._run(agents, MultilateralProtocol())
+        # Unanimity needs C too: the round at step 2 (proposed by C, answered by A and B) fails,
+        # then A's proposal at step 3 is accepted by B and C
+        self.assertEqual((state.status, state.step, state.current_offer), ("success", 3, {"price": 103}))
+        self.assertEqual(len(state.history), 8) # 2 records per round
+        self.assertEqual([r["responder"] for r in state.history[:2]], ["B", "C"])
+        self.assertEqual([r["proposer"] for r in state.history[::2]], ["A", "B", "C", "A"])
+
+    def test_quorum(self):
+        agents = [VotingAgent(name="A"), VotingAgent(name="B", accept_at=1), VotingAgent(name="C"), VotingAgent(name="D")]
+        state = self._run(agents, MultilateralProtocol(rule="quorum", quorum=0.3))
+        self.assertEqual((state.status, state.step), ("success", 2)) # B is a responder again at step 2
+
+        state = self._run(agents, MultilateralProtocol(rule="quorum", quorum=0.5))
+        self.assertEqual((state.status, state.step), ("timedout", 10))
+
+    def test_end_and_crash_break(self):
+        agents = [VotingAgent(name="A"), VotingAgent(name="B", accept_at=0), VotingAgent(name="C", response="end")]
+        self.assertEqual(self._run(agents, MultilateralProtocol(rule="quorum")).status, "broken")
+
+        agents = [VotingAgent(name="A"), VotingAgent(name="B", accept_at=0), CrashingResponder(name="C")]
+        state = self._run(agents, MultilateralProtocol())
+        self.assertEqual((state.status, len(state.history)), ("broken", 0))
+
+        agents[2] = CancellingResponder(name="C")
+        state = self._run(agents, MultilateralProtocol())
+        self.assertEqual((state.status, len(state.history)), ("broken", 0))
+
+    def test_end_is_recorded_under_both_protocols(self):
+        histories = []
+        for protocol in (None, MultilateralProtocol()):
+            state = self._run([VotingAgent(name="A"), VotingAgent(name="B", response="end")], protocol)
+            self.assertEqual((state.status, state.step), ("broken", 0))
+            histories.append(list(state.history))
+        self.assertEqual(histories[0], histories[1])
+        self.assertEqual([r["response"] for r in histories[0]], ["end"])
+
+    def test_responders_run_concurrently(self):
+        responders = [VotingAgent(name=f"R{i}", delay=0.05) for i in range(4)]
+        state = AgentState(step=0, time=0.0, relative_time=0.0, current_offer={"price": 1})
+        t0 = time.perf_counter()
+        results = asyncio.run(broadcast(responders, [state] * 4))
+        elapsed = time.perf_counter() - t0
+        self.assertEqual([r.response for r in results], ["reject"] * 4)
+        self.assertLess(elapsed, 0.15) # Bounded by the slowest responder, not 4 x 0.05s
+
+    def test_metrics_per_responder(self):
+        agents = [VotingAgent(name="A"), VotingAgent(name="B"), VotingAgent(name="C")]
+        state = self._run(agents, MultilateralProtocol(), max_steps=3, metrics=True)
+        histograms = state.metrics["histograms"]
+        self.assertEqual(histograms["respond.A"]["count"] + histograms["respond.B"]["count"] + histograms["respond.C"]["count"], 6)
+        self.assertEqual(histograms["step"]["count"], 3)
+
+    def test_responder_timeouts(self):
+        agents = [VotingAgent(name="A"), VotingAgent(name="B", accept_at=0), VotingAgent(name="C", accept_at=0, delay=1.0)]
+        # Abstaining (skip) counts as not accepting under unanimity
+        state = self._run(agents, MultilateralProtocol(), max_steps=2, call_timeout=0.02, timeout_policy="skip")
+        self.assertEqual((state.status, [r["responder"] for r in state.history]), ("timedout", ["B", "A"]))
+
+        state = self._run(agents, MultilateralProtocol(rule="quorum"), max_steps=2, call_timeout=0.02, timeout_policy="skip")
+        self.assertEqual((state.status, state.step), ("success", 0))
+
+        state = self._run(agents, MultilateralProtocol(), max_steps=2, call_timeout=0.02, timeout_policy="default", timeout_response="accept")
+        self.assertEqual((state.status, state.step), ("success", 0))
+
+        state = self._run(agents, MultilateralProtocol(), max_steps=2, call_timeout=0.02)
+        self.assertEqual(state.status, "broken")
+
+    def test_run_sync_rejects_multilateral(self):
+        config = NegotiationConfig(outcome_space=SPACE, max_steps=2, protocol=MultilateralProtocol())
+        with self.assertRaises(TypeError):
+            Runner(config=config, agents=[VotingAgent(name="A"), VotingAgent(name="B")]).run_sync()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,8 +1,13 @@
+import asyncio
 import unittest
 import time
-from manta.core.agent import BaseAgent, AgentState, AgentResult
+import numpy as np
+from manta.core.agent import BaseAgent, AgentState, AgentResult, FastAgentState, FastAgentResult, validate_result
+from manta.core.outcomes import OutcomeSpace, Issue
 from manta.negotiation.runner import Runner, NegotiationConfig
 
+SPACE = OutcomeSpace(issues=[Issue(name="price", type="continuous", min_value=0, max_value=200)])
+
 class DummyAgent(BaseAgent):
     def __init__(self, name, behavior="accept_immediately"):
         super().__init__(name)
@@ -98,5 +103,207 @@ class TestRunner(unittest.TestCase):
         
         self.assertEqual(runner.state.status, "broken")
 
+class SyncAgent(BaseAgent):
+    accept_at: int = -1 # Step from which offers are accepted (-1 = never)
+
+    def propose(self, state: AgentState) -> AgentResult:
+        return AgentResult(response="offer", proposal={"price": 100 + state.step})
+
+    def respond(self, state: AgentState) -> AgentResult:
+        if 0 <= self.accept_at <= state.step:
+            return AgentResult(response="accept")
+        return AgentResult(response="reject")
+
+class AsyncAgent(SyncAgent):
+    seen_states: list = []
+
+    async def propose(self, state: AgentState) -> AgentResult:
+        self.seen_states.append(id(state))
+        return SyncAgent.propose(self, state)
+
+    async def respond(self, state: AgentState) -> AgentResult:
+        return SyncAgent.respond(self, state)
+
+class TestTurboRunner(unittest.TestCase):
+
+    def _runner(self, agents, **config):
+        return Runner(config=NegotiationConfig(outcome_space=SPACE, **config), agents=agents)
+
+    def test_turbo_matches_default_loop(self):
+        results = []
+        for turbo in (False, True):
+            runner = self._runner([AsyncAgent(name="A"), AsyncAgent(name="B", accept_at=3)], max_steps=10, turbo=turbo)
+            state = asyncio.run(runner.run())
+            results.append((state.status, state.step, state.current_offer, state.history))
+        self.assertEqual(results[0], results[1])
+        self.assertEqual(results[1][:3], ("success", 4, {"price": 104}))
+
+    def test_turbo_reuses_agent_state(self):
+        agent = AsyncAgent(name="A", seen_states=[])
+        runner = self._runner([agent, AsyncAgent(name="B")], max_steps=6, turbo=True, yield_every=2)
+        state = asyncio.run(runner.run())
+        self.assertEqual(state.status, "timedout")
+        self.assertEqual(len(set(agent.seen_states)), 1)
+
+    def test_sync_fast_path(self):
+        runner = self._runner([SyncAgent(name="A"), SyncAgent(name="B")], max_steps=50, turbo=True)
+        state = asyncio.run(runner.run())
+        self.assertEqual((state.status, state.step, len(state.history)), ("timedout", 50, 50))
+
+        runner = self._runner([SyncAgent(name="A"), SyncAgent(name="B", accept_at=0)], max_steps=5)
+        self.assertEqual(runner.run_sync().status, "success")
+
+    def test_malformed_proposal_is_recorded(self):
+        class Haggler(SyncAgent):
+            def propose(self, state: AgentState) -> AgentResult:
+                return AgentResult(response="offer", proposal={"price": "cheap"})
+
+        runner = self._runner([Haggler(name="A"), SyncAgent(name="B")], max_steps=3)
+        state = asyncio.run(runner.run())
+        self.assertEqual((state.status, len(state.history)), ("timedout", 3))
+        self.assertEqual(state.history[0]["proposal"], {"price": "cheap"})
+        self.assertTrue(np.isnan(state.history.column("offers")[0]).all())
+
+    def test_run_keeps_sync_agents_on_the_event_loop(self):
+        runner = self._runner([SyncAgent(name="A"), SyncAgent(name="B")], max_steps=20, turbo=True, yield_every=1)
+        seen = []
+
+        async def scenario():
+            async def watch():
+                while True:
+                    seen.append(runner.state.step)
+                    await asyncio.sleep(0)
+            watcher = asyncio.ensure_future(watch())
+            await asyncio.sleep(0)
+            state = await runner.run()
+            watcher.cancel()
+            return state
+
+        state = asyncio.run(scenario())
+        self.assertEqual((state.status, state.step), ("timedout", 20))
+        self.assertTrue(any(0 < step < 20 for step in seen)) # Other tasks ran during the negotiation
+
+    def test_run_sync_rejects_async_agents(self):
+        runner = self._runner([AsyncAgent(name="A"), SyncAgent(name="B")], max_steps=5)
+        with self.assertRaises(TypeError):
+            runner.run_sync()
+
+class RecordingAgent(BaseAgent):
+    response: str = "reject"
+    seen_types: list = []
+
+    def propose(self, state: AgentState) -> AgentResult:
+        self.seen_types.append(type(state))
+        return FastAgentResult(response="offer", proposal={"price": 100 + state.step})
+
+    def respond(self, state: AgentState) -> AgentResult:
+        self.seen_types.append(type(state))
+        return FastAgentResult(response=self.response)
+
+class TestStrictMode(unittest.TestCase):
+
+    def _run(self, strict, response="reject"):
+        agents = [RecordingAgent(name="A", seen_types=[]), RecordingAgent(name="B", response=response, seen_types=[])]
+        config = NegotiationConfig(outcome_space=SPACE, max_steps=4, turbo=True, strict=strict)
+        return Runner(config=config, agents=agents).run_sync(), agents
+
+    def test_fast_objects_by_default(self):
+        state, agents = self._run(strict=False)
+        self.assertEqual((state.status, state.step), ("timedout", 4))
+        self.assertEqual(set(agents[0].seen_types), {FastAgentState})
+
+    def test_strict_validates_states_and_results(self):
+        state, agents = self._run(strict=True)
+        self.assertEqual((state.status, state.step), ("timedout", 4))
+        self.assertEqual(set(agents[0].seen_types), {AgentState})
+
+        # An invalid response breaks the negotiation before it is recorded, validation on or off
+        for strict in (True, False):
+            state, _ = self._run(strict=strict, response="maybe")
+            self.assertEqual((state.status, len(state.history)), ("broken", 0))
+
+    def test_fast_models_mirror_pydantic_models(self):
+        fast = FastAgentResult(response="offer", proposal=[{"price": 1.0}])
+        model = AgentResult(response="offer", proposal=[{"price": 1.0}])
+        self.assertEqual(fast.model_dump(), model.model_dump())
+        self.assertEqual(fast, model)
+        self.assertEqual(validate_result(fast), model)
+        self.assertEqual(FastAgentState(step=1, time=0.0, relative_time=0.5).validate(),
+                         AgentState(step=1, time=0.0, relative_time=0.5))
+        with self.assertRaises(ValueError):
+            validate_result(FastAgentResult(response="maybe"))
+
+class SlowAgent(BaseAgent):
+    propose_delay: float = 0.0
+    respond_delay: float = 0.0
+    accept_at: int = -1
+    errors: list = []
+    cancelled: list = []
+
+    async def _sleep(self, delay):
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            self.cancelled.append(delay)
+            raise
+
+    async def propose(self, state: AgentState) -> AgentResult:
+        await self._sleep(self.propose_delay)
+        return AgentResult(response="offer", proposal={"price": 100 + state.step})
+
+    async def respond(self, state: AgentState) -> AgentResult:
+        await self._sleep(self.respond_delay)
+        if 0 <= self.accept_at <= state.step:
+            return AgentResult(response="accept")
+        return AgentResult(response="reject")
+
+    def on_error(self, error_details: str) -> None:
+        self.errors.append(error_details)
+
+class TestCallTimeouts(unittest.TestCase):
+
+    def _run(self, agents, **config):
+        config = NegotiationConfig(outcome_space=SPACE, turbo=True, **config)
+        return asyncio.run(Runner(config=config, agents=agents).run())
+
+    def test_end_policy(self):
+        slow = SlowAgent(name="B", respond_delay=1.0, errors=[], cancelled=[])
+        t0 = time.perf_counter()
+        state = self._run([SlowAgent(name="A"), slow], max_steps=5, call_timeout=0.02)
+        self.assertLess(time.perf_counter() - t0, 0.5)
+        self.assertEqual(state.status, "broken")
+        self.assertEqual(slow.cancelled, [1.0]) # The in-flight call was cancelled
+        self.assertEqual(len(slow.errors), 1)
+        self.assertIn("respond timed out at step 0", slow.errors[0])
+
+    def test_skip_policy(self):
+        # A's proposals always time out: only B's turns produce records
+        slow = SlowAgent(name="A", propose_delay=1.0, errors=[], cancelled=[])
+        state = self._run([slow, SlowAgent(name="B")], max_steps=4, call_timeout=0.02, timeout_policy="skip")
+        self.assertEqual((state.status, state.step), ("timedout", 4))
+        self.assertEqual([r["proposer"] for r in state.history], ["B", "B"])
+        self.assertEqual(len(slow.errors), 2)
+
+    def test_default_policy(self):
+        slow = SlowAgent(name="B", respond_delay=1.0, errors=[], cancelled=[])
+        state = self._run([SlowAgent(name="A"), slow], max_steps=5, call_timeout=0.02,
+                          timeout_policy="default", timeout_response="accept")
+        self.assertEqual((state.status, state.step), ("success", 0))
+        self.assertEqual(state.history[0]["response"], "accept")
+
+    def test_negotiation_deadline_cancels_calls(self):
+        slow = SlowAgent(name="A", propose_delay=1.0, errors=[], cancelled=[])
+        t0 = time.perf_counter()
+        state = self._run([slow, SlowAgent(name="B")], time_limit=0.05, timeout_policy="skip")
+        self.assertLess(time.perf_counter() - t0, 0.5)
+        self.assertEqual(state.status, "timedout")
+        self.assertEqual(slow.cancelled, [1.0])
+        self.assertIn("negotiation deadline", slow.errors[0])
+
+    def test_fast_calls_unaffected(self):
+        agents = [SlowAgent(name="A"), SlowAgent(name="B", accept_at=3)]
+        state = self._run(agents, max_steps=10, call_timeout=1.0, time_limit=5.0)
+        self.assertEqual((state.status, state.step), ("success", 4))
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,116 @@
+import asyncio
+import unittest
+from manta.api.server import NegotiationServer, SessionConfig, ApiError
+from manta.api.client import NegotiationClient, ClientError
+
+SPACE = {"issues": [
+    {"name": "price", "type": "continuous", "min_value": 50, "max_value": 150},
+    {"name": "service", "type": "discrete", "values": ["standard", "premium", "enterprise"]},
+]}
+SELLER = {"name": "seller", "params": {"role": "seller", "personality": "boulware", "weights": {"price": 0.8, "service": 0.2}}}
+BUYER = {"name": "buyer", "params": {"role": "buyer", "weights": {"price": 0.8, "service": 0.2}}}
+
+def remote_session(**config):
+    return {"outcome_space": SPACE, "max_steps": 10, "agents": [{"name": "me", "type": "remote"}, SELLER], **config}
+
+class TestNegotiationServer(unittest.TestCase):
+
+    def test_local_sessions_run_concurrently(self):
+        async def scenario():
+            server = NegotiationServer(max_sessions=50)
+            config = SessionConfig.model_validate({"outcome_space": SPACE, "max_steps": 10, "agents": [BUYER, SELLER]})
+            sessions = [server.create_session(config) for _ in range(50)]
+            with self.assertRaises(ApiError) as ctx: # Backpressure: the server is full
+                server.create_session(config)
+            self.assertEqual(ctx.exception.status, 503)
+            await asyncio.gather(*(s.task for s in sessions))
+            await server.close()
+            return sessions, server.counters()
+
+        sessions, counters = asyncio.run(scenario())
+        self.assertEqual({s.status for s in sessions}, {"finished"})
+        self.assertEqual((counters["created"], counters["finished"], counters["rejected"]), (50, 50, 1))
+
+    def test_remote_agent_over_http(self):
+        async def scenario():
+            server = NegotiationServer(max_body=2048)
+            await server.serve(port=0)
+            async with NegotiationClient(port=server.port) as client:
+                session = await client.create_session(remote_session())
+                turns = []
+                turn = await client.turn(session["id"], wait=2.0)
+                while turn is not None:
+                    turns.append(turn)
+                    if turn["phase"] == "propose":
+                        await client.act(session["id"], "offer", {"price": 145.0, "service": "enterprise"})
+                    else:
+                        await client.act(session["id"], "reject")
+                    turn = await client.turn(session["id"], wait=2.0)
+                result = await client.session(session["id"])
+
+                errors = []
+                for call in (
+                    client.act(session["id"], "accept"), # Not our turn (the negotiation is over)
+                    client.act(session["id"], "maybe"), # Invalid response
+                    client.session("missing"),
+                    client.create_session(remote_session(padding="x" * 4096)), # Body over max_body
+                ):
+                    try:
+                        await call
+                    except ClientError as e:
+                        errors.append(e.status)
+            await server.close()
+            return turns, result, errors
+
+        turns, result, errors = asyncio.run(scenario())
+        # The seller accepts our (very good for it) first offer
+        self.assertEqual([t["phase"] for t in turns], ["propose"])
+        self.assertEqual((result["status"], result["negotiation"], result["current_offer"]),
+                         ("finished", "success", {"price": 145.0, "service": "enterprise"}))
+        self.assertEqual(result["last_record"]["responder"], "seller")
+        self.assertEqual(errors, [409, 422, 404, 413])
+
+    def test_invalid_content_length(self):
+        async def scenario():
+            server = NegotiationServer()
+            await server.serve(port=0)
+            replies = []
+            for length in ("abc", "-5"):
+                reader, writer = await asyncio.open_connection("127.0.0.1", server.port)
+                writer.write(f"POST /sessions HTTP/1.1\r\nContent-Length: {length}\r\n\r\n{{}}".encode())
+                await writer.drain()
+                replies.append(await reader.read())
+                writer.close()
+            await server.close()
+            return replies
+
+        for reply in asyncio.run(scenario()):
+            self.assertTrue(reply.startswith(b"HTTP/1.1 400 "))
+            self.assertIn(b"Invalid Content-Length", reply)
+
+    def test_idle_remote_agent_times_out(self):
+        async def scenario():
+            server = NegotiationServer()
+            session = server.create_session(SessionConfig.model_validate(remote_session(call_timeout=0.05)))
+            self.assertEqual((await server.wait_turn(session.id, wait=1.0))["phase"], "propose")
+            await session.task
+            self.assertIsNone(await server.wait_turn(session.id, wait=1.0))
+            return session
+
+        session = asyncio.run(scenario())
+        self.assertEqual((session.status, session.runner.state.status), ("finished", "broken"))
+
+    def test_cancel(self):
+        async def scenario():
+            server = NegotiationServer()
+            session = server.create_session(SessionConfig.model_validate(remote_session()))
+            await server.wait_turn(session.id, wait=1.0)
+            server.cancel(session.id)
+            await asyncio.gather(session.task, return_exceptions=True)
+            return session
+
+        session = asyncio.run(scenario())
+        self.assertEqual((session.status, session.runner.state.status), ("cancelled", "broken"))
+
+if __name__ == '__main__':
+    unittest.main()
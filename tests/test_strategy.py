@@ -0,0 +1,47 @@
+import unittest
+import numpy as np
+from manta.core.strategy import ConcessionStrategy, STYLE_BETAS, concession_targets, strategy_params, target_table
+
+STRATEGIES = [
+    ConcessionStrategy(style=style, start_utility=start, reservation_value=reservation)
+    for style in STYLE_BETAS
+    for start, reservation in ((1.0, 0.5), (0.95, 0.3), (0.4, 0.6)) # Last one: start below reservation
+]
+
+class TestVectorizedConcession(unittest.TestCase):
+
+    def test_array_api_matches_scalar(self):
+        progress = np.linspace(-0.5, 1.5, 41) # Includes out-of-range progress (clamped)
+        for strategy in STRATEGIES:
+            expected = [strategy.get_target(p) for p in progress.tolist()]
+            np.testing.assert_allclose(strategy.get_targets(progress), expected, rtol=0, atol=1e-15)
+
+    def test_population_in_one_call(self):
+        start, reservation, beta = strategy_params(STRATEGIES)
+        targets = concession_targets(0.3, start, reservation, beta)
+        self.assertEqual(targets.shape, (len(STRATEGIES),))
+        np.testing.assert_allclose(targets, [s.get_target(0.3) for s in STRATEGIES], rtol=0, atol=1e-15)
+
+        # Per-agent progress too
+        progress = np.linspace(0.0, 1.0, len(STRATEGIES))
+        np.testing.assert_allclose(concession_targets(progress, start, reservation, beta),
+                                   [s.get_target(p) for s, p in zip(STRATEGIES, progress.tolist())], rtol=0, atol=1e-15)
+
+    def test_target_table_and_lookup(self):
+        table = target_table(STRATEGIES, max_steps=10)
+        self.assertEqual(table.shape, (len(STRATEGIES), 11))
+        for row, strategy in zip(table, STRATEGIES):
+            np.testing.assert_allclose(row, [strategy.get_target(s / 10) for s in range(11)], rtol=0, atol=1e-15)
+
+        strategy = ConcessionStrategy(style="boulware", start_utility=0.95, reservation_value=0.5)
+        self.assertAlmostEqual(strategy.target_at(4, max_steps=10), strategy.get_target(0.4))
+        with self.assertRaises(ValueError):
+            strategy.target_at(4)
+        strategy.precompute(10)
+        self.assertAlmostEqual(strategy.target_at(4), strategy.get_target(0.4))
+        self.assertEqual(strategy.target_at(25), strategy.target_at(10)) # Past the end: final target
+        with self.assertRaises(ValueError):
+            target_table([strategy], 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,89 @@
+import unittest
+from manta.core.outcomes import OutcomeSpace, Issue
+from manta.agents.standard import StandardAgent
+from manta.negotiation.tournament import Tournament
+
+SPACE = OutcomeSpace(issues=[
+    Issue(name="price", type="continuous", min_value=50, max_value=150),
+    Issue(name="service", type="discrete", values=["standard", "premium", "enterprise"]),
+    Issue(name="duration", type="discrete", values=["1_year", "3_years"])
+])
+
+BUYERS = [
+    {"name": f"Buyer {p}", "weights": {"price": 0.6, "service": 0.3, "duration": 0.1}, "personality": p}
+    for p in ("boulware", "linear", "conceder")
+]
+SELLERS = [
+    {"name": f"Seller {p}", "weights": {"price": 0.7, "service": 0.2, "duration": 0.1}, "personality": p}
+    for p in ("boulware", "conceder")
+]
+
+EVENTS = []
+
+class TracingAgent(StandardAgent):
+    """Logs when each buyer's negotiation starts and ends."""
+    def on_negotiation_start(self, state):
+        super().on_negotiation_start(state)
+        if self.role == "buyer":
+            EVENTS.append(("start", self.name))
+
+    def on_negotiation_end(self, state):
+        super().on_negotiation_end(state)
+        if self.role == "buyer":
+            EVENTS.append(("end", self.name))
+
+class TestTournament(unittest.TestCase):
+
+    def test_in_process_grid(self):
+        summary = Tournament(buyer_configs=BUYERS, seller_configs=SELLERS, outcome_space=SPACE, workers=0).run()
+
+        self.assertEqual(len(summary.results), 6)
+        self.assertEqual(sorted((r.buyer_idx, r.seller_idx) for r in summary.results),
+                         [(b, s) for b in range(3) for s in range(2)])
+        self.assertEqual(sum(s.matches for s in summary.buyers), 6)
+        self.assertEqual([s.matches for s in summary.sellers], [3, 3])
+        for result in summary.results:
+            self.assertNotEqual(result.status, "error", result.error)
+            if result.status == "success":
+                self.assertIsNotNone(result.buyer_utility)
+                self.assertAlmostEqual(result.buyer_gain, (result.buyer_utility - 0.5) / 0.5) # Default reservation_val
+
+    def test_winner_compares_normalized_gains(self):
+        from manta.negotiation.tournament import MatchResult
+        # More utility for the buyer (0.95 vs 0.36), but barely above its 0.93 reservation value
+        result = MatchResult(buyer_idx=0, seller_idx=0, status="success", buyer_utility=0.95, seller_utility=0.36,
+                             buyer_gain=(0.95 - 0.93) / 0.07, seller_gain=0.36)
+        self.assertEqual(result.winner, "seller")
+        self.assertIsNone(MatchResult(buyer_idx=0, seller_idx=0, status="timedout").winner)
+
+    def test_process_pool_matches_in_process(self):
+        kwargs = dict(buyer_configs=BUYERS, seller_configs=SELLERS, outcome_space=SPACE, repetitions=2)
+        local = Tournament(workers=0, **kwargs).run()
+        pooled = Tournament(workers=2, shard_size=3, **kwargs).run()
+
+        key = lambda r: (r.repetition, r.buyer_idx, r.seller_idx)
+        self.assertEqual(
+            [(key(r), r.status, r.steps) for r in sorted(local.results, key=key)],
+            [(key(r), r.status, r.steps) for r in sorted(pooled.results, key=key)],
+        )
+        self.assertEqual(local.agreement_rate, pooled.agreement_rate)
+
+    def test_shard_matches_interleave(self):
+        tough_seller = dict(SELLERS[0], reservation_val=0.95) # Several steps per match
+        kwargs = dict(buyer_configs=BUYERS, seller_configs=[tough_seller], outcome_space=SPACE, agent_class=TracingAgent,
+                      workers=0, shard_size=3, max_steps=20)
+        del EVENTS[:]
+        Tournament(**kwargs).run()
+        self.assertEqual([kind for kind, _ in EVENTS], ["start"] * 3 + ["end"] * 3)
+
+        del EVENTS[:]
+        Tournament(yield_every=None, **kwargs).run() # One match after the other
+        self.assertEqual([kind for kind, _ in EVENTS], ["start", "end"] * 3)
+
+    def test_bad_config_reports_error(self):
+        summary = Tournament(buyer_configs=[{"weights": "oops"}], seller_configs=SELLERS[:1],
+                             outcome_space=SPACE, workers=0).run()
+        self.assertEqual(summary.results[0].status, "error")
+
+if __name__ == '__main__':
+    unittest.main()
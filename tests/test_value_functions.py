@@ -0,0 +1,91 @@
+import unittest
+import numpy as np
+from manta.core.outcomes import OutcomeSpace, Issue
+from manta.core.preferences import (
+    LinearAdditiveUtility, DiscreteValueFunction, PiecewiseLinearValueFunction,
+    ExponentialValueFunction, SigmoidValueFunction, GaussianValueFunction
+)
+from manta.core.meso import generate_meso, get_iso_index
+
+CURVES = {
+    "piecewise": PiecewiseLinearValueFunction([(0, 0.0), (40, 0.8), (100, 1.0)]),
+    "concave": ExponentialValueFunction(0, 100, rate=3.0),
+    "convex_cost": ExponentialValueFunction(0, 100, rate=-2.0, invert=True),
+    "sigmoid": SigmoidValueFunction(midpoint=50, steepness=-0.1),
+    "gaussian": GaussianValueFunction(mean=30, std=15),
+}
+
+class TestValueFunctions(unittest.TestCase):
+
+    def test_evaluate_matches_scalar_calls(self):
+        xs = np.linspace(-20, 120, 57)
+        for name, function in CURVES.items():
+            with self.subTest(name):
+                np.testing.assert_allclose(function.evaluate(xs), [function(x) for x in xs])
+                lo, hi = function.bounds(0, 100)
+                scores = function.evaluate(np.linspace(0, 100, 1001))
+                self.assertAlmostEqual(lo, scores.min(), places=6)
+                self.assertAlmostEqual(hi, scores.max(), places=6)
+
+    def test_inverse_round_trip(self):
+        for name, function in CURVES.items():
+            lo, hi = function.bounds(0, 100)
+            for v in np.linspace(lo, hi, 11):
+                with self.subTest(name, v=v):
+                    x = function.inverse(float(v), 0, 100)
+                    self.assertTrue(0 <= x <= 100)
+                    self.assertAlmostEqual(function(x), v, places=9)
+        self.assertIsNone(CURVES["concave"].inverse(1.5))
+        self.assertIsNone(CURVES["gaussian"].inverse(0.9, 50, 100)) # Both branches are below 50
+        self.assertEqual(GaussianValueFunction(50, 10).inverse(1.0), 50.0)
+
+    def test_discrete_table(self):
+        table = DiscreteValueFunction({"standard": 0.0, "premium": 0.6, "enterprise": 1.0}, default=0.1)
+        self.assertEqual((table("premium"), table("gold"), table(["unhashable"])), (0.6, 0.1, 0.1))
+        np.testing.assert_allclose(table.evaluate(["enterprise", "standard"]), [1.0, 0.0])
+        self.assertEqual(table.inverse(0.6), "premium")
+        self.assertEqual(table.bounds(), (0.0, 1.0))
+
+class TestUtilityWithValueFunctions(unittest.TestCase):
+
+    def setUp(self):
+        self.space = OutcomeSpace(issues=[
+            Issue(name="price", type="continuous", min_value=0, max_value=100),
+            Issue(name="lead_time", type="continuous", min_value=0, max_value=100),
+            Issue(name="volume", type="continuous", min_value=0, max_value=100),
+            Issue(name="service", type="discrete", values=["standard", "premium", "enterprise"]),
+        ])
+        self.utility = LinearAdditiveUtility(
+            {"price": 0.4, "lead_time": 0.2, "volume": 0.2, "service": 0.2},
+            {
+                "price": CURVES["convex_cost"],
+                "lead_time": CURVES["sigmoid"],
+                "volume": CURVES["gaussian"],
+                "service": DiscreteValueFunction({"standard": 0.0, "premium": 0.6, "enterprise": 1.0}),
+            },
+            outcome_space=self.space,
+            bias=0.05,
+        )
+
+    def test_batch_matches_calculate(self):
+        rng = np.random.default_rng(0)
+        encoded = np.column_stack([rng.uniform(0, 100, (200, 3)), rng.integers(0, 3, 200)])
+        outcomes = self.space.compile().decode_batch(encoded)
+        np.testing.assert_allclose(self.utility.calculate_batch(encoded), [self.utility(o) for o in outcomes])
+        self.assertAlmostEqual(self.utility({"service": "premium"}), 0.05 + 0.2 * 0.6)
+
+    def test_meso_back_solves_the_curves(self):
+        self.assertTrue(get_iso_index(self.utility, self.space).supported)
+        for rng in (None, 5):
+            offers = generate_meso(self.utility, self.space, 0.6, tolerance=1e-9, max_offers=3, rng=rng)
+            self.assertEqual(len(offers), 3)
+            for offer in offers:
+                self.assertAlmostEqual(self.utility(offer), 0.6, places=9)
+                self.assertTrue(self.space.is_valid(offer))
+
+    def test_discrete_table_on_continuous_issue_is_unsupported(self):
+        self.utility.add_value_function("volume", 0.2, DiscreteValueFunction({10.0: 1.0}))
+        self.assertFalse(get_iso_index(self.utility, self.space).supported)
+
+if __name__ == '__main__':
+    unittest.main()